@@ -1,5 +1,5 @@
+import logging
 import sys
-import time
 
 from PyQt6.QtCore import QPoint, Qt, QTimer
 from PyQt6.QtGui import QAction, QKeySequence
@@ -12,11 +12,13 @@ from src.services.app_state_service import (AppStateService, AppState, WindowSta
                                             FurnitureItemState)
 from src.services.background_service import BackgroundService
 from src.services.html_export_service import HtmlExportService
+from src.services.image_service import ImageService
 from src.services.pdf_export_service import PdfExportService
 from src.services.supabase_client import SupabaseClient
 from src.ui.canvas import Canvas
 from src.ui.panels.bottom_panel import BottomPanel
 from src.ui.panels.explorer_panel import ExplorerPanel
+from src.ui.styles import APP_STYLESHEET
 from src.ui.widgets import FurnitureItem
 
 
@@ -270,10 +272,8 @@ class MainWindow(QMainWindow):
             # 탐색 패널의 모든 스레드 정리
             if hasattr(self.explorer_panel, 'furniture_model'):
                 print("[애플리케이션] ExplorerPanel 스레드 정리 중...")
-                self.explorer_panel.furniture_model.clear_furniture()
+                self.explorer_panel.furniture_model.shutdown()
             
-            # 잠시 대기하여 스레드들이 정리될 시간을 줍니다
-            time.sleep(0.1)
             print("[애플리케이션] 스레드 정리 완료")
             
         except Exception as e:
@@ -419,6 +419,13 @@ class MainWindow(QMainWindow):
             import traceback
             traceback.print_exc()
     
+    @property
+    def furniture_by_id(self):
+        """탐색 패널에 로드된 가구를 ID로 조회하는 딕셔너리를 반환합니다."""
+        if hasattr(self.explorer_panel, 'furniture_model'):
+            return self.explorer_panel.furniture_model.furniture_by_id
+        return {}
+    
     def restore_furniture_items(self, furniture_items_state):
         """가구 아이템들을 복원합니다."""
         try:
@@ -434,19 +441,31 @@ class MainWindow(QMainWindow):
                 return
             
             # 탐색 패널에서 이미 로드된 가구 데이터 활용
-            furniture_dict = {}
-            if hasattr(self.explorer_panel, 'furniture_model') and self.explorer_panel.furniture_model.furniture_items:
+            furniture_dict = self.furniture_by_id
+            if furniture_dict:
                 # 캐시된 데이터 사용
-                for furniture in self.explorer_panel.furniture_model.furniture_items:
-                    furniture_dict[furniture.id] = furniture
                 print(f"[MainWindow] 캐시된 가구 데이터 사용: {len(furniture_dict)}개")
             else:
                 # 캐시가 없으면 Supabase에서 조회
-                supabase = SupabaseClient()
+                supabase = SupabaseClient.get_instance()
                 all_furniture = supabase.get_furniture_list()
                 furniture_dict = {furniture_data["id"]: Furniture(**furniture_data) for furniture_data in all_furniture}
                 print(f"[MainWindow] Supabase에서 가구 데이터 조회: {len(furniture_dict)}개")
             
+            # 원본 이미지를 백그라운드에서 병렬로 받아 캐시한 뒤 아이템 생성 (아이템마다 순서대로 다운로드하지 않도록)
+            self.canvas.load_items_after_prefetch([
+                furniture_dict[item_state.furniture_id].image_filename
+                for item_state in furniture_items_state if item_state.furniture_id in furniture_dict
+            ], lambda: self._build_restored_items(furniture_items_state, furniture_dict))
+            
+        except Exception as e:
+            print(f"[MainWindow] 가구 아이템 복원 중 오류: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    def _build_restored_items(self, furniture_items_state, furniture_dict):
+        """저장된 상태로 가구 아이템들을 생성합니다. (원본 이미지를 미리 받은 뒤 호출됨)"""
+        try:
             # z_order 순으로 정렬하여 복원
             sorted_items = sorted(furniture_items_state, key=lambda x: x.z_order)
             restored_count = 0
@@ -566,8 +585,7 @@ class MainWindow(QMainWindow):
                 app_state_cleared = self.app_state_service.clear_app_state()
                 
                 # 이미지 캐시 삭제 (ImageService를 통해)
-                from src.services.image_service import ImageService
-                image_service = ImageService()
+                image_service = ImageService.get_instance()
                 image_service.clear_cache()
                 
                 if app_state_cleared:
@@ -640,8 +658,11 @@ class MainWindow(QMainWindow):
         )
 
 def main():
+    # 기본은 경고 이상만 출력 (디버그 로그는 레벨을 낮춰 확인)
+    logging.basicConfig(level=logging.WARNING)
     app = QApplication(sys.argv)
     app.setApplicationName("Living Collage Maker")
+    app.setStyleSheet(APP_STYLESHEET)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -1,6 +1,10 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
+# 표 등에 표시할 설명 요약의 최대 길이
+DESCRIPTION_SUMMARY_LENGTH = 50
+
 
 @dataclass
 class Furniture:
@@ -25,6 +29,51 @@ class Furniture:
     author: str = ''
     created_at: str = ''
     
+    @cached_property
+    def search_text(self) -> str:
+        """검색 필터용 소문자 텍스트 (이름, 브랜드, 설명)를 반환합니다. 최초 접근 시 한 번만 계산됩니다."""
+        return f"{self.name}\n{self.brand}\n{self.description or ''}".lower()
+    
+    @cached_property
+    def mime_payload(self) -> bytes:
+        """드래그 앤 드롭 시 전달할 가구 ID 데이터를 반환합니다. 최초 접근 시 한 번만 인코딩됩니다."""
+        return str(self.id).encode('utf-8')
+    
+    @cached_property
+    def price_text(self) -> str:
+        """표시용 가격 문자열(예: ₩12,000)을 반환합니다. 최초 접근 시 한 번만 포맷팅됩니다."""
+        return f"₩{self.price:,}"
+    
+    @cached_property
+    def locations_text(self) -> str:
+        """표시용 위치 문자열(쉼표로 구분)을 반환합니다. 최초 접근 시 한 번만 만들어집니다."""
+        return ", ".join(self.locations)
+    
+    @cached_property
+    def styles_text(self) -> str:
+        """표시용 스타일 문자열(쉼표로 구분)을 반환합니다. 최초 접근 시 한 번만 만들어집니다."""
+        return ", ".join(self.styles)
+    
+    @cached_property
+    def size_text(self) -> str:
+        """표시용 크기 문자열(예: 60×50×80mm)을 반환합니다. 크기 정보가 없으면 빈 문자열을 반환합니다."""
+        if self.width and self.depth and self.height:
+            return f"{self.width}×{self.depth}×{self.height}mm"
+        return ""
+    
+    @cached_property
+    def seat_height_text(self) -> str:
+        """표시용 좌석 높이 문자열(예: 45mm)을 반환합니다. 좌석 높이가 없으면 빈 문자열을 반환합니다."""
+        return f"{self.seat_height}mm" if self.seat_height else ""
+    
+    @cached_property
+    def description_summary(self) -> str:
+        """표시용 설명 요약(DESCRIPTION_SUMMARY_LENGTH자까지)을 반환합니다. 최초 접근 시 한 번만 만들어집니다."""
+        description = self.description or ""
+        if len(description) > DESCRIPTION_SUMMARY_LENGTH:
+            return description[:DESCRIPTION_SUMMARY_LENGTH] + "..."
+        return description
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Furniture':
         """딕셔너리에서 Furniture 객체를 생성합니다."""
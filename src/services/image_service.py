@@ -1,15 +1,34 @@
 import os
 import threading
-import weakref
 import shutil
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
-from PyQt6.QtCore import QBuffer, QIODevice, Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QSaveFile, QSize, Qt
+from PyQt6.QtGui import QImageReader, QPixmap
 from platformdirs import user_cache_dir
 
 
 class ImageService:
+    # 인스턴스 간에 공유되는 디코딩된 원본 이미지 LRU 캐시 (정규화된 파일명 -> QPixmap)
+    # 탐색 패널에서 미리 디코딩한 이미지를 캔버스 드롭 시 재사용하기 위함
+    DECODED_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+    _decoded_cache = OrderedDict()
+    _decoded_cache_bytes = 0
+    _decoded_cache_lock = threading.Lock()
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(cls):
+        """앱 전체에서 공유하는 ImageService를 반환합니다. (최초 호출 시 생성)"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
         # 크로스플랫폼 캐시 디렉토리 설정
         # Windows: C:\Users\Username\AppData\Local\LivingCollageMaker\Cache
@@ -17,8 +36,6 @@ class ImageService:
         # Linux: ~/.cache/LivingCollageMaker
         self.cache_dir = user_cache_dir("LivingCollageMaker", "LivingCollageMaker")
         os.makedirs(self.cache_dir, exist_ok=True)
-        self.memory_cache = weakref.WeakValueDictionary()  # 약한 참조를 사용한 메모리 캐시
-        self.cache_lock = threading.Lock()  # 스레드 안전성을 위한 락
         self.executor = ThreadPoolExecutor(max_workers=4)  # 이미지 로딩을 위한 스레드 풀
         self._cleanup_timer = None
     
@@ -33,8 +50,61 @@ class ImageService:
         """이미지가 캐시되어 있는지 확인합니다."""
         return os.path.exists(self.get_cached_image_path(image_filename))
     
-    def download_and_cache_image(self, image_data, image_filename):
-        """이미지를 다운로드하고 캐시합니다."""
+    @classmethod
+    def _lookup_decoded(cls, normalized_filename):
+        """공유 LRU 캐시에서 디코딩된 pixmap을 찾아 최근 사용으로 표시합니다. 없으면 None을 반환합니다."""
+        with cls._decoded_cache_lock:
+            entry = cls._decoded_cache.get(normalized_filename)
+            if entry is None:
+                return None
+            cls._decoded_cache.move_to_end(normalized_filename)
+            return entry[0]
+    
+    @classmethod
+    def _remember_decoded(cls, normalized_filename, pixmap):
+        """디코딩된 pixmap을 공유 LRU 캐시에 저장하고 용량을 초과하면 오래된 항목부터 제거합니다."""
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        if cost > cls.DECODED_CACHE_MAX_BYTES:
+            return
+        
+        with cls._decoded_cache_lock:
+            previous = cls._decoded_cache.pop(normalized_filename, None)
+            if previous is not None:
+                cls._decoded_cache_bytes -= previous[1]
+            cls._decoded_cache[normalized_filename] = (pixmap, cost)
+            cls._decoded_cache_bytes += cost
+            
+            while cls._decoded_cache_bytes > cls.DECODED_CACHE_MAX_BYTES:
+                _, (_, evicted_cost) = cls._decoded_cache.popitem(last=False)
+                cls._decoded_cache_bytes -= evicted_cost
+    
+    def get_cached_pixmap(self, image_filename):
+        """다운로드 없이 사용할 수 있는 디코딩된 이미지를 반환합니다. 없으면 None을 반환합니다.
+        
+        공유 메모리 캐시를 먼저 확인하고, 없으면 디스크 캐시를 디코딩하여 메모리 캐시에 올립니다.
+        """
+        cache_path = self.get_cached_image_path(image_filename)
+        normalized_filename = os.path.basename(cache_path)
+        
+        pixmap = self._lookup_decoded(normalized_filename)
+        if pixmap is not None:
+            return pixmap
+        
+        if not os.path.exists(cache_path):
+            return None
+        
+        pixmap = QPixmap(cache_path)
+        if pixmap.isNull():
+            return None
+        
+        self._remember_decoded(normalized_filename, pixmap)
+        return pixmap
+    
+    def download_and_cache_image(self, image_data, image_filename, max_size=1920):
+        """이미지를 다운로드하고 캐시합니다.
+        
+        max_size보다 큰 이미지는 축소한 뒤 디스크에 저장합니다.
+        """
         if not image_data:
             return QPixmap()
 
@@ -43,31 +113,27 @@ class ImageService:
         
         try:
             # 메모리 캐시 확인
-            with self.cache_lock:
-                if normalized_filename in self.memory_cache:
-                    return self.memory_cache[normalized_filename]
+            pixmap = self._lookup_decoded(normalized_filename)
+            if pixmap is not None:
+                return pixmap
             
             # 디스크 캐시 확인
             # is_image_cached는 내부적으로 get_cached_image_path를 호출하므로 image_filename 원본을 넘겨도 됨
             if self.is_image_cached(image_filename): 
                 pixmap = QPixmap(cache_path)
                 if not pixmap.isNull():
-                    with self.cache_lock:
-                        self.memory_cache[normalized_filename] = pixmap # 정규화된 파일명으로 저장
+                    self._remember_decoded(normalized_filename, pixmap)
                     return pixmap
             
-            # 캐시된 이미지가 없으면 다운로드하고 캐시
-            pixmap = QPixmap()
-            if not pixmap.loadFromData(image_data):
+            # 캐시된 이미지가 없으면 max_size 이하로 디코딩하여 캐시
+            optimized_pixmap = self.decode_image(image_data, max_size)
+            if optimized_pixmap.isNull():
                 return QPixmap()
             
-            optimized_pixmap = self.optimize_image(pixmap)
-            
-            if not optimized_pixmap.save(cache_path, "PNG", quality=85):
+            if not self._save_to_disk_cache(optimized_pixmap, cache_path):
                 print(f"[오류] 이미지 저장 실패: {normalized_filename}")
             
-            with self.cache_lock:
-                self.memory_cache[normalized_filename] = optimized_pixmap
+            self._remember_decoded(normalized_filename, optimized_pixmap)
             
             return optimized_pixmap
             
@@ -75,20 +141,40 @@ class ImageService:
             print(f"[오류] 이미지 처리 중 예외 발생: {e}")
             return QPixmap()
     
-    def optimize_image(self, pixmap):
-        """이미지 크기를 최적화합니다."""
-        if pixmap.isNull():
-            return pixmap
-            
-        # 이미지가 너무 큰 경우 크기 조정
-        max_size = 1920  # 최대 크기
-        if pixmap.width() > max_size or pixmap.height() > max_size:
-            return pixmap.scaled(
-                max_size, max_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        return pixmap
+    def _save_to_disk_cache(self, pixmap, cache_path):
+        """이미지를 디스크 캐시에 원자적으로 저장합니다.
+        
+        임시 파일에 모두 쓴 뒤 교체하므로 저장 도중 종료되어도 손상된 캐시 파일이 남지 않습니다.
+        """
+        save_file = QSaveFile(cache_path)
+        if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+            return False
+        if not pixmap.save(save_file, "PNG", quality=85):
+            save_file.cancelWriting()
+            save_file.commit()
+            return False
+        return save_file.commit()
+    
+    def decode_image(self, image_data, max_size=1920):
+        """이미지 데이터를 max_size 이하 크기로 디코딩합니다.
+        
+        원본을 전체 해상도로 디코딩한 뒤 축소하지 않고, QImageReader에 목표 크기를 지정하여
+        디코더가 처음부터 작은 크기로 읽도록 합니다. (JPEG은 디코딩 단계에서 바로 축소됨)
+        """
+        buffer = QBuffer()
+        buffer.setData(QByteArray(bytes(image_data)))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        
+        reader = QImageReader(buffer)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid() and (source_size.width() > max_size or source_size.height() > max_size):
+            reader.setScaledSize(source_size.scaled(max_size, max_size, Qt.AspectRatioMode.KeepAspectRatio))
+        
+        image = reader.read()
+        if image.isNull():
+            return QPixmap()
+        return QPixmap.fromImage(image)
     
     def create_thumbnail(self, pixmap, size):
         """썸네일을 생성합니다."""
@@ -97,36 +183,40 @@ class ImageService:
         
         # size가 튜플인 경우 언패킹하여 사용
         if isinstance(size, tuple) and len(size) == 2:
-            width, height = size
-            return pixmap.scaled(
-                width, height,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.FastTransformation
-            )
+            target_size = QSize(*size)
         # size가 QSize 객체인 경우
         elif hasattr(size, 'width') and hasattr(size, 'height'):
-            return pixmap.scaled(
-                size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.FastTransformation
-            )
+            target_size = QSize(size.width(), size.height())
         else:
             # size가 단일 값인 경우 정사각형으로 처리
-            return pixmap.scaled(
-                size, size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.FastTransformation
-            )
+            target_size = QSize(size, size)
+        
+        # 서버에서 이미 썸네일 크기로 변환된 이미지는 다시 리샘플링하지 않음
+        if pixmap.size().scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio) == pixmap.size():
+            return pixmap
+        
+        return pixmap.scaled(
+            target_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
     
     def clear_cache(self):
-        """캐시를 모두 삭제합니다."""
-        with self.cache_lock:
-            self.memory_cache.clear()
+        """이미지 캐시를 모두 삭제합니다.
+        
+        캐시 폴더 바로 아래의 이미지 파일만 삭제하며, 하위 폴더(가구 목록 캐시 등)는 건드리지 않습니다.
+        """
+        with self._decoded_cache_lock:
+            ImageService._decoded_cache.clear()
+            ImageService._decoded_cache_bytes = 0
         
         if os.path.exists(self.cache_dir):
             for file in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, file)
+                if not os.path.isfile(path):
+                    continue
                 try:
-                    os.remove(os.path.join(self.cache_dir, file))
+                    os.remove(path)
                 except Exception as e:
                     print(f"[오류] 캐시 파일 삭제 실패: {e}")
             print("[캐시] 모든 캐시 파일이 삭제되었습니다.")
@@ -1,12 +1,37 @@
+import json
 import os
+import tempfile
+import threading
 import time
+from contextlib import contextmanager
 from functools import lru_cache
 
 from dotenv import load_dotenv
+from platformdirs import user_cache_dir
 from supabase import Client, create_client
 
+FURNITURE_COLUMNS = "id,name,brand,type,price,image_filename,description,link,color,locations,styles,width,depth,height,seat_height,author,created_at"
+# 탐색 패널 목록 조회 컬럼 (캔버스 배치/내보내기에 쓰는 링크, 크기, 작성자까지 포함하여 드롭 시 추가 조회가 없도록 함)
+FURNITURE_LIST_COLUMNS = ("id,name,brand,type,price,image_filename,description,link,color,locations,styles,"
+                          "width,depth,height,seat_height,author")
+
 
 class SupabaseClient:
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(cls):
+        """앱 전체에서 공유하는 클라이언트를 반환합니다. (최초 호출 시 생성)
+        
+        HTTP 연결과 이미지 메모리 캐시를 패널/위젯 간에 재사용하기 위함입니다.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
         load_dotenv()
         self.url = os.getenv("SUPABASE_URL")
@@ -24,31 +49,136 @@ class SupabaseClient:
         self._image_cache = {}
         self._image_cache_time = {}
         self._cache_duration = 3600  # 1시간
+        # 같은 이미지를 여러 스레드가 동시에 요청하면 한 번만 다운로드하도록 이미지별 잠금 사용
+        # (캐시 키 -> [잠금, 사용 중인 스레드 수], 사용하는 스레드가 없으면 제거)
+        self._image_locks = {}
+        self._image_locks_guard = threading.Lock()
+        
+        # 마지막으로 조회한 가구 목록의 디스크 캐시 (앱 시작 시 네트워크 대기 없이 표시)
+        # 이미지 캐시 삭제(ImageService.clear_cache)에 함께 지워지지 않도록 별도 하위 폴더에 저장
+        self.furniture_cache_path = os.path.join(
+            user_cache_dir("LivingCollageMaker", "LivingCollageMaker"), "furniture_list", "furniture.json"
+        )
     
     @lru_cache(maxsize=100)
     def get_furniture_list(self):
         """가구 목록을 가져옵니다. (lru_cache 적용)"""
-        response = self.client.table("furniture").select(
-            "id,name,brand,type,price,image_filename,description,link,color,locations,styles,width,depth,height,seat_height,author,created_at"
-        ).execute()
+        response = self.client.table("furniture").select(FURNITURE_COLUMNS).execute()
         return response.data
     
-    def get_furniture_image(self, filename: str):
-        """가구 이미지를 가져옵니다. (메모리 캐시 적용)"""
-        current_time = time.time()
+    def fetch_furniture_list(self):
+        """탐색 패널용 가구 목록을 서버에서 새로 조회하고 디스크 캐시에 저장합니다.
+        
+        목록에 필요한 컬럼만 조회합니다.
+        """
+        response = self.client.table("furniture").select(FURNITURE_LIST_COLUMNS).execute()
+        data = response.data or []
+        self._write_furniture_cache(data)
+        return data
+    
+    def get_cached_furniture_list(self, max_age=None):
+        """디스크에 캐시된 가구 목록을 반환합니다.
+        
+        캐시가 없거나 읽을 수 없으면, 또는 max_age(초)보다 오래되었으면 None을 반환합니다.
+        """
+        try:
+            if max_age is not None and time.time() - os.path.getmtime(self.furniture_cache_path) > max_age:
+                return None
+            with open(self.furniture_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, list) else None
+    
+    def get_furniture_cached(self, max_age=3600):
+        """캐시가 유효하면 디스크 캐시를, 아니면 서버에서 조회한 가구 목록을 반환합니다."""
+        data = self.get_cached_furniture_list(max_age=max_age)
+        if data is not None:
+            return data
+        return self.fetch_furniture_list()
+    
+    def _write_furniture_cache(self, data):
+        """가구 목록을 임시 파일에 쓴 뒤 교체하여 캐시 파일이 깨지지 않도록 저장합니다."""
+        cache_dir = os.path.dirname(self.furniture_cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.furniture_cache_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except Exception as e:
+            print(f"가구 목록 캐시 저장 중 오류 발생: {e}")
+    
+    def get_furniture_image(self, filename: str, width: int = None, height: int = None):
+        """가구 이미지를 가져옵니다. (메모리 캐시 적용)
+        
+        width와 height를 지정하면 Supabase Storage 이미지 변환으로 축소된 이미지를 받습니다.
+        변환 요청이 실패하면 원본 이미지를 받습니다.
+        """
+        cache_key = (filename, width, height) if width and height else filename
         
         # 캐시된 이미지가 있고 유효한 경우
-        if filename in self._image_cache:
-            cache_time = self._image_cache_time.get(filename, 0)
-            if current_time - cache_time < self._cache_duration:
-                return self._image_cache[filename]
+        cached = self._get_cached_image(cache_key)
+        if cached is not None:
+            return cached
         
+        # 같은 이미지를 다른 스레드가 다운로드 중이면 기다렸다가 그 결과를 사용
+        with self._image_lock(cache_key):
+            cached = self._get_cached_image(cache_key)
+            if cached is not None:
+                return cached
+            return self._download_image(cache_key, filename, width, height)
+    
+    def _get_cached_image(self, cache_key):
+        """유효 기간 내의 메모리 캐시 이미지를 반환합니다. 없으면 None을 반환합니다."""
+        if cache_key in self._image_cache:
+            cache_time = self._image_cache_time.get(cache_key, 0)
+            if time.time() - cache_time < self._cache_duration:
+                return self._image_cache[cache_key]
+        return None
+    
+    @contextmanager
+    def _image_lock(self, cache_key):
+        """이미지별 다운로드 잠금을 잡습니다. 마지막 사용자가 끝나면 잠금 항목을 제거합니다."""
+        with self._image_locks_guard:
+            entry = self._image_locks.setdefault(cache_key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._image_locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._image_locks[cache_key]
+    
+    def _download_image(self, cache_key, filename: str, width: int = None, height: int = None):
+        """Supabase Storage에서 이미지를 다운로드하여 메모리 캐시에 저장합니다."""
         try:
-            response = self.client.storage.from_("furniture-images").download(filename)
+            bucket = self.client.storage.from_("furniture-images")
+            response = None
+            if width and height:
+                try:
+                    response = bucket.download(filename, {
+                        "transform": {
+                            "width": width,
+                            "height": height,
+                            "resize": "contain",
+                            "quality": 80,
+                        }
+                    })
+                except Exception as e:
+                    print(f"이미지 변환 요청 실패, 원본을 다운로드합니다: {e}")
+            if not response:
+                response = bucket.download(filename)
             
             # 캐시 업데이트
-            self._image_cache[filename] = response
-            self._image_cache_time[filename] = current_time
+            self._image_cache[cache_key] = response
+            self._image_cache_time[cache_key] = time.time()
             
             return response
         except Exception as e:
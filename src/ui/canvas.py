@@ -1,25 +1,40 @@
 import base64
 import datetime
 import json
+import logging
 import os
 
 from PyQt6.QtCore import (QPoint, QRect, Qt, QTimer, QByteArray, QBuffer, QIODevice, QSize)
-from PyQt6.QtGui import (QPainter, QPixmap, QTransform, QGuiApplication, QPen, QBrush, QColor)
+from PyQt6.QtGui import (QPainter, QPixmap, QImage, QTransform, QGuiApplication, QPen, QBrush, QColor)
 from PyQt6.QtWidgets import (QFileDialog,
                              QMenu,
                              QMessageBox, QVBoxLayout,
                              QWidget, QRubberBand)
 
 from src.models.furniture import Furniture
+from src.services.image_service import ImageService
 from src.services.supabase_client import SupabaseClient
 from src.ui.dialogs import CanvasSizeDialog
+from src.ui.panels.common import FURNITURE_ID_MIME_TYPE, prefetch_full_images
 from src.ui.utils import ImageAdjuster
 from src.ui.widgets import FurnitureItem, CanvasArea
 
+logger = logging.getLogger(__name__)
+
 
 class Canvas(QWidget):
     CANVAS_MIN_HEIGHT = 200
     CANVAS_MIN_WIDTH = 300
+    # 캔버스 영역 스타일시트 (초기화와 새 콜라주 생성 시 같은 문자열을 재사용)
+    CANVAS_AREA_STYLESHEET = """
+        QWidget {
+            background-color: white;
+            border: 3px solid #2C3E50;
+            border-radius: 5px;
+            margin: 0px;
+            padding: 0px;
+        }
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -48,21 +63,14 @@ class Canvas(QWidget):
         # 캔버스 영역 (실제 가구가 배치되는 곳)
         self.canvas_area = CanvasArea(self)
         self.canvas_area.setMinimumSize(self.CANVAS_MIN_WIDTH, self.CANVAS_MIN_HEIGHT)
-        self.canvas_area.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border: 3px solid #2C3E50;
-                border-radius: 5px;
-                margin: 0px;
-                padding: 0px;
-            }
-        """)
+        self.canvas_area.setStyleSheet(self.CANVAS_AREA_STYLESHEET)
         
         # 레이아웃에 canvas_area 추가 (마진 없이)
         layout.addWidget(self.canvas_area)
         
         # 초기 상태 설정
         self.is_new_collage = True
+        self.is_loading_items = False  # 콜라주 아이템 이미지를 받는 중이면 True (입력과 중복 불러오기 차단)
         self.furniture_items = []
         self.selected_items = []  # 다중 선택을 위해 리스트로 변경
         
@@ -76,6 +84,9 @@ class Canvas(QWidget):
         self.background_image = None
         self.has_background = False
         
+        # 내보내기용 이미지 버퍼 (캔버스 크기가 같으면 재사용하여 매번 할당하지 않음)
+        self._export_buffer = None
+        
         # 우클릭 메뉴 활성화 (canvas_area에 대해)
         self.canvas_area.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.canvas_area.customContextMenuRequested.connect(self.show_context_menu)
@@ -141,7 +152,8 @@ class Canvas(QWidget):
         
         self.undo_stack.append(current_state)
         self.redo_stack.clear() # 새 액션 발생 시 Redo 스택 비움
-        print(f"[Undo/Redo] 상태 저장됨. Undo 스택 크기: {len(self.undo_stack)}, 최상단 아이템 수: {len(current_state['furniture_items'])}")
+        logger.debug("[Undo/Redo] 상태 저장됨. Undo 스택 크기: %d, 최상단 아이템 수: %d",
+                     len(self.undo_stack), len(current_state['furniture_items']))
     
     def canvas_mouse_press_event(self, event):
         """캔버스 영역에서 마우스 버튼을 눌렀을 때의 처리"""
@@ -423,8 +435,29 @@ class Canvas(QWidget):
             except Exception as e:
                 self._show_critical_message("오류", f"콜라주 저장 중 오류가 발생했습니다: {str(e)}")
     
+    def load_items_after_prefetch(self, image_filenames, build_items):
+        """원본 이미지를 백그라운드에서 받은 뒤 build_items를 호출해 아이템을 생성합니다.
+        
+        이미지를 받는 동안 캔버스 입력과 다른 콜라주 불러오기를 막습니다.
+        """
+        self.is_loading_items = True
+        self.canvas_area.setEnabled(False)
+        
+        def finish():
+            try:
+                build_items()
+            finally:
+                self.is_loading_items = False
+                self.canvas_area.setEnabled(True)
+        
+        prefetch_full_images(ImageService.get_instance(), SupabaseClient.get_instance(), image_filenames, finish, self)
+    
     def load_collage(self):
         """저장된 콜라주를 JSON 파일에서 불러옵니다."""
+        if self.is_loading_items:
+            # 이전 불러오기의 이미지를 아직 받는 중이면 무시
+            return
+        
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "콜라주 불러오기",
@@ -474,7 +507,7 @@ class Canvas(QWidget):
                 furniture_items_data = collage_data["furniture_items"]
                 
                 # Supabase 클라이언트 생성
-                supabase = SupabaseClient()
+                supabase = SupabaseClient.get_instance()
                 
                 # 모든 가구 데이터 가져오기
                 all_furniture = supabase.get_furniture_list()
@@ -484,97 +517,114 @@ class Canvas(QWidget):
                 for furniture_data in all_furniture:
                     furniture_dict[furniture_data["id"]] = furniture_data
                 
-                for item_data in sorted(furniture_items_data, key=lambda x: x["z_order"]):
-                    furniture_id = item_data["id"]
+                # 원본 이미지를 백그라운드에서 병렬로 받아 캐시한 뒤 아이템 생성 (아이템마다 순서대로 다운로드하지 않도록)
+                self.load_items_after_prefetch([
+                    furniture_dict[item_data["id"]]["image_filename"]
+                    for item_data in furniture_items_data if item_data["id"] in furniture_dict
+                ], lambda: self._build_collage_items(furniture_items_data, furniture_dict))
+                
+            except Exception as e:
+                import traceback
+                traceback.print_exc()  # 자세한 오류 정보 출력
+                self._show_critical_message("오류", f"콜라주 불러오기 중 오류가 발생했습니다: {str(e)}")
+            except FileNotFoundError as e:
+                self._show_critical_message("오류", f"콜라주 파일을 열 수 없습니다: {str(e)}")
+            except Exception as e: # 가장 마지막에 위치해야 하는 일반 예외 처리
+                import traceback
+                traceback.print_exc()  # 자세한 오류 정보 출력
+                self._show_critical_message("오류", f"콜라주 불러오기 중 예기치 않은 오류가 발생했습니다: {str(e)}")
+    
+    def _build_collage_items(self, furniture_items_data, furniture_dict):
+        """불러온 콜라주 데이터로 가구 아이템들을 생성합니다. (원본 이미지를 미리 받은 뒤 호출됨)"""
+        try:
+            for item_data in sorted(furniture_items_data, key=lambda x: x["z_order"]):
+                furniture_id = item_data["id"]
                     
-                    # 가구 ID로 데이터베이스에서 가구 정보 검색
-                    if furniture_id in furniture_dict:
-                        # 딕셔너리 데이터로 Furniture 객체 생성
-                        furniture_data = furniture_dict[furniture_id]
-                        furniture = Furniture(**furniture_data)
+                # 가구 ID로 데이터베이스에서 가구 정보 검색
+                if furniture_id in furniture_dict:
+                    # 딕셔너리 데이터로 Furniture 객체 생성
+                    furniture_data = furniture_dict[furniture_id]
+                    furniture = Furniture(**furniture_data)
                         
-                        # 가구 아이템 생성
-                        item = FurnitureItem(furniture, self.canvas_area)
+                    # 가구 아이템 생성
+                    item = FurnitureItem(furniture, self.canvas_area)
                         
-                        # 위치와 크기 설정
-                        item.move(QPoint(item_data["position"]["x"], item_data["position"]["y"]))
-                        item.setFixedSize(item_data["size"]["width"], item_data["size"]["height"])
+                    # 위치와 크기 설정
+                    item.move(QPoint(item_data["position"]["x"], item_data["position"]["y"]))
+                    item.setFixedSize(item_data["size"]["width"], item_data["size"]["height"])
                         
-                        # 좌우 반전 설정
-                        if item_data.get("is_flipped", False):
-                            transform = QTransform()
-                            transform.scale(-1, 1)  # x축 방향으로 -1을 곱하여 좌우 반전
-                            item.pixmap = item.pixmap.transformed(transform)
-                            item.is_flipped = True
+                    # 좌우 반전 설정
+                    if item_data.get("is_flipped", False):
+                        transform = QTransform()
+                        transform.scale(-1, 1)  # x축 방향으로 -1을 곱하여 좌우 반전
+                        item.pixmap = item.pixmap.transformed(transform)
+                        item.is_flipped = True
                         
-                        # 이미지 조정 설정
-                        if "image_adjustments" in item_data:
-                            adjustments = item_data["image_adjustments"]
-                            item.color_temp = adjustments.get("color_temp", 6500)
-                            item.brightness = adjustments.get("brightness", 100)
-                            item.saturation = adjustments.get("saturation", 100)
+                    # 이미지 조정 설정
+                    if "image_adjustments" in item_data:
+                        adjustments = item_data["image_adjustments"]
+                        item.color_temp = adjustments.get("color_temp", 6500)
+                        item.brightness = adjustments.get("brightness", 100)
+                        item.saturation = adjustments.get("saturation", 100)
                             
-                            # 이미지 효과 적용
-                            if (item.color_temp != 6500 or 
-                                item.brightness != 100 or 
-                                item.saturation != 100):
-                                # 로드 시에는 원본 이미지가 생성되어 있는지 확인
-                                if item.original_pixmap is None or item.original_pixmap.isNull():
-                                    item.original_pixmap = item.pixmap.copy()
-                                    print(f"[불러오기] 원본 이미지 복사: {furniture.name}")
+                        # 이미지 효과 적용
+                        if (item.color_temp != 6500 or 
+                            item.brightness != 100 or 
+                            item.saturation != 100):
+                            # 로드 시에는 원본 이미지가 생성되어 있는지 확인
+                            if item.original_pixmap is None or item.original_pixmap.isNull():
+                                item.original_pixmap = item.pixmap.copy()
+                                print(f"[불러오기] 원본 이미지 복사: {furniture.name}")
                                 
-                                # 불러오기 시 원본 이미지 사이즈 확인
-                                print(f"[불러오기] 이미지 크기: {item.original_pixmap.width()}x{item.original_pixmap.height()}")
+                            # 불러오기 시 원본 이미지 사이즈 확인
+                            print(f"[불러오기] 이미지 크기: {item.original_pixmap.width()}x{item.original_pixmap.height()}")
                                 
-                                # 미리보기 이미지 속성 설정
-                                item.preview_pixmap = item.original_pixmap.copy()
+                            # 미리보기 이미지 속성 설정
+                            item.preview_pixmap = item.original_pixmap.copy()
                                 
-                                # 이미지 효과 적용
-                                print(f"[불러오기] 이미지 효과 적용: 색온도={item.color_temp}K, 밝기={item.brightness}%, 채도={item.saturation}%")
-                                item.apply_image_effects(
-                                    item.color_temp, 
-                                    item.brightness, 
-                                    item.saturation
-                                )
+                            # 이미지 효과 적용
+                            print(f"[불러오기] 이미지 효과 적용: 색온도={item.color_temp}K, 밝기={item.brightness}%, 채도={item.saturation}%")
+                            item.apply_image_effects(
+                                item.color_temp, 
+                                item.brightness, 
+                                item.saturation
+                            )
                         
-                        # 번호표 설정 복원
-                        if "number_label" in item_data:
-                            number_label_data = item_data["number_label"]
-                            item.set_number_label(number_label_data.get("value", 0))
-                            if "position" in number_label_data:
-                                pos = QPoint(
-                                    number_label_data["position"]["x"],
-                                    number_label_data["position"]["y"]
-                                )
-                                item.set_number_label_position(pos)
+                    # 번호표 설정 복원
+                    if "number_label" in item_data:
+                        number_label_data = item_data["number_label"]
+                        item.set_number_label(number_label_data.get("value", 0))
+                        if "position" in number_label_data:
+                            pos = QPoint(
+                                number_label_data["position"]["x"],
+                                number_label_data["position"]["y"]
+                            )
+                            item.set_number_label_position(pos)
                             
-                        item.show()
-                        self.furniture_items.append(item)
-                    else:
-                        print(f"가구 ID를 찾을 수 없습니다: {furniture_id}")
-                        # QMessageBox.warning(self, "경고", f"콜라주에 포함된 가구(ID: {furniture_id})를 현재 데이터베이스에서 찾을 수 없습니다. 해당 아이템은 제외됩니다.")
-                        self._show_warning_message("경고", f"콜라주에 포함된 가구(ID: {furniture_id})를 현재 데이터베이스에서 찾을 수 없습니다. 해당 아이템은 제외됩니다.")
-                        # 누락된 아이템 정보 기록 또는 처리
-                        continue # 다음 아이템으로 넘어감
-                
-                # 하단 패널 업데이트
-                self.update_bottom_panel()
+                    item.show()
+                    self.furniture_items.append(item)
+                else:
+                    print(f"가구 ID를 찾을 수 없습니다: {furniture_id}")
+                    # QMessageBox.warning(self, "경고", f"콜라주에 포함된 가구(ID: {furniture_id})를 현재 데이터베이스에서 찾을 수 없습니다. 해당 아이템은 제외됩니다.")
+                    self._show_warning_message("경고", f"콜라주에 포함된 가구(ID: {furniture_id})를 현재 데이터베이스에서 찾을 수 없습니다. 해당 아이템은 제외됩니다.")
+                    # 누락된 아이템 정보 기록 또는 처리
+                    continue # 다음 아이템으로 넘어감
                 
-                self._show_information_message("성공", "콜라주가 성공적으로 불러와졌습니다.")
+            # 하단 패널 업데이트
+            self.update_bottom_panel()
                 
-            except Exception as e:
-                import traceback
-                traceback.print_exc()  # 자세한 오류 정보 출력
-                self._show_critical_message("오류", f"콜라주 불러오기 중 오류가 발생했습니다: {str(e)}")
-            except FileNotFoundError as e:
-                self._show_critical_message("오류", f"콜라주 파일을 열 수 없습니다: {str(e)}")
-            except Exception as e: # 가장 마지막에 위치해야 하는 일반 예외 처리
-                import traceback
-                traceback.print_exc()  # 자세한 오류 정보 출력
-                self._show_critical_message("오류", f"콜라주 불러오기 중 예기치 않은 오류가 발생했습니다: {str(e)}")
+            self._show_information_message("성공", "콜라주가 성공적으로 불러와졌습니다.")
+        except Exception as e:
+            import traceback
+            traceback.print_exc()  # 자세한 오류 정보 출력
+            self._show_critical_message("오류", f"콜라주 불러오기 중 오류가 발생했습니다: {str(e)}")
     
     def create_new_collage(self):
         """새 콜라주를 생성합니다. 앱을 완전히 초기화합니다."""
+        if self.is_loading_items:
+            # 불러오는 중인 아이템이 새 캔버스 대신 이전 캔버스 영역에 생기지 않도록 무시
+            return
+        
         dialog = CanvasSizeDialog(self)
         if dialog.exec():
             width, height = dialog.get_size()
@@ -612,15 +662,7 @@ class Canvas(QWidget):
             print(f"[새 콜라주] 최종 캔버스 크기: {self.canvas_area.width()}x{self.canvas_area.height()}")
             print(f"[새 콜라주] 최종 최소 크기: {self.canvas_area.minimumWidth()}x{self.canvas_area.minimumHeight()}")
             
-            self.canvas_area.setStyleSheet("""
-                QWidget {
-                    background-color: white;
-                     border: 3px solid #2C3E50;
-                    border-radius: 5px;
-                    margin: 0px;
-                    padding: 0px;
-                }
-            """)
+            self.canvas_area.setStyleSheet(self.CANVAS_AREA_STYLESHEET)
             
             # 3. 레이아웃에 새 캔버스 영역 추가
             layout = self.layout()
@@ -792,23 +834,34 @@ class Canvas(QWidget):
     
     def _generate_collage_image(self) -> QPixmap:
         """현재 콜라주를 QPixmap 이미지로 생성합니다."""
-        # 캔버스 영역의 크기로 이미지 생성
-        image = QPixmap(self.canvas_area.size())
+        # 캔버스 영역 크기의 이미지 버퍼 준비 (픽셀 버퍼에 직접 접근할 수 있도록 QImage 사용)
+        # 크기가 같으면 이전 내보내기에서 할당한 버퍼를 재사용
+        image = self._export_buffer
+        if image is None or image.size() != self.canvas_area.size():
+            image = QImage(self.canvas_area.size(), QImage.Format.Format_ARGB32_Premultiplied)
+            self._export_buffer = image
+        
+        has_background_image = (self.has_background and self.background_image
+                                and not self.background_image.isNull())
+        
+        # 재사용 버퍼에 남은 이전 내용을 지우고 흰색 배경으로 초기화 (NumPy 뷰로 버퍼를 한 번에 채움)
+        # 배경 이미지에 투명 영역이 있어도 이전 내보내기 결과가 비치지 않도록 항상 초기화
+        if ImageAdjuster._use_numpy:
+            ImageAdjuster.qimage_as_ndarray(image)[:] = 255
+        else:
+            image.fill(Qt.GlobalColor.white)
         
         # 이미지에 현재 콜라주 그리기
         painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 배경 이미지가 있으면 먼저 그리기
-        if self.has_background and self.background_image and not self.background_image.isNull():
+        if has_background_image:
             painter.drawPixmap(
                 image.rect(),
                 self.background_image,
                 self.background_image.rect()
             )
-        else:
-            # 배경 이미지가 없으면 흰색 배경
-            image.fill(Qt.GlobalColor.white)
         
         # 모든 가구 아이템 그리기
         for item in self.furniture_items:
@@ -819,24 +872,26 @@ class Canvas(QWidget):
             if item.pixmap is None or item.pixmap.isNull(): # Safety check
                 continue
 
-            final_pixmap_to_draw = None
             draw_pos_x = pos.x()
             draw_pos_y = pos.y()
+            keep_aspect_ratio = getattr(item, 'maintain_aspect_ratio', True)
 
-            if hasattr(item, 'maintain_aspect_ratio') and not item.maintain_aspect_ratio:
-                # User has stretched/squashed the item, ignore original pixmap aspect ratio
-                final_pixmap_to_draw = item.pixmap.scaled(
-                    widget_size,
-                    Qt.AspectRatioMode.IgnoreAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+            if item.pixmap.size() == widget_size:
+                # 크기가 같으면 리샘플링 없이 원본 pixmap을 그대로 사용
+                final_pixmap_to_draw = item.pixmap
+            elif hasattr(item, 'get_scaled_pixmap'):
+                # 화면 그리기에서 캐시한 스케일 결과 재사용 (같은 비율 모드/SmoothTransformation)
+                final_pixmap_to_draw = item.get_scaled_pixmap()
             else:
-                # Default or user wants to maintain original pixmap aspect ratio
+                aspect_mode = (Qt.AspectRatioMode.KeepAspectRatio if keep_aspect_ratio
+                               else Qt.AspectRatioMode.IgnoreAspectRatio)
                 final_pixmap_to_draw = item.pixmap.scaled(
                     widget_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
+                    aspect_mode,
                     Qt.TransformationMode.SmoothTransformation
                 )
+
+            if keep_aspect_ratio:
                 # Center the pixmap if KeepAspectRatio mode doesn't fill the widget_size
                 draw_pos_x += (widget_size.width() - final_pixmap_to_draw.width()) // 2
                 draw_pos_y += (widget_size.height() - final_pixmap_to_draw.height()) // 2
@@ -847,7 +902,7 @@ class Canvas(QWidget):
         self._draw_number_labels_on_image(painter)
         
         painter.end()
-        return image
+        return QPixmap.fromImage(image)
     
     def _draw_number_labels_on_image(self, painter):
         """이미지 내보내기용 번호표를 그립니다. (가구 내부 번호표 위젯 위치 기준)"""
@@ -892,14 +947,14 @@ class Canvas(QWidget):
 
     def dragEnterEvent(self, event):
         """드래그 진입 이벤트를 처리합니다."""
-        if event.mimeData().hasFormat("application/x-furniture"):
+        if not self.is_loading_items and event.mimeData().hasFormat(FURNITURE_ID_MIME_TYPE):
             event.acceptProposedAction()
         else:
             event.ignore()
     
     def dragMoveEvent(self, event):
         """드래그 이동 이벤트를 처리합니다."""
-        if event.mimeData().hasFormat("application/x-furniture"):
+        if event.mimeData().hasFormat(FURNITURE_ID_MIME_TYPE):
             event.acceptProposedAction()
         else:
             event.ignore()
@@ -907,10 +962,16 @@ class Canvas(QWidget):
     def dropEvent(self, event):
         """드롭 이벤트를 처리합니다."""
         try:
-            if event.mimeData().hasFormat("application/x-furniture"):
+            if event.mimeData().hasFormat(FURNITURE_ID_MIME_TYPE):
                 drop_pos = self.canvas_area.mapFrom(self, event.position().toPoint())
-                furniture_data = eval(event.mimeData().data("application/x-furniture").data().decode())
-                furniture = Furniture(**furniture_data)
+                furniture_id = bytes(event.mimeData().data(FURNITURE_ID_MIME_TYPE)).decode()
+                # 탐색 패널에 이미 로드된 Furniture 객체를 ID로 조회 (재구성하지 않음)
+                main_window = self.window()
+                furniture = getattr(main_window, 'furniture_by_id', {}).get(furniture_id)
+                if furniture is None:
+                    print(f"드롭된 가구를 찾을 수 없습니다: {furniture_id}")
+                    event.ignore()
+                    return
                 item = FurnitureItem(furniture, self.canvas_area)
                 # FurnitureItem의 item_changed 시그널을 Canvas의 상태 저장 메서드에 연결
                 item.item_changed.connect(self._save_state_and_update_actions)
@@ -929,11 +990,18 @@ class Canvas(QWidget):
     def adjust_furniture_positions(self, delta_x, delta_y):
         """캔버스 이동에 따라 모든 가구 아이템의 위치를 조정합니다."""
         # print(f"Adjusting furniture positions by dx={delta_x}, dy={delta_y}") # 디버깅용
+        dirty_rect = QRect()
         for item in self.furniture_items:
+            dirty_rect = dirty_rect.united(item.geometry())
             new_x = item.x() + delta_x
             new_y = item.y() + delta_y
             item.move(new_x, new_y)
+            dirty_rect = dirty_rect.united(item.geometry())
             # print(f"Moved {item.furniture.name} to ({new_x}, {new_y})") # 디버깅용
+        
+        # 이동 전/후 영역을 합친 범위만 한 번에 다시 그리도록 요청 (repaint 대신 update로 병합)
+        if not dirty_rect.isNull():
+            self.canvas_area.update(dirty_rect)
             
     def update_bottom_panel(self):
         """하단 패널을 업데이트합니다."""
@@ -986,7 +1054,7 @@ class Canvas(QWidget):
                         # CanvasArea 다시 그리기 (번호표 표시를 위해)
                         self.canvas_area.update()
                         
-                        print(f"[Canvas] 번호표 업데이트 완료: {len(self.furniture_items)}개 아이템")
+                        logger.debug("[Canvas] 번호표 업데이트 완료: %d개 아이템", len(self.furniture_items))
                         return
                 break
             parent_widget = parent_widget.parent()
@@ -1015,7 +1083,7 @@ class Canvas(QWidget):
             if (self.canvas_area.width() != new_width or 
                 self.canvas_area.height() != new_height):
                 self.canvas_area.resize(new_width, new_height)
-                print(f"[Canvas 리사이즈] 동적 조정: {new_width}x{new_height}")
+                logger.debug("[Canvas 리사이즈] 동적 조정: %dx%d", new_width, new_height)
         # else:
             # print(f"[Canvas 리사이즈] 정적 크기 유지 또는 canvas_area 없음 - is_new_collage: {self.is_new_collage}")
     
@@ -1110,7 +1178,7 @@ class Canvas(QWidget):
             self.background_image = None
             self.has_background = False
 
-        supabase_client = SupabaseClient()
+        supabase_client = SupabaseClient.get_instance()
         all_furniture_db_data = {f_data['id']: f_data for f_data in supabase_client.get_furniture_list()}
 
         for item_state in sorted(state["furniture_items"], key=lambda x: x["z_order"]):
@@ -1370,13 +1438,16 @@ class Canvas(QWidget):
             # 상태 저장 (Undo/Redo용)
             self._save_state()
             
-            # 모든 선택된 아이템 이동
+            # 모든 선택된 아이템 이동 (이동 전/후 영역을 누적)
+            dirty_rect = QRect()
             for item in self.selected_items:
+                dirty_rect = dirty_rect.united(item.geometry())
                 new_pos = QPoint(item.x() + valid_delta_x, item.y() + valid_delta_y)
                 item.move(new_pos)
+                dirty_rect = dirty_rect.united(item.geometry())
             
-            # 캔버스 영역 업데이트 (번호표 위치 업데이트)
-            self.canvas_area.update()
+            # 캔버스 영역 중 변경된 부분만 업데이트 (번호표 위치 업데이트)
+            self.canvas_area.update(dirty_rect)
             
             # 상태 저장 및 액션 업데이트
             self._save_state_and_update_actions()
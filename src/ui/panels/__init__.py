@@ -10,8 +10,7 @@ from .bottom_panel import BottomPanel, SelectedFurniturePanel
 from .common import (
     FurnitureItem,
     FurnitureTableModel,
-    SelectedFurnitureTableModel,
-    ImageLoaderThread
+    SelectedFurnitureTableModel
 )
 from .explorer_panel import ExplorerPanel
 
@@ -21,6 +20,5 @@ __all__ = [
     'SelectedFurniturePanel',
     'FurnitureItem',
     'FurnitureTableModel',
-    'SelectedFurnitureTableModel', 
-    'ImageLoaderThread'
+    'SelectedFurnitureTableModel'
 ] 
\ No newline at end of file
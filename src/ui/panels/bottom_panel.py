@@ -3,18 +3,23 @@
 선택된 가구를 표시하고 관리하는 BottomPanel과 SelectedFurniturePanel 클래스를 포함합니다.
 """
 
-import webbrowser
+import logging
+from functools import partial
 
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import (QFrame, QTableView, QVBoxLayout, QWidget, QSizePolicy,
+from PyQt6.QtWidgets import (QFrame, QHeaderView, QLabel, QTableView, QVBoxLayout, QWidget, QSizePolicy,
                              QHBoxLayout, QPushButton, QMenu)
 
 from .common import SelectedFurnitureTableModel
 
+logger = logging.getLogger(__name__)
+
 
 class SelectedFurniturePanel(QWidget):
     """선택된 가구 목록을 표시하는 패널"""
 
+    FIXED_WIDTH_COLUMNS = (0, 13)  # 번호, 개수 컬럼
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # 컬럼 너비를 저장하는 딕셔너리 (기본값, 14개 컬럼)
@@ -34,6 +39,7 @@ class SelectedFurniturePanel(QWidget):
             12: 100, # 작성자
             13: 60,  # 개수 (맨 오른쪽)
         }
+        self._last_furnitures = None  # 마지막으로 반영한 가구 객체 목록 (변경 여부 확인용)
         self.setup_ui()
 
     def setup_ui(self):
@@ -47,46 +53,24 @@ class SelectedFurniturePanel(QWidget):
         # 선택된 가구 테이블
         self.selected_model = SelectedFurnitureTableModel()
         
-        # 모델에 컬럼 너비 복원 콜백 설정
-        self.selected_model.set_column_width_callback(self.setup_column_widths)
-        
         # 모델에 번호표 업데이트 콜백 설정
         self.selected_model.set_number_label_callback(self.update_canvas_number_labels)
         
         self.selected_table = QTableView()
         self.selected_table.setModel(self.selected_model)
-        self.selected_table.setStyleSheet("""
-            QTableView {
-                border: 1px solid #ddd;
-                background-color: white;
-                gridline-color: #eee;
-                selection-background-color: #e3f2fd;
-                selection-color: #333;
-            }
-            QTableView::item {
-                padding: 8px;
-                border: none;
-            }
-            QTableView::item:selected {
-                background-color: #e3f2fd;
-                color: #333;
-            }
-            QHeaderView::section {
-                background-color: #f5f5f5;
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-left: none;
-                font-weight: bold;
-                color: #333;
-            }
-            QHeaderView::section:first {
-                border-left: 1px solid #ddd;
-            }
-        """)
+        self.selected_table.setObjectName("selectedFurnitureTable")
 
         # 테이블 설정
         self.selected_table.horizontalHeader().setStretchLastSection(False)
         self.selected_table.verticalHeader().setVisible(False)
+        # 모든 행이 같은 높이이므로 행 높이를 고정하여 행마다 크기를 계산하지 않도록 함
+        self.selected_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        # 컬럼 너비는 저장된 값/사용자 조정으로만 정하고 셀 내용으로 크기를 측정하지 않도록 함
+        self.selected_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # 번호/개수 컬럼은 짧은 숫자만 표시하므로 너비를 고정
+        for column in self.FIXED_WIDTH_COLUMNS:
+            self.selected_table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+        self.selected_table.setWordWrap(False)
         self.selected_table.setShowGrid(True)
         self.selected_table.setGridStyle(Qt.PenStyle.SolidLine)
         self.selected_table.setAlternatingRowColors(True)
@@ -101,19 +85,22 @@ class SelectedFurniturePanel(QWidget):
         self.selected_table.setDragDropOverwriteMode(False)
         self.selected_table.setDefaultDropAction(Qt.DropAction.MoveAction)
 
-        # 컬럼 너비 변경 감지 시그널 연결
-        header = self.selected_table.horizontalHeader()
-        header.sectionResized.connect(self.on_column_resized)
-
         # 테이블 선택 변경 시그널 연결
         self.selected_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        # 순서 변경/행 추가/삭제 시 선택은 그대로여도 선택된 행 위치가 바뀌므로 버튼 상태 갱신
+        self.selected_model.layoutChanged.connect(self.on_selection_changed)
+        self.selected_model.rowsInserted.connect(self.on_selection_changed)
+        self.selected_model.rowsRemoved.connect(self.on_selection_changed)
 
         # 초기 컬럼 너비 설정
         self.setup_column_widths()
 
+        # 컬럼 너비 변경 감지 시그널 연결 (초기 너비 적용 이후에 연결)
+        header = self.selected_table.horizontalHeader()
+        header.sectionResized.connect(self.on_column_resized)
+
         # 테이블 크기 정책 설정 - 하단 패널 크기에 따라 동적 조정
-        size_policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.selected_table.setSizePolicy(size_policy)
+        self.selected_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
         # 최소 높이만 설정 (최대 높이 제한 제거하여 동적 크기 조정 가능)
         self.selected_table.setMinimumHeight(100)  # 최소 높이를 100으로 줄임
@@ -134,30 +121,15 @@ class SelectedFurniturePanel(QWidget):
         # 버튼 영역 컨테이너
         control_widget = QWidget()
         control_widget.setFixedHeight(40)  # 고정 높이
-        control_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                margin: 2px 0;
-            }
-        """)
+        control_widget.setObjectName("orderControl")
         
         control_layout = QHBoxLayout(control_widget)
         control_layout.setContentsMargins(10, 5, 10, 5)
         control_layout.setSpacing(10)
 
         # 순서 변경 라벨
-        from PyQt6.QtWidgets import QLabel
         order_label = QLabel("순서 변경:")
-        order_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                color: #495057;
-                border: none;
-                background: none;
-            }
-        """)
+        order_label.setObjectName("orderLabel")
         control_layout.addWidget(order_label)
 
         # 위로 이동 버튼
@@ -165,7 +137,6 @@ class SelectedFurniturePanel(QWidget):
         self.move_up_btn.setFixedSize(80, 25)
         self.move_up_btn.setEnabled(False)
         self.move_up_btn.clicked.connect(self.move_selected_up)
-        self.move_up_btn.setStyleSheet(self.get_button_style())
         control_layout.addWidget(self.move_up_btn)
 
         # 아래로 이동 버튼
@@ -173,7 +144,6 @@ class SelectedFurniturePanel(QWidget):
         self.move_down_btn.setFixedSize(80, 25)
         self.move_down_btn.setEnabled(False)
         self.move_down_btn.clicked.connect(self.move_selected_down)
-        self.move_down_btn.setStyleSheet(self.get_button_style())
         control_layout.addWidget(self.move_down_btn)
 
         # 맨 위로 이동 버튼
@@ -181,7 +151,6 @@ class SelectedFurniturePanel(QWidget):
         self.move_top_btn.setFixedSize(80, 25)
         self.move_top_btn.setEnabled(False)
         self.move_top_btn.clicked.connect(self.move_selected_to_top)
-        self.move_top_btn.setStyleSheet(self.get_button_style())
         control_layout.addWidget(self.move_top_btn)
 
         # 맨 아래로 이동 버튼
@@ -189,15 +158,14 @@ class SelectedFurniturePanel(QWidget):
         self.move_bottom_btn.setFixedSize(80, 25)
         self.move_bottom_btn.setEnabled(False)
         self.move_bottom_btn.clicked.connect(self.move_selected_to_bottom)
-        self.move_bottom_btn.setStyleSheet(self.get_button_style())
         control_layout.addWidget(self.move_bottom_btn)
 
         # 정렬 버튼
         self.sort_btn = QPushButton("🔄 정렬")
         self.sort_btn.setFixedSize(60, 25)
         self.sort_btn.clicked.connect(self.show_sort_menu)
-        self.sort_btn.setStyleSheet(self.get_button_style())
         control_layout.addWidget(self.sort_btn)
+        self.sort_menu = self.create_sort_menu()
         
         # 번호 표시 토글 버튼
         self.toggle_number_btn = QPushButton("🔢 번호")
@@ -205,7 +173,6 @@ class SelectedFurniturePanel(QWidget):
         self.toggle_number_btn.setCheckable(True)  # 토글 가능하게 설정
         self.toggle_number_btn.setChecked(True)   # 기본값은 번호 표시
         self.toggle_number_btn.clicked.connect(self.toggle_number_labels)
-        self.toggle_number_btn.setStyleSheet(self.get_button_style())
         control_layout.addWidget(self.toggle_number_btn)
 
         # 스페이서 추가
@@ -214,44 +181,18 @@ class SelectedFurniturePanel(QWidget):
         # 컨트롤 영역을 고정 크기로 추가
         layout.addWidget(control_widget, 0)
 
-    def get_button_style(self):
-        """버튼 스타일을 반환합니다."""
-        return """
-            QPushButton {
-                background-color: #007bff;
-                border: 1px solid #007bff;
-                color: white;
-                border-radius: 3px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 2px 8px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-                border-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-                border-color: #004085;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-                border-color: #6c757d;
-                color: #ffffff;
-            }
-        """
-
     def on_selection_changed(self):
-        """테이블 선택이 변경될 때 버튼 상태를 업데이트합니다."""
+        """테이블 선택이나 행 구성이 변경될 때 버튼 상태를 업데이트합니다."""
         current_row = self.get_selected_row()
-        has_selection = current_row >= 0
-        row_count = self.selected_model.rowCount()
+        last_row = self.selected_model.rowCount() - 1
+        can_move_up = current_row > 0
+        can_move_down = 0 <= current_row < last_row
 
-        # 버튼 활성화/비활성화
-        self.move_up_btn.setEnabled(has_selection and current_row > 0)
-        self.move_down_btn.setEnabled(has_selection and current_row < row_count - 1)
-        self.move_top_btn.setEnabled(has_selection and current_row > 0)
-        self.move_bottom_btn.setEnabled(has_selection and current_row < row_count - 1)
+        # 상태가 바뀐 버튼만 활성화/비활성화 (불필요한 다시 그리기 방지)
+        for button, enabled in ((self.move_up_btn, can_move_up), (self.move_top_btn, can_move_up),
+                                (self.move_down_btn, can_move_down), (self.move_bottom_btn, can_move_down)):
+            if button.isEnabled() != enabled:
+                button.setEnabled(enabled)
 
     def get_selected_row(self):
         """현재 선택된 행 번호를 반환합니다."""
@@ -273,8 +214,8 @@ class SelectedFurniturePanel(QWidget):
         if furniture_name:
             new_row = self.selected_model.move_furniture_up(furniture_name)
             if new_row >= 0:
-                # 모델 업데이트 완료 후 선택 복원 (약간의 지연을 두어 모델 업데이트 완료 대기)
-                QTimer.singleShot(0, lambda: self.select_row(new_row))
+                # 모델이 layoutChanged를 동기적으로 알리므로 바로 선택 복원
+                self.select_row(new_row)
                 # 캔버스 번호표 업데이트
                 self.update_canvas_number_labels()
 
@@ -284,7 +225,7 @@ class SelectedFurniturePanel(QWidget):
         if furniture_name:
             new_row = self.selected_model.move_furniture_down(furniture_name)
             if new_row >= 0:
-                QTimer.singleShot(0, lambda: self.select_row(new_row))
+                self.select_row(new_row)
                 # 캔버스 번호표 업데이트
                 self.update_canvas_number_labels()
 
@@ -294,7 +235,7 @@ class SelectedFurniturePanel(QWidget):
         if furniture_name:
             new_row = self.selected_model.move_furniture_to_top(furniture_name)
             if new_row >= 0:
-                QTimer.singleShot(0, lambda: self.select_row(new_row))
+                self.select_row(new_row)
                 # 캔버스 번호표 업데이트
                 self.update_canvas_number_labels()
 
@@ -304,12 +245,12 @@ class SelectedFurniturePanel(QWidget):
         if furniture_name:
             new_row = self.selected_model.move_furniture_to_bottom(furniture_name)
             if new_row >= 0:
-                QTimer.singleShot(0, lambda: self.select_row(new_row))
+                self.select_row(new_row)
                 # 캔버스 번호표 업데이트
                 self.update_canvas_number_labels()
 
-    def show_sort_menu(self):
-        """정렬 옵션 메뉴를 표시합니다."""
+    def create_sort_menu(self):
+        """정렬 옵션 메뉴를 한 번만 생성합니다. (메뉴를 열 때마다 QAction을 다시 만들지 않음)"""
         menu = QMenu(self)
         
         # 정렬 옵션들
@@ -326,17 +267,19 @@ class SelectedFurniturePanel(QWidget):
         
         for text, sort_by, ascending in sort_options:
             action = menu.addAction(text)
-            action.triggered.connect(lambda checked, sb=sort_by, asc=ascending: self.sort_furniture(sb, asc))
-        
+            action.triggered.connect(partial(self.sort_furniture, sort_by, ascending))
+        return menu
+
+    def show_sort_menu(self):
+        """정렬 옵션 메뉴를 표시합니다."""
         # 버튼 위치에서 메뉴 표시
-        menu.exec(self.sort_btn.mapToGlobal(self.sort_btn.rect().bottomLeft()))
+        self.sort_menu.exec(self.sort_btn.mapToGlobal(self.sort_btn.rect().bottomLeft()))
 
     def sort_furniture(self, sort_by: str, ascending: bool):
         """가구를 정렬합니다."""
         self.selected_model.sort_furniture(sort_by, ascending)
-        # 정렬 후 첫 번째 행 선택 (약간의 지연을 두어 모델 업데이트 완료 대기)
-        if self.selected_model.rowCount() > 0:
-            QTimer.singleShot(0, lambda: self.select_row(0))
+        # 정렬 후 첫 번째 행 선택
+        self.select_row(0)
         # 캔버스 번호표 업데이트
         self.update_canvas_number_labels()
 
@@ -349,44 +292,19 @@ class SelectedFurniturePanel(QWidget):
 
     def create_summary_section(self, layout):
         """총계 표시 영역을 생성합니다."""
-        from PyQt6.QtWidgets import QHBoxLayout, QLabel
-
         # 총계 영역 컨테이너
         summary_widget = QWidget()
         # 높이 고정 설정
         summary_widget.setFixedHeight(50)  # 고정 높이 설정
-        summary_widget.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                margin: 5px 0;
-            }
-        """)
+        summary_widget.setObjectName("selectedSummary")
         summary_layout = QHBoxLayout(summary_widget)
         summary_layout.setContentsMargins(15, 10, 15, 10)
 
         # 총 가구 개수 라벨
         self.total_count_label = QLabel("총 가구: 0개")
-        self.total_count_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 14px;
-                color: #495057;
-                border: none;
-            }
-        """)
 
         # 총 가격 라벨
         self.total_price_label = QLabel("총 가격: ₩0")
-        self.total_price_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 14px;
-                color: #495057;
-                border: none;
-            }
-        """)
 
         # 스페이서 추가하여 오른쪽 정렬
         summary_layout.addWidget(self.total_count_label)
@@ -402,14 +320,7 @@ class SelectedFurniturePanel(QWidget):
         separator.setFrameShadow(QFrame.Shadow.Sunken)
         # 구분선도 고정 높이 설정
         separator.setFixedHeight(10)  # 구분선 고정 높이
-        separator.setStyleSheet("""
-            QFrame {
-                color: #ddd;
-                background-color: #ddd;
-                height: 1px;
-                margin: 5px 0;
-            }
-        """)
+        separator.setObjectName("selectedSeparator")
         # 구분선도 고정 크기로 추가 (stretch factor 0)
         layout.addWidget(separator, 0)
 
@@ -417,18 +328,19 @@ class SelectedFurniturePanel(QWidget):
         """컬럼 너비가 변경될 때 호출되는 메서드"""
         # 변경된 컬럼 너비를 저장
         self.column_widths[logical_index] = new_size
-        print(f"[컬럼 너비 변경] 컬럼 {logical_index}: {old_size} -> {new_size}")
+        logger.debug("[컬럼 너비 변경] 컬럼 %d: %d -> %d", logical_index, old_size, new_size)
 
     def setup_column_widths(self):
         """저장된 컬럼 너비를 적용하는 메서드"""
         header = self.selected_table.horizontalHeader()
 
-        # 저장된 너비로 각 컬럼 설정
-        for column_index, width in self.column_widths.items():
-            self.selected_table.setColumnWidth(column_index, width)
-
-        # 마지막 컬럼은 stretch하지 않도록 설정
-        header.setStretchLastSection(False)
+        # 저장된 너비로 각 컬럼 설정 (이미 저장된 값이므로 sectionResized 시그널은 차단)
+        header.blockSignals(True)
+        try:
+            for column_index, width in self.column_widths.items():
+                self.selected_table.setColumnWidth(column_index, width)
+        finally:
+            header.blockSignals(False)
 
     def update_summary(self):
         """총계 정보를 업데이트합니다."""
@@ -440,54 +352,47 @@ class SelectedFurniturePanel(QWidget):
 
     def on_double_click(self, index):
         """테이블 아이템 더블클릭 시 처리"""
-        if index.isValid():
-            # 링크 컬럼(11번 컬럼)을 클릭한 경우 웹 브라우저로 링크 열기
-            if index.column() == 11:  # 링크 컬럼
-                link_text = self.selected_model.data(index, Qt.ItemDataRole.DisplayRole)
-                if link_text and link_text.strip():
-                    print(f"[선택된 가구 패널] 링크 열기: {link_text}")
-                    webbrowser.open(link_text)
-                else:
-                    print("[선택된 가구 패널] 링크가 비어 있습니다.")
-            else:
-                print(f"[선택된 가구 패널] 더블클릭: {index.row()}행, {index.column()}열")
+        # 링크 컬럼이 아닌 더블클릭은 처리하지 않음
+        if not index.isValid() or index.column() != SelectedFurnitureTableModel.LINK_COLUMN:
+            return
+        
+        # 표시 문자열을 거치지 않고 행의 가구에서 링크를 바로 가져와 웹 브라우저로 열기
+        furniture = self.selected_model.get_furniture_at_row(index.row())
+        link = (furniture.link or "").strip() if furniture else ""
+        if link:
+            print(f"[선택된 가구 패널] 링크 열기: {link}")
+            # 링크 열기는 드문 동작이므로 시작 시간 단축을 위해 필요할 때만 import
+            import webbrowser
+            webbrowser.open(link)
+        else:
+            print("[선택된 가구 패널] 링크가 비어 있습니다.")
 
     def update_furniture_list(self, furniture_items):
         """선택된 가구 목록을 업데이트합니다."""
-        print(f"[선택된 가구 패널] 가구 목록 업데이트 시작, 아이템 수: {len(furniture_items)}")
+        logger.debug("[선택된 가구 패널] 가구 목록 업데이트 시작, 아이템 수: %d", len(furniture_items))
         
-        # 이전 데이터 비우기
-        self.selected_model.clear_furniture()
-
-        # 가구별 개수 집계
-        furniture_count = {}
-        for item in furniture_items:
-            if hasattr(item, 'furniture'):
-                furniture = item.furniture
-                furniture_key = f"{furniture.name}_{furniture.brand}"
-
-                if furniture_key in furniture_count:
-                    furniture_count[furniture_key]['count'] += 1
-                else:
-                    furniture_count[furniture_key] = {
-                        'furniture': furniture,
-                        'count': 1
-                    }
-
-        # 집계된 데이터를 모델에 추가
-        for item_info in furniture_count.values():
-            furniture = item_info['furniture']
-            count = item_info['count']
-
-            # 개수만큼 모델에 추가 (내부적으로 집계됨)
-            for _ in range(count):
-                self.selected_model.add_furniture(furniture)
-
-        # 모델 업데이트 후 컬럼 너비 재설정 및 총계 업데이트
-        self.setup_column_widths()
-        self.update_summary()
+        # 전체를 다시 구성하지 않고 달라진 가구 행만 삽입/삭제/갱신
+        furnitures = [item.furniture for item in furniture_items if hasattr(item, 'furniture')]
+        
+        # 직전과 같은 가구 객체 목록이면 모델과 총계를 다시 계산하지 않음
+        # (객체를 참조로 보관하므로 id가 다른 객체에 재사용되지 않음)
+        last = self._last_furnitures
+        if (last is not None and len(last) == len(furnitures)
+                and all(a is b for a, b in zip(last, furnitures))):
+            return
+        self._last_furnitures = tuple(furnitures)
+        
+        # 삭제/갱신/삽입 사이의 중간 상태를 그리지 않도록 갱신이 끝난 뒤 한 번만 다시 그림
+        self.selected_table.setUpdatesEnabled(False)
+        try:
+            self.selected_model.sync(furnitures)
+
+            # 컬럼 너비는 사용자 상태이므로 목록 갱신 시 다시 적용하지 않음
+            self.update_summary()
+        finally:
+            self.selected_table.setUpdatesEnabled(True)
 
-        print(f"[선택된 가구 패널] 가구 목록 업데이트 완료, 총 {len(furniture_count)}개 타입")
+        logger.debug("[선택된 가구 패널] 가구 목록 업데이트 완료, 총 %d개 타입", self.selected_model.rowCount())
 
     def toggle_number_labels(self):
         """가구 번호 표시를 토글합니다."""
@@ -523,7 +428,7 @@ class SelectedFurniturePanel(QWidget):
         canvas = self._find_canvas()
         if canvas and hasattr(canvas, 'update_number_labels'):
             canvas.update_number_labels()
-            print("[하단패널] 캥버스 번호표 업데이트 요청")
+            logger.debug("[하단패널] 캥버스 번호표 업데이트 요청")
         else:
             print("[하단패널] 캥버스를 찾을 수 없어 번호표 업데이트 실패")
 
@@ -531,9 +436,19 @@ class SelectedFurniturePanel(QWidget):
 class BottomPanel(QWidget):
     """하단 패널 - 선택된 가구들을 표시하는 메인 패널"""
 
+    UPDATE_DELAY_MS = 50  # 연속된 업데이트 요청을 한 번으로 합치는 대기 시간
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("bottom_panel")
+        
+        # 캔버스 조작 중 연달아 들어오는 업데이트 요청은 마지막 목록으로 한 번만 반영
+        self._pending_items = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DELAY_MS)
+        self._update_timer.timeout.connect(self._apply_pending_update)
+        
         self.setup_ui()
         print("[하단패널] 초기화 완료")
 
@@ -546,7 +461,15 @@ class BottomPanel(QWidget):
         layout.addWidget(self.selected_panel)
 
     def update_panel(self, items):
-        """하단 패널을 업데이트합니다."""
-        print(f"[하단패널] 업데이트 시작, 아이템 수: {len(items)}")
+        """하단 패널 업데이트를 예약합니다. (UPDATE_DELAY_MS 안의 요청은 한 번으로 합쳐짐)"""
+        self._pending_items = items
+        self._update_timer.start()
+
+    def _apply_pending_update(self):
+        """예약된 가구 목록으로 하단 패널을 업데이트합니다."""
+        items, self._pending_items = self._pending_items, None
+        if items is None:
+            return
+        logger.debug("[하단패널] 업데이트 시작, 아이템 수: %d", len(items))
         self.selected_panel.update_furniture_list(items)
-        print("[하단패널] 업데이트 완료") 
+        logger.debug("[하단패널] 업데이트 완료")
@@ -3,74 +3,174 @@
 패널들에서 공통으로 사용되는 위젯, 모델, 스레드 클래스들을 포함합니다.
 """
 
-import weakref
+import logging
+import os
+from collections import Counter
 
-from PyQt6.QtCore import QMimeData, QSize, Qt, QThread, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QDrag, QPixmap, QStandardItem, QStandardItemModel
+from PyQt6.QtCore import (QAbstractItemModel, QAbstractTableModel, QCoreApplication, QMimeData, QModelIndex,
+                          QObject, QRunnable, QSize, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot)
+from PyQt6.QtGui import QColor, QDrag, QFont, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
 from src.models.furniture import Furniture
 from src.services.image_service import ImageService
 from src.services.supabase_client import SupabaseClient
 
+logger = logging.getLogger(__name__)
 
-class ImageLoaderThread(QThread):
-    """이미지 로딩을 위한 워커 스레드"""
-    image_loaded = pyqtSignal(str, QPixmap)
+# 드래그 앤 드롭 시 가구 ID만 전달하는 MIME 타입 (드롭 측에서 로드된 Furniture 객체를 조회)
+FURNITURE_ID_MIME_TYPE = "application/x-furniture-id"
+
+# 썸네일은 앱 전역 QPixmapCache에 저장하여 위젯/모델 간에 공유하고 LRU로 용량을 제한
+THUMBNAIL_SIZE = (100, 100)
+THUMBNAIL_CACHE_LIMIT_KB = 65536  # 64MB
+
+
+def thumbnail_cache_key(image_filename: str) -> str:
+    """QPixmapCache에서 사용할 썸네일 키를 반환합니다."""
+    return f"thumbnail:{image_filename}"
+
+
+def thumbnail_source_filename(image_filename: str) -> str:
+    """축소 이미지를 원본과 구분해 디스크/메모리 캐시에 저장할 파일명을 반환합니다."""
+    name, ext = os.path.splitext(image_filename)
+    width, height = THUMBNAIL_SIZE
+    return f"{name}_thumb_{width}x{height}{ext}"
+
+
+def fetch_thumbnail_source(image_service, supabase, image_filename: str) -> QPixmap:
+    """썸네일 크기로 변환된 이미지를 받아 디코딩합니다.
+    
+    원본 크기 이미지를 디코딩하지 않도록 Supabase 이미지 변환을 사용합니다.
+    디스크 캐시에 있으면 다운로드하지 않으며, 이미지 변환이 실패해 원본을 받은 경우에도
+    썸네일 크기로 줄여서 저장하므로 다음 실행부터는 작은 파일만 읽습니다.
+    """
+    cache_name = thumbnail_source_filename(image_filename)
+    cached = image_service.get_cached_pixmap(cache_name)
+    if cached is not None:
+        return cached
+    
+    image_data = supabase.get_furniture_image(image_filename, *THUMBNAIL_SIZE)
+    return image_service.download_and_cache_image(image_data, cache_name, max(THUMBNAIL_SIZE))
+
+
+def fetch_full_image(image_service, supabase, image_filename: str) -> QPixmap:
+    """캔버스에 배치할 원본 이미지를 받아 디코딩합니다. (공유 캐시에 있으면 다운로드하지 않음)"""
+    cached = image_service.get_cached_pixmap(image_filename)
+    if cached is not None:
+        return cached
+    
+    image_data = supabase.get_furniture_image(image_filename)
+    return image_service.download_and_cache_image(image_data, image_filename)
+
+
+class FullImagePrefetchJob(QObject):
+    """여러 가구의 원본 이미지를 스레드 풀에서 받아 공유 캐시에 올리는 작업
+    
+    모든 다운로드가 끝나면 GUI 스레드에서 finished 시그널을 보내고 스스로 삭제됩니다.
+    """
+    finished = pyqtSignal()
+    _task_done = pyqtSignal()  # 워커 스레드에서 보내면 GUI 스레드의 _on_task_done으로 전달됨
     
-    def __init__(self, image_service, supabase, furniture):
+    def __init__(self, image_service, supabase, image_filenames, parent=None):
+        super().__init__(parent)
+        self.image_service = image_service
+        self.supabase = supabase
+        self.image_filenames = list(dict.fromkeys(image_filenames))
+        self.pending = len(self.image_filenames)
+        self._task_done.connect(self._on_task_done)
+    
+    def start(self):
+        """다운로드를 시작하고 곧바로 반환합니다. (받을 이미지가 없으면 즉시 finished를 보냄)"""
+        if not self.image_filenames:
+            self._finish()
+            return
+        for image_filename in self.image_filenames:
+            future = self.image_service.executor.submit(
+                fetch_full_image, self.image_service, self.supabase, image_filename)
+            future.add_done_callback(self._emit_task_done)
+    
+    def _emit_task_done(self, future):
+        if future.exception() is not None:
+            # 실패하면 아이템 생성 시 다시 로드함
+            logger.debug("원본 이미지 미리 로드 실패: %s", future.exception())
+        try:
+            self._task_done.emit()
+        except RuntimeError:
+            # 작업 객체가 이미 삭제된 경우
+            pass
+    
+    @pyqtSlot()
+    def _on_task_done(self):
+        self.pending -= 1
+        if self.pending == 0:
+            self._finish()
+    
+    def _finish(self):
+        self.finished.emit()
+        self.deleteLater()
+
+
+def prefetch_full_images(image_service, supabase, image_filenames, on_finished, parent=None) -> FullImagePrefetchJob:
+    """여러 가구의 원본 이미지를 병렬로 받기 시작하고, 모두 끝나면 on_finished를 호출합니다.
+    
+    콜라주 복원처럼 FurnitureItem을 한꺼번에 만들 때 on_finished에서 아이템을 만들면, 각 아이템이
+    GUI 스레드에서 하나씩 순서대로 다운로드하지 않고 캐시된 이미지를 사용합니다.
+    다운로드 중에는 이벤트 루프가 평소대로 돌므로, 호출한 쪽에서 중복 요청과 입력을 막아야 합니다.
+    parent를 지정하지 않으면 완료될 때까지 반환된 작업 객체의 참조를 유지해야 합니다.
+    """
+    job = FullImagePrefetchJob(image_service, supabase, image_filenames, parent)
+    job.finished.connect(on_finished)
+    job.start()
+    return job
+
+
+class ThumbnailSignals(QObject):
+    """스레드 풀 작업 결과를 GUI 스레드로 전달하기 위한 시그널 객체"""
+    thumbnail_loaded = pyqtSignal(str, QPixmap, int)  # 파일명, 이미지, 요청 세대
+    load_failed = pyqtSignal(str, str, int)  # 파일명, 오류 메시지, 요청 세대
+
+
+class ThumbnailLoader(QRunnable):
+    """QThreadPool에서 이미지를 다운로드하고 디코딩하여 썸네일 크기로 줄이는 작업"""
+    
+    def __init__(self, image_service, supabase, image_filename: str, generation: int = 0):
         super().__init__()
         self.image_service = image_service
         self.supabase = supabase
-        self.furniture = furniture
-        self._stop_requested = False
-        
-        print(f"[ImageLoaderThread] 생성됨: {furniture.image_filename}")
-        
-        # 스레드가 완료되면 자동으로 정리되도록 설정
-        self.finished.connect(self.deleteLater)
-        self.finished.connect(lambda: print(f"[ImageLoaderThread] 완료됨: {self.furniture.image_filename}"))
+        self.image_filename = image_filename
+        self.generation = generation  # 요청한 쪽에서 오래된 결과를 구분하기 위한 세대 번호
+        self.signals = ThumbnailSignals()
     
     def run(self):
         try:
-            print(f"[ImageLoaderThread] 시작: {self.furniture.image_filename}")
-            
-            if self._stop_requested:
-                print(f"[ImageLoaderThread] 중지 요청으로 종료: {self.furniture.image_filename}")
-                return
-                
-            # Supabase에서 이미지 데이터 가져오기
-            image_data = self.supabase.get_furniture_image(self.furniture.image_filename)
-            
-            if self._stop_requested:
-                print(f"[ImageLoaderThread] 중지 요청으로 종료: {self.furniture.image_filename}")
-                return
-                
-            # 이미지 처리
-            pixmap = self.image_service.download_and_cache_image(image_data, self.furniture.image_filename)
-            
-            if self._stop_requested:
-                print(f"[ImageLoaderThread] 중지 요청으로 종료: {self.furniture.image_filename}")
-                return
-                
-            # 시그널 발생
-            if pixmap and not pixmap.isNull():
-                print(f"[ImageLoaderThread] 시그널 발생: {self.furniture.image_filename}")
-                self.image_loaded.emit(self.furniture.image_filename, pixmap)
-                
+            pixmap = fetch_thumbnail_source(self.image_service, self.supabase, self.image_filename)
+            # 크기 조정도 워커에서 끝내고 GUI 스레드에는 완성된 썸네일만 전달
+            thumbnail = self.image_service.create_thumbnail(pixmap, THUMBNAIL_SIZE)
+            self.signals.thumbnail_loaded.emit(self.image_filename, thumbnail, self.generation)
         except Exception as e:
-            if not self._stop_requested:
-                print(f"[ImageLoaderThread] 오류 발생: {self.furniture.image_filename} - {e}")
-        finally:
-            print(f"[ImageLoaderThread] 종료: {self.furniture.image_filename}")
-            # 스레드 완료 시 자동 정리
-            self.quit()
-    
-    def stop(self):
-        """스레드 중지 요청"""
-        print(f"[ImageLoaderThread] 중지 요청: {self.furniture.image_filename}")
-        self._stop_requested = True
-        self.quit()  # 이벤트 루프 종료 요청
+            try:
+                self.signals.load_failed.emit(self.image_filename, str(e), self.generation)
+            except RuntimeError:
+                # 위젯이 이미 삭제된 경우
+                pass
+
+
+class FullImagePrefetcher(QRunnable):
+    """드래그 중인 가구의 원본 이미지를 QThreadPool에서 공유 캐시에 미리 올리는 작업"""
+    
+    def __init__(self, image_service, supabase, image_filename: str):
+        super().__init__()
+        self.image_service = image_service
+        self.supabase = supabase
+        self.image_filename = image_filename
+    
+    def run(self):
+        try:
+            fetch_full_image(self.image_service, self.supabase, self.image_filename)
+        except Exception as e:
+            # 실패하면 드롭 시 캔버스에서 다시 로드함
+            logger.debug("원본 이미지 미리 로드 실패: %s - %s", self.image_filename, e)
 
 
 class FurnitureItem(QWidget):
@@ -79,8 +179,8 @@ class FurnitureItem(QWidget):
     def __init__(self, furniture: Furniture, parent=None):
         super().__init__(parent)
         self.furniture = furniture
-        self.image_service = ImageService()
-        self.supabase = SupabaseClient()
+        self.image_service = ImageService.get_instance()
+        self.supabase = SupabaseClient.get_instance()
         self.setup_ui()
         self.load_image()
     
@@ -92,13 +192,7 @@ class FurnitureItem(QWidget):
         # 썸네일 이미지
         self.image_label = QLabel()
         self.image_label.setFixedSize(100, 100)  # 이미지 크기 증가
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.image_label.setObjectName("furnitureThumbnail")
         layout.addWidget(self.image_label)
         
         # 가구 정보
@@ -107,44 +201,22 @@ class FurnitureItem(QWidget):
         
         # 이름
         name_label = QLabel(self.furniture.name)
-        name_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 15px;
-                color: #2C3E50;
-            }
-        """)
+        name_label.setObjectName("furnitureName")
         info_layout.addWidget(name_label)
         
         # 브랜드
         brand_label = QLabel(self.furniture.brand)
-        brand_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #666;
-            }
-        """)
+        brand_label.setObjectName("furnitureMeta")
         info_layout.addWidget(brand_label)
         
         # 타입
         type_label = QLabel(self.furniture.type)
-        type_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #666;
-            }
-        """)
+        type_label.setObjectName("furnitureMeta")
         info_layout.addWidget(type_label)
         
         # 가격
-        price_label = QLabel(f"₩{self.furniture.price:,}")
-        price_label.setStyleSheet("""
-            QLabel {
-                font-size: 15px;
-                color: #2C3E50;
-                font-weight: bold;
-            }
-        """)
+        price_label = QLabel(self.furniture.price_text)
+        price_label.setObjectName("furniturePrice")
         info_layout.addWidget(price_label)
         
         layout.addLayout(info_layout)
@@ -157,242 +229,449 @@ class FurnitureItem(QWidget):
         self.setMinimumHeight(140)  # 썸네일 + 여백을 고려한 높이
     
     def load_image(self):
-        """가구 이미지를 로드합니다."""
+        """가구 이미지를 로드합니다.
+        
+        공유 썸네일 캐시에 있으면 바로 표시하고, 없으면 자리 표시 이미지를 보여준 뒤
+        QThreadPool에서 다운로드하여 완료 시 on_image_loaded에서 표시합니다.
+        """
+        thumbnail = QPixmapCache.find(thumbnail_cache_key(self.furniture.image_filename))
+        if thumbnail is not None:
+            self._show_thumbnail(thumbnail)
+            return
+        
+        # 다운로드가 끝날 때까지 회색 자리 표시 이미지
+        placeholder = QPixmap(*THUMBNAIL_SIZE)
+        placeholder.fill(QColor("#e9ecef"))
+        self.image_label.setPixmap(placeholder)
+        
+        loader = ThumbnailLoader(self.image_service, self.supabase, self.furniture.image_filename)
+        loader.signals.thumbnail_loaded.connect(self.on_image_loaded)
+        loader.signals.load_failed.connect(self.on_image_load_failed)
+        QThreadPool.globalInstance().start(loader)
+    
+    @pyqtSlot(str, QPixmap)
+    def on_image_loaded(self, filename: str, thumbnail: QPixmap):
+        """워커에서 생성한 썸네일을 캐시하고 표시합니다."""
         try:
-            # Supabase에서 이미지 다운로드
-            image_data = self.supabase.get_furniture_image(self.furniture.image_filename)
-            
-            # 이미지 캐시 및 썸네일 생성
-            pixmap = self.image_service.download_and_cache_image(
-                image_data, 
-                self.furniture.image_filename
-            )
-            thumbnail = self.image_service.create_thumbnail(pixmap, (100, 100))  # 썸네일 크기 증가
-            
-            # 썸네일 표시
-            self.image_label.setPixmap(thumbnail)
-            self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
+            QPixmapCache.insert(thumbnail_cache_key(filename), thumbnail)
+            self._show_thumbnail(thumbnail)
         except Exception as e:
-            print(f"이미지 로드 중 오류 발생: {e}")
-            # 에러 이미지 표시
-            self.image_label.setText("이미지 로드 실패")
+            self.on_image_load_failed(filename, str(e))
+    
+    @pyqtSlot(str, str)
+    def on_image_load_failed(self, filename: str, message: str):
+        """이미지 로드 실패 시 오류 문구를 표시합니다."""
+        print(f"이미지 로드 중 오류 발생: {message}")
+        # 에러 이미지 표시
+        self.image_label.setText("이미지 로드 실패")
+    
+    def _show_thumbnail(self, thumbnail: QPixmap):
+        """썸네일을 이미지 라벨에 표시합니다."""
+        self.image_label.setPixmap(thumbnail)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             drag = QDrag(self)
             mime_data = QMimeData()
             
-            # 드래그 데이터 설정
-            furniture_data = {
-                'id': self.furniture.id,
-                'name': self.furniture.name,
-                'image_filename': self.furniture.image_filename,
-                'price': self.furniture.price,
-                'brand': self.furniture.brand,
-                'type': self.furniture.type,
-                'description': self.furniture.description,
-                'link': self.furniture.link,
-                'color': self.furniture.color,
-                'locations': self.furniture.locations,
-                'styles': self.furniture.styles,
-                'width': self.furniture.width,
-                'depth': self.furniture.depth,
-                'height': self.furniture.height,
-                'seat_height': self.furniture.seat_height,
-                'author': self.furniture.author,
-                'created_at': self.furniture.created_at
-            }
-            
-            # MIME 데이터 설정
-            mime_data.setData("application/x-furniture", str(furniture_data).encode())
+            # 가구 ID만 MIME 데이터로 전달
+            mime_data.setData(FURNITURE_ID_MIME_TYPE, self.furniture.mime_payload)
             drag.setMimeData(mime_data)
             
             # 드래그 시작
             drag.exec()
 
 
-class FurnitureTableModel(QStandardItemModel):
-    """가구 목록을 위한 테이블 모델"""
+class FurnitureTableModel(QAbstractTableModel):
+    """가구 목록을 위한 테이블 모델
+    
+    행마다 QStandardItem을 만들지 않고 furniture_items 리스트에서 필요할 때 값을 계산하여 반환합니다.
+    """
+    
+    HEADERS = ["썸네일", "브랜드", "이름", "가격", "타입", "위치", "색상", "스타일"]
+    THUMBNAIL_LOAD_WORKERS = 16  # 동시에 진행할 이미지 다운로드 수 (네트워크 대기 위주의 작업)
+    SHUTDOWN_WAIT_MS = 2000  # 앱 종료 시 실행 중인 썸네일 작업을 기다리는 최대 시간
+    THUMBNAIL_FLUSH_MS = 16  # 완료된 썸네일을 모아 뷰에 한 번에 알리는 간격 (약 한 프레임)
     
     def __init__(self):
         super().__init__()
-        self.setHorizontalHeaderLabels(["썸네일", "브랜드", "이름", "가격", "타입", "위치", "색상", "스타일"])
         self.furniture_items = []
-        self.image_service = ImageService()
-        self.supabase = SupabaseClient()
-        self.thumbnail_cache = weakref.WeakValueDictionary()  # 약한 참조를 사용한 썸네일 캐시
-        self.loading_threads = {}  # 로딩 중인 스레드 추적
-        self._cleanup_timer = None
+        self.furniture_by_id = {}  # 가구 ID -> Furniture (드롭 시 조회용)
+        self.image_service = ImageService.get_instance()
+        self.supabase = SupabaseClient.get_instance()
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), THUMBNAIL_CACHE_LIMIT_KB))
+        
+        # 썸네일 병렬 로딩 (행마다 스레드를 만들지 않고 크기가 제한된 전용 스레드 풀에 작업을 제출)
+        self.thumbnail_pool = QThreadPool()
+        self.thumbnail_pool.setMaxThreadCount(self.THUMBNAIL_LOAD_WORKERS)
+        self.pending_thumbnails = set()  # 로딩 중인 파일명
+        self.thumbnail_generation = 0  # clear_furniture마다 증가하여 이전 요청의 결과를 구분
+        self.thumbnail_rows = {}  # 파일명 -> 해당 이미지를 표시하는 행 번호 목록
+        self.failed_thumbnails = set()  # 로드에 실패한 파일명 (반복 요청 방지)
+        self.prefetched_images = set()  # 원본 이미지를 미리 로드한 파일명
+        
+        # 썸네일이 완료될 때마다 dataChanged를 보내지 않고, 한 프레임 동안 완료된 행을 모아 한 번에 알림
+        self._changed_thumbnail_rows = set()
+        self._thumbnail_flush_timer = QTimer(self)
+        self._thumbnail_flush_timer.setSingleShot(True)
+        self._thumbnail_flush_timer.setInterval(self.THUMBNAIL_FLUSH_MS)
+        self._thumbnail_flush_timer.timeout.connect(self._flush_thumbnail_updates)
+        
+        # __del__에 의존하지 않고 앱 종료 직전에 스레드 풀을 정리
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.furniture_items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.furniture_items):
+            return None
+        
+        furniture = self.furniture_items[index.row()]
+        column = index.column()
+        
+        if column == 0:
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._thumbnail_for(furniture.image_filename)
+            if role == Qt.ItemDataRole.SizeHintRole:
+                return QSize(*THUMBNAIL_SIZE)
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 1:
+                return furniture.brand
+            if column == 2:
+                return furniture.name
+            if column == 3:
+                return furniture.price_text
+            if column == 4:
+                return furniture.type
+            if column == 5:
+                return furniture.locations_text
+            if column == 6:
+                return furniture.color
+            if column == 7:
+                return furniture.styles_text
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
     
     def mimeTypes(self):
-        return ["application/x-furniture"]
+        return [FURNITURE_ID_MIME_TYPE]
     
     def mimeData(self, indexes):
         mime_data = QMimeData()
         if not indexes:
             return mime_data
             
-        # 선택된 행의 가구 데이터 가져오기
+        # 선택된 행의 가구 ID만 MIME 데이터로 전달
         row = indexes[0].row()
         if row < len(self.furniture_items):
             furniture = self.furniture_items[row]
-            furniture_data = {
-                'id': furniture.id,
-                'name': furniture.name,
-                'image_filename': furniture.image_filename,
-                'price': furniture.price,
-                'brand': furniture.brand,
-                'type': furniture.type,
-                'description': furniture.description,
-                'link': furniture.link,
-                'color': furniture.color,
-                'locations': furniture.locations,
-                'styles': furniture.styles,
-                'width': furniture.width,
-                'depth': furniture.depth,
-                'height': furniture.height,
-                'seat_height': furniture.seat_height,
-                'author': furniture.author,
-                'created_at': furniture.created_at
-            }
-            
-            # MIME 데이터 설정
-            mime_data.setData("application/x-furniture", str(furniture_data).encode())
+            mime_data.setData(FURNITURE_ID_MIME_TYPE, furniture.mime_payload)
+            self.prefetch_full_image(furniture.image_filename)
             
         return mime_data
     
+    def prefetch_full_image(self, filename: str):
+        """드래그를 시작한 가구의 원본 이미지를 백그라운드에서 미리 로드합니다.
+        
+        캔버스에 드롭되면 FurnitureItem이 GUI 스레드에서 다운로드하지 않고 공유 캐시의 이미지를 사용합니다.
+        """
+        if filename in self.prefetched_images:
+            return
+        self.prefetched_images.add(filename)
+        self.thumbnail_pool.start(FullImagePrefetcher(self.image_service, self.supabase, filename))
+    
     def add_furniture(self, furniture: Furniture):
-        # 썸네일 아이템
-        thumbnail_item = QStandardItem()
-        thumbnail_item.setText("")  # 텍스트 제거
-        thumbnail_item.setSizeHint(QSize(100, 100))
-        
-        # 다른 정보 아이템들
-        brand_item = QStandardItem(furniture.brand)
-        name_item = QStandardItem(furniture.name)
-        price_item = QStandardItem(f"₩{furniture.price:,}")
-        type_item = QStandardItem(furniture.type)
-        locations_item = QStandardItem(", ".join(furniture.locations))
-        color_item = QStandardItem(furniture.color)
-        styles_item = QStandardItem(", ".join(furniture.styles))
-        
-        # 행 추가
-        row = [thumbnail_item, brand_item, name_item, price_item, type_item, locations_item, color_item, styles_item]
-        self.appendRow(row)
-        
-        # 가구 리스트에 추가
-        self.furniture_items.append(furniture)
-        
-        # 썸네일 비동기 로드
-        self.load_thumbnail_async(furniture, thumbnail_item)
-    
-    def load_thumbnail_async(self, furniture: Furniture, item: QStandardItem):
-        """비동기적으로 썸네일을 로드합니다."""
-        # 이미 로딩 중인 경우 건너뛰기
-        if furniture.image_filename in self.loading_threads:
-            print(f"[FurnitureTableModel] 이미 로딩 중: {furniture.image_filename}")
+        self.add_furniture_list([furniture])
+    
+    def add_furniture_list(self, furniture_list):
+        """여러 가구를 한 번의 행 삽입으로 추가합니다. (뷰의 레이아웃 계산도 한 번만 발생)"""
+        if not furniture_list:
             return
-            
-        print(f"[FurnitureTableModel] 썸네일 로딩 시작: {furniture.image_filename}")
         
-        # 새로운 로더 스레드 생성
-        loader = ImageLoaderThread(self.image_service, self.supabase, furniture)
-        loader.image_loaded.connect(lambda filename, pixmap: self.on_image_loaded(filename, pixmap, item))
+        first_row = len(self.furniture_items)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(furniture_list) - 1)
+        for row, furniture in enumerate(furniture_list, start=first_row):
+            self.furniture_items.append(furniture)
+            self.furniture_by_id[str(furniture.id)] = furniture
+            # 썸네일 결과가 도착하면 갱신할 행 등록
+            self.thumbnail_rows.setdefault(furniture.image_filename, []).append(row)
+        self.endInsertRows()
+        # 썸네일은 모든 행을 한꺼번에 요청하지 않고, 뷰에 표시되는 행만 data()/load_thumbnails_for_rows에서 로드
+    
+    def update_furniture_list(self, furniture_list):
+        """새로 조회한 가구 목록을 ID 기준으로 비교하여 달라진 부분만 반영합니다.
+        
+        변경된 가구는 dataChanged로, 새 가구는 행 삽입으로 갱신합니다.
+        삭제된 가구가 있으면 행 번호가 바뀌므로 모델을 다시 구성합니다.
+        """
+        new_ids = {str(furniture.id) for furniture in furniture_list}
+        if any(furniture_id not in new_ids for furniture_id in self.furniture_by_id):
+            self._replace_furniture_list(furniture_list)
+            return
         
-        # 스레드 추적
-        self.loading_threads[furniture.image_filename] = loader
-        print(f"[FurnitureTableModel] 스레드 등록: {furniture.image_filename}, 총 {len(self.loading_threads)}개")
+        rows_by_id = {str(furniture.id): row for row, furniture in enumerate(self.furniture_items)}
+        added = []
+        for furniture in furniture_list:
+            furniture_id = str(furniture.id)
+            row = rows_by_id.get(furniture_id)
+            if row is None:
+                added.append(furniture)
+                continue
+            
+            current = self.furniture_items[row]
+            if current == furniture:
+                continue
+            
+            self.furniture_items[row] = furniture
+            self.furniture_by_id[furniture_id] = furniture
+            if current.image_filename != furniture.image_filename:
+                old_rows = self.thumbnail_rows.get(current.image_filename, [])
+                if row in old_rows:
+                    old_rows.remove(row)
+                self.thumbnail_rows.setdefault(furniture.image_filename, []).append(row)
+                self.prefetch_thumbnails([furniture.image_filename])
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+        
+        self.add_furniture_list(added)
+    
+    def _replace_furniture_list(self, furniture_list):
+        """가구 목록 전체를 한 번의 모델 리셋으로 교체합니다.
+        
+        clear_furniture와 달리 진행 중인 썸네일 요청은 유지합니다.
+        """
+        self.beginResetModel()
+        self.furniture_items[:] = furniture_list
+        self.furniture_by_id.clear()
+        self.thumbnail_rows.clear()
+        for row, furniture in enumerate(self.furniture_items):
+            self.furniture_by_id[str(furniture.id)] = furniture
+            self.thumbnail_rows.setdefault(furniture.image_filename, []).append(row)
+        self.endResetModel()
+    
+    def _thumbnail_for(self, filename: str):
+        """공유 썸네일 캐시에서 썸네일을 찾습니다. 캐시에서 밀려났으면 다시 로드를 요청합니다."""
+        thumbnail = QPixmapCache.find(thumbnail_cache_key(filename))
+        if thumbnail is None and filename not in self.failed_thumbnails:
+            self.prefetch_thumbnails([filename])
+        return thumbnail
+    
+    def load_thumbnails_for_rows(self, rows):
+        """지정한 행(화면에 보이거나 곧 보일 행)의 썸네일 로드를 요청합니다."""
+        self.prefetch_thumbnails([
+            self.furniture_items[row].image_filename
+            for row in rows
+            if 0 <= row < len(self.furniture_items)
+        ])
+    
+    def prefetch_thumbnails(self, filenames):
+        """이미지 다운로드를 스레드 풀에 한꺼번에 제출합니다.
+        
+        각 요청은 최대 THUMBNAIL_LOAD_WORKERS개까지 동시에 진행되며, 완료되는 순서대로
+        thumbnail_loaded 시그널을 통해 GUI 스레드에서 해당 행에 반영됩니다.
+        """
+        submitted = 0
+        for filename in filenames:
+            # 이미 로딩 중이거나 실패했거나 썸네일이 캐시된 경우 건너뛰기
+            if (filename in self.pending_thumbnails
+                    or filename in self.failed_thumbnails
+                    or QPixmapCache.find(thumbnail_cache_key(filename)) is not None):
+                continue
+            
+            loader = ThumbnailLoader(self.image_service, self.supabase, filename, self.thumbnail_generation)
+            # 요청이 즉시 완료되더라도 항상 이벤트 루프를 거쳐 GUI 스레드에서 처리
+            loader.signals.thumbnail_loaded.connect(
+                self.on_image_loaded, Qt.ConnectionType.QueuedConnection
+            )
+            loader.signals.load_failed.connect(
+                self.on_image_load_failed, Qt.ConnectionType.QueuedConnection
+            )
+            self.pending_thumbnails.add(filename)
+            self.thumbnail_pool.start(loader)
+            submitted += 1
         
-        # 스레드 시작
-        loader.start()
+        if submitted:
+            logger.debug("[FurnitureTableModel] 썸네일 로딩 대기 중: %d개", len(self.pending_thumbnails))
     
-    @pyqtSlot(str, QPixmap, QStandardItem)
-    def on_image_loaded(self, filename: str, pixmap: QPixmap, item: QStandardItem):
-        """이미지 로드 완료 시 호출되는 콜백"""
+    @pyqtSlot(str, QPixmap, int)
+    def on_image_loaded(self, filename: str, thumbnail: QPixmap, generation: int):
+        """이미지 로드 완료 시 호출되는 콜백
+        
+        clear_furniture 이전에 시작된 요청의 결과는 썸네일 캐시에만 반영하고,
+        현재 요청 상태(pending/failed)는 건드리지 않습니다.
+        """
+        stale = generation != self.thumbnail_generation
         try:
-            # 썸네일 생성 및 캐시
-            if pixmap and not pixmap.isNull():
-                thumbnail = self.image_service.create_thumbnail(pixmap, (100, 100))
-                item.setData(thumbnail, Qt.ItemDataRole.DecorationRole)
-                self.thumbnail_cache[filename] = thumbnail
+            # 워커에서 생성한 썸네일 캐시
+            if thumbnail and not thumbnail.isNull():
+                QPixmapCache.insert(thumbnail_cache_key(filename), thumbnail)
+                self._changed_thumbnail_rows.update(self.thumbnail_rows.get(filename, []))
+                if not self._thumbnail_flush_timer.isActive():
+                    self._thumbnail_flush_timer.start()
+            elif not stale:
+                self.failed_thumbnails.add(filename)
         except Exception as e:
+            if not stale:
+                self.failed_thumbnails.add(filename)
             print(f"썸네일 설정 중 오류 발생: {e}")
         finally:
-            # 완료된 스레드 제거
-            if filename in self.loading_threads:
-                del self.loading_threads[filename]
+            # 완료된 요청 제거
+            if not stale:
+                self.pending_thumbnails.discard(filename)
+    
+    def _flush_thumbnail_updates(self):
+        """모아 둔 썸네일 완료 행을 dataChanged 한 번으로 뷰에 알립니다."""
+        rows = [row for row in self._changed_thumbnail_rows if row < len(self.furniture_items)]
+        self._changed_thumbnail_rows.clear()
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0),
+                                  [Qt.ItemDataRole.DecorationRole])
+    
+    @pyqtSlot(str, str, int)
+    def on_image_load_failed(self, filename: str, message: str, generation: int):
+        """이미지 로드 실패 시 호출되는 콜백"""
+        print(f"[FurnitureTableModel] 이미지 로드 오류: {filename} - {message}")
+        if generation != self.thumbnail_generation:
+            return
+        self.failed_thumbnails.add(filename)
+        self.pending_thumbnails.discard(filename)
     
     def clear_furniture(self):
-        print(f"[FurnitureTableModel] 스레드 정리 시작: {len(self.loading_threads)}개 스레드")
+        logger.debug("[FurnitureTableModel] 썸네일 요청 정리: %d개", len(self.pending_thumbnails))
         
-        # 로딩 중인 스레드 중단
-        for filename, thread in list(self.loading_threads.items()):  # 리스트로 복사하여 안전하게 순회
-            try:
-                print(f"[FurnitureTableModel] 스레드 정리 중: {filename}")
-                if thread.isRunning():
-                    thread.stop()  # 우리가 추가한 stop() 메서드 호출
-                    thread.quit()
-                    if not thread.wait(3000):  # 최대 3초 대기
-                        print(f"[FurnitureTableModel] 스레드 강제 종료: {filename}")
-                        thread.terminate()  # 강제 종료
-                        thread.wait(1000)  # 종료 대기
-                else:
-                    print(f"[FurnitureTableModel] 스레드 이미 종료됨: {filename}")
-            except Exception as e:
-                print(f"[FurnitureTableModel] 스레드 정리 중 오류: {filename} - {e}")
-        
-        self.loading_threads.clear()
-        print("[FurnitureTableModel] 모든 스레드 정리 완료")
+        # 아직 시작되지 않은 요청은 취소하고, 실행 중인 요청은 세대 번호로 결과를 구분
+        self.thumbnail_generation += 1
+        self.thumbnail_pool.clear()
+        self.pending_thumbnails.clear()
+        self.thumbnail_rows.clear()
+        self.failed_thumbnails.clear()
+        self._thumbnail_flush_timer.stop()
+        self._changed_thumbnail_rows.clear()
         
         # 모델 데이터 초기화
-        self.clear()
-        self.setHorizontalHeaderLabels(["썸네일", "브랜드", "이름", "가격", "타입", "위치", "색상", "스타일"])
+        self.beginResetModel()
         self.furniture_items.clear()
-        self.thumbnail_cache.clear()
+        self.furniture_by_id.clear()
+        self.endResetModel()
     
-    def __del__(self):
-        try:
-            if hasattr(self, 'loading_threads') and self.loading_threads:
-                self.clear_furniture()
-        except Exception as e:
-            print(f"[FurnitureTableModel] 소멸자 오류: {e}")
-            pass  # 소멸자에서는 예외를 무시
+    def shutdown(self):
+        """대기 중인 썸네일 작업을 취소하고 실행 중인 작업이 끝나기를 잠시 기다립니다. (앱 종료 시 호출)"""
+        self.clear_furniture()
+        self.thumbnail_pool.waitForDone(self.SHUTDOWN_WAIT_MS)
 
 
-class SelectedFurnitureTableModel(QStandardItemModel):
-    """선택된 가구 목록을 위한 테이블 모델"""
+class SelectedFurnitureTableModel(QAbstractTableModel):
+    """선택된 가구 목록을 위한 테이블 모델
+    
+    furniture_order/furniture_count에서 셀 값을 필요할 때 계산하여 반환합니다.
+    """
+    
+    HEADERS = [
+        "번호", "이름", "브랜드", "타입", "가격", "색상", 
+        "위치", "스타일", "크기(W×D×H)", "좌석높이", "설명", "링크", "작성자", "개수"
+    ]
+    LINK_COLUMN = 11  # 더블클릭 시 브라우저로 여는 링크 컬럼
+    
+    # 컬럼별 표시 텍스트 함수 (row, furniture, count) -> str, HEADERS 순서와 동일 (14개 컬럼)
+    COLUMN_TEXT = (
+        lambda row, furniture, count: str(row + 1),                                     # 번호
+        lambda row, furniture, count: furniture.name or "",                             # 이름
+        lambda row, furniture, count: furniture.brand or "",                            # 브랜드
+        lambda row, furniture, count: furniture.type or "",                             # 타입
+        lambda row, furniture, count: furniture.price_text if furniture.price else "",  # 가격
+        lambda row, furniture, count: furniture.color or "",                            # 색상
+        lambda row, furniture, count: furniture.locations_text,                         # 위치
+        lambda row, furniture, count: furniture.styles_text,                            # 스타일
+        lambda row, furniture, count: furniture.size_text,                              # 크기
+        lambda row, furniture, count: furniture.seat_height_text,                       # 좌석높이
+        lambda row, furniture, count: furniture.description_summary,                    # 설명
+        lambda row, furniture, count: furniture.link or "",                             # 링크
+        lambda row, furniture, count: furniture.author or "",                           # 작성자
+        lambda row, furniture, count: str(count),                                       # 개수
+    )
     
     def __init__(self):
         super().__init__()
-        self.setHorizontalHeaderLabels([
-            "번호", "이름", "브랜드", "타입", "가격", "색상", 
-            "위치", "스타일", "크기(W×D×H)", "좌석높이", "설명", "링크", "작성자", "개수"
-        ])
+        number_font = QFont()
+        number_font.setBold(True)
+        # 번호 컬럼 전용 역할 값 (가운데 정렬 및 볼드 스타일)
+        self._number_column_roles = {
+            Qt.ItemDataRole.TextAlignmentRole: Qt.AlignmentFlag.AlignCenter,
+            Qt.ItemDataRole.FontRole: number_font,
+        }
         self.furniture_count = {}  # 가구별 개수 저장
         self.furniture_order = []  # 가구 순서 저장 (가구 이름 리스트)
-        self.column_width_callback = None  # 컬럼 너비 복원 콜백
+        self._total_count = 0  # 총 개수 (목록이 바뀔 때만 다시 계산)
+        self._total_price = 0  # 총 가격 (목록이 바뀔 때만 다시 계산)
         self.number_label_callback = None  # 번호표 업데이트 콜백
     
-    def set_column_width_callback(self, callback):
-        """컬럼 너비 복원 콜백을 설정합니다."""
-        self.column_width_callback = callback
-    
     def set_number_label_callback(self, callback):
         """번호표 업데이트 콜백을 설정합니다."""
         self.number_label_callback = callback
     
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.furniture_order)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            furniture_info = self.furniture_count.get(self.get_furniture_name_at_row(row))
+            if furniture_info is None or column >= len(self.COLUMN_TEXT):
+                return None
+            return self.COLUMN_TEXT[column](row, furniture_info['furniture'], furniture_info['count'])
+        
+        if column == 0 and row < len(self.furniture_order):
+            return self._number_column_roles.get(role)
+        return None
+    
     def supportedDropActions(self):
         """지원하는 드롭 액션을 반환합니다."""
         return Qt.DropAction.MoveAction
     
     def flags(self, index):
-        """아이템의 플래그를 반환합니다."""
-        default_flags = super().flags(index)
+        """아이템의 플래그를 반환합니다. (편집 불가)"""
         if index.isValid():
-            return default_flags | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled
+            return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                    | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
         else:
-            return default_flags | Qt.ItemFlag.ItemIsDropEnabled
+            return Qt.ItemFlag.ItemIsDropEnabled
     
     def mimeTypes(self):
         """지원하는 MIME 타입을 반환합니다."""
@@ -443,6 +722,77 @@ class SelectedFurnitureTableModel(QStandardItemModel):
         return False
     
     def add_furniture(self, furniture: Furniture):
+        self._count_furniture(furniture)
+        self._update_totals()
+        self.refresh_model()
+    
+    def add_many(self, furnitures):
+        """여러 가구를 집계한 뒤 모델을 한 번만 새로고침합니다."""
+        for furniture in furnitures:
+            self._count_furniture(furniture)
+        self._update_totals()
+        self.refresh_model()
+    
+    def sync(self, furnitures):
+        """선택된 가구 목록을 주어진 가구들과 맞춥니다.
+        
+        전체를 다시 구성하지 않고 사라진 가구는 행 삭제, 새 가구는 행 삽입,
+        개수나 정보가 바뀐 가구는 dataChanged로만 반영합니다.
+        기존 가구의 순서(사용자가 변경한 순서 포함)는 유지하고 새 가구는 뒤에 추가합니다.
+        """
+        # 이름별 개수는 Counter로 한 번에 세고, 대표 가구는 처음 나온 가구를 사용 (dict는 삽입 순서 유지)
+        counts = Counter(furniture.name for furniture in furnitures)
+        first_by_name = {}
+        for furniture in furnitures:
+            first_by_name.setdefault(furniture.name, furniture)
+        new_order = list(first_by_name)
+        new_count = {
+            furniture_key: {'furniture': furniture, 'count': counts[furniture_key]}
+            for furniture_key, furniture in first_by_name.items()
+        }
+        
+        changed = False
+        
+        # 사라진 가구 행 삭제 (뒤에서부터 삭제하여 행 번호 유지)
+        for row in reversed(range(len(self.furniture_order))):
+            furniture_key = self.furniture_order[row]
+            if furniture_key not in new_count:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.furniture_order[row]
+                self.furniture_count.pop(furniture_key, None)
+                self.endRemoveRows()
+                changed = True
+        
+        # 개수나 정보가 바뀐 행 갱신
+        last_column = self.columnCount() - 1
+        for row, furniture_key in enumerate(self.furniture_order):
+            new_info = new_count[furniture_key]
+            current_info = self.furniture_count[furniture_key]
+            if (current_info['count'] != new_info['count']
+                    or current_info['furniture'] != new_info['furniture']):
+                self.furniture_count[furniture_key] = new_info
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+                changed = True
+        
+        # 새 가구 행 삽입
+        added = [furniture_key for furniture_key in new_order if furniture_key not in self.furniture_count]
+        if added:
+            first_row = len(self.furniture_order)
+            self.beginInsertRows(QModelIndex(), first_row, first_row + len(added) - 1)
+            for furniture_key in added:
+                self.furniture_count[furniture_key] = new_count[furniture_key]
+                self.furniture_order.append(furniture_key)
+            self.endInsertRows()
+            changed = True
+        
+        if changed:
+            self._update_totals()
+        
+        # 순서가 바뀌었으므로 번호표 업데이트
+        if changed and self.number_label_callback:
+            self.number_label_callback()
+    
+    def _count_furniture(self, furniture: Furniture):
         furniture_key = furniture.name
         if furniture_key in self.furniture_count:
             self.furniture_count[furniture_key]['count'] += 1
@@ -451,17 +801,13 @@ class SelectedFurnitureTableModel(QStandardItemModel):
             # 새 가구면 순서 리스트에 추가
             if furniture_key not in self.furniture_order:
                 self.furniture_order.append(furniture_key)
-        
-        self.refresh_model()
     
     def clear_furniture(self):
+        self.beginResetModel()
         self.furniture_count.clear()
         self.furniture_order.clear()
-        self.clear()
-        self.setHorizontalHeaderLabels([
-            "번호", "이름", "브랜드", "타입", "가격", "색상", 
-            "위치", "스타일", "크기(W×D×H)", "좌석높이", "설명", "링크", "작성자", "개수"
-        ])
+        self._update_totals()
+        self.endResetModel()
     
     def move_furniture_up(self, furniture_name: str):
         """가구를 한 단계 위로 이동"""
@@ -469,9 +815,10 @@ class SelectedFurnitureTableModel(QStandardItemModel):
             current_index = self.furniture_order.index(furniture_name)
             if current_index > 0:
                 # 위 항목과 위치 교환
-                self.furniture_order[current_index], self.furniture_order[current_index - 1] = \
-                    self.furniture_order[current_index - 1], self.furniture_order[current_index]
-                self.refresh_model()
+                new_order = list(self.furniture_order)
+                new_order[current_index], new_order[current_index - 1] = \
+                    new_order[current_index - 1], new_order[current_index]
+                self._apply_order(new_order)
                 return current_index - 1
         return -1
     
@@ -481,27 +828,28 @@ class SelectedFurnitureTableModel(QStandardItemModel):
             current_index = self.furniture_order.index(furniture_name)
             if current_index < len(self.furniture_order) - 1:
                 # 아래 항목과 위치 교환
-                self.furniture_order[current_index], self.furniture_order[current_index + 1] = \
-                    self.furniture_order[current_index + 1], self.furniture_order[current_index]
-                self.refresh_model()
+                new_order = list(self.furniture_order)
+                new_order[current_index], new_order[current_index + 1] = \
+                    new_order[current_index + 1], new_order[current_index]
+                self._apply_order(new_order)
                 return current_index + 1
         return -1
     
     def move_furniture_to_top(self, furniture_name: str):
         """가구를 맨 위로 이동"""
         if furniture_name in self.furniture_order:
-            self.furniture_order.remove(furniture_name)
-            self.furniture_order.insert(0, furniture_name)
-            self.refresh_model()
+            new_order = [name for name in self.furniture_order if name != furniture_name]
+            new_order.insert(0, furniture_name)
+            self._apply_order(new_order)
             return 0
         return -1
     
     def move_furniture_to_bottom(self, furniture_name: str):
         """가구를 맨 아래로 이동"""
         if furniture_name in self.furniture_order:
-            self.furniture_order.remove(furniture_name)
-            self.furniture_order.append(furniture_name)
-            self.refresh_model()
+            new_order = [name for name in self.furniture_order if name != furniture_name]
+            new_order.append(furniture_name)
+            self._apply_order(new_order)
             return len(self.furniture_order) - 1
         return -1
     
@@ -510,11 +858,12 @@ class SelectedFurnitureTableModel(QStandardItemModel):
         if furniture_name in self.furniture_order:
             old_position = self.furniture_order.index(furniture_name)
             if old_position != new_position and 0 <= new_position < len(self.furniture_order):
+                new_order = list(self.furniture_order)
                 # 기존 위치에서 제거
-                self.furniture_order.pop(old_position)
+                new_order.pop(old_position)
                 # 새 위치에 삽입
-                self.furniture_order.insert(new_position, furniture_name)
-                self.refresh_model()
+                new_order.insert(new_position, furniture_name)
+                self._apply_order(new_order)
                 return True
         return False
     
@@ -547,8 +896,8 @@ class SelectedFurnitureTableModel(QStandardItemModel):
         furniture_list.sort(key=key_func, reverse=not ascending)
         
         # 순서 리스트 업데이트
-        self.furniture_order = [item[0] for item in furniture_list]
-        self.refresh_model()
+        self._apply_order([item[0] for item in furniture_list],
+                          QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
     
     def get_furniture_name_at_row(self, row: int):
         """지정된 행의 가구 이름을 반환"""
@@ -556,83 +905,55 @@ class SelectedFurnitureTableModel(QStandardItemModel):
             return self.furniture_order[row]
         return None
     
+    def get_furniture_at_row(self, row: int):
+        """지정된 행의 Furniture 객체를 반환"""
+        furniture_info = self.furniture_count.get(self.get_furniture_name_at_row(row))
+        return furniture_info['furniture'] if furniture_info else None
+    
+    def _apply_order(self, new_order, hint=QAbstractItemModel.LayoutChangeHint.NoLayoutChangeHint):
+        """행 순서만 바꾸고 layoutChanged로 알립니다.
+        
+        모델을 리셋하지 않으므로 뷰가 행 전체를 다시 구성하지 않으며,
+        선택 등 영구 인덱스는 이동한 행을 따라갑니다.
+        정렬처럼 행 순서만 바뀌는 경우 hint로 VerticalSortHint를 전달합니다.
+        """
+        self.layoutAboutToBeChanged.emit([], hint)
+        old_order = self.furniture_order
+        self.furniture_order = new_order
+        
+        new_rows = {furniture_name: row for row, furniture_name in enumerate(new_order)}
+        for index in self.persistentIndexList():
+            new_row = new_rows.get(old_order[index.row()], index.row())
+            self.changePersistentIndex(index, self.index(new_row, index.column()))
+        self.layoutChanged.emit([], hint)
+        
+        # 순서가 바뀌었으므로 번호표 업데이트
+        if self.number_label_callback:
+            self.number_label_callback()
+    
     def refresh_model(self):
-        self.clear()
-        self.setHorizontalHeaderLabels([
-            "번호", "이름", "브랜드", "타입", "가격", "색상", 
-            "위치", "스타일", "크기(W×D×H)", "좌석높이", "설명", "링크", "작성자", "개수"
-        ])
-        
-        # 순서에 따라 가구별로 행 추가
-        for furniture_name in self.furniture_order:
-            if furniture_name in self.furniture_count:
-                furniture_info = self.furniture_count[furniture_name]
-                furniture = furniture_info['furniture']
-                count = furniture_info['count']
-                
-                # 각 컬럼에 맞는 데이터 생성 (14개 컬럼)
-                row_data = [
-                    str(self.furniture_order.index(furniture_name) + 1),  # 번호
-                    furniture.name or "",                                    # 이름
-                    furniture.brand or "",                                   # 브랜드
-                    furniture.type or "",                                    # 타입
-                    f"₩{furniture.price:,}" if furniture.price else "",      # 가격
-                    furniture.color or "",                                   # 색상
-                    ", ".join(furniture.locations) if furniture.locations else "",  # 위치
-                    ", ".join(furniture.styles) if furniture.styles else "",        # 스타일
-                    self._format_size(furniture.width, furniture.depth, furniture.height),  # 크기
-                    f"{furniture.seat_height}mm" if furniture.seat_height else "",   # 좌석높이
-                    self._truncate_text(furniture.description or "", 50),    # 설명
-                    furniture.link or "",                                    # 링크
-                    furniture.author or "",                                  # 작성자
-                    str(count)                                              # 개수
-                ]
-                
-                # QStandardItem 리스트 생성 및 추가
-                items = [QStandardItem(str(data)) for data in row_data]
-                
-                # 모든 아이템을 편집 불가능하게 설정
-                for i, item in enumerate(items):
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    # 번호 컬럼은 가운데 정렬 및 볼드 스타일
-                    if i == 0:  # 번호 컬럼
-                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        font = item.font()
-                        font.setBold(True)
-                        item.setFont(font)
-                
-                self.appendRow(items)
-        
-        # 모델 새로고침 후 컬럼 너비 복원
-        if self.column_width_callback:
-            self.column_width_callback()
+        # 셀 값은 data()에서 furniture_order/furniture_count로 계산하므로 뷰에 리셋만 알림
+        # (컬럼 수가 그대로이므로 헤더의 컬럼 너비는 리셋 후에도 유지됨)
+        self.beginResetModel()
+        self.endResetModel()
         
         # 번호표 업데이트
         if self.number_label_callback:
             self.number_label_callback()
     
-    def _format_size(self, width, depth, height):
-        """크기 정보를 포맷팅합니다."""
-        if width and depth and height:
-            return f"{width}×{depth}×{height}mm"
-        return ""
-    
-    def _truncate_text(self, text, max_length):
-        """텍스트를 지정된 길이로 자릅니다."""
-        if len(text) > max_length:
-            return text[:max_length] + "..."
-        return text
+    def _update_totals(self):
+        """가구 목록이 바뀐 뒤 총 개수와 총 가격을 한 번만 다시 계산합니다."""
+        self._total_count = sum(info['count'] for info in self.furniture_count.values())
+        self._total_price = sum(
+            info['furniture'].price * info['count']
+            for info in self.furniture_count.values()
+            if info['furniture'].price
+        )
     
     def get_total_price(self):
-        """전체 가구의 총 가격을 계산합니다."""
-        total = 0
-        for furniture_info in self.furniture_count.values():
-            furniture = furniture_info['furniture']
-            count = furniture_info['count']
-            if furniture.price:
-                total += furniture.price * count
-        return total
+        """전체 가구의 총 가격을 반환합니다. (목록 변경 시 미리 계산된 값)"""
+        return self._total_price
     
     def get_total_count(self):
-        """전체 가구의 총 개수를 계산합니다."""
-        return sum(info['count'] for info in self.furniture_count.values()) 
\ No newline at end of file
+        """전체 가구의 총 개수를 반환합니다. (목록 변경 시 미리 계산된 값)"""
+        return self._total_count 
\ No newline at end of file
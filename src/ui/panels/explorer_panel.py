@@ -3,14 +3,116 @@
 가구 탐색, 검색, 필터링 기능을 제공하는 ExplorerPanel 클래스를 포함합니다.
 """
 
-from PyQt6.QtCore import QMimeData, Qt, pyqtSignal
+import logging
+
+from PyQt6.QtCore import (QObject, QRunnable, QSortFilterProxyModel, Qt, QThreadPool, QTimer,
+                          pyqtSignal, pyqtSlot)
 from PyQt6.QtGui import QDrag
-from PyQt6.QtWidgets import (QComboBox, QGridLayout, QHBoxLayout, QLabel,
+from PyQt6.QtWidgets import (QComboBox, QGridLayout, QHBoxLayout, QHeaderView, QLabel,
                              QLineEdit, QTableView, QVBoxLayout, QWidget)
 
 from src.models.furniture import Furniture
 from src.services.supabase_client import SupabaseClient
-from .common import FurnitureTableModel
+from .common import THUMBNAIL_SIZE, FurnitureTableModel
+
+logger = logging.getLogger(__name__)
+
+
+class FurnitureListSignals(QObject):
+    """FurnitureListLoader의 결과를 GUI 스레드로 전달하는 시그널"""
+    furniture_loaded = pyqtSignal(list)
+    load_failed = pyqtSignal(str)
+
+
+class FurnitureListLoader(QRunnable):
+    """QThreadPool에서 최신 가구 목록을 조회하는 작업"""
+    
+    def __init__(self, supabase):
+        super().__init__()
+        self.supabase = supabase
+        self.signals = FurnitureListSignals()
+    
+    def run(self):
+        try:
+            rows = self.supabase.fetch_furniture_list()
+            self.signals.furniture_loaded.emit(rows)
+        except Exception as e:
+            try:
+                self.signals.load_failed.emit(str(e))
+            except RuntimeError:
+                # 패널이 이미 삭제된 경우
+                pass
+
+
+class FurnitureFilterProxy(QSortFilterProxyModel):
+    """탐색 패널의 필터 조건으로 가구 행을 걸러내는 프록시 모델
+    
+    filter_furniture에서 조건을 설정한 뒤 invalidateFilter를 한 번 호출하면
+    뷰가 한 번에 갱신됩니다. (행마다 setRowHidden을 호출하지 않음)
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 콤보박스 조건은 "전체"를 선택하면 None (제한 없음)
+        self.search_text = ""
+        self.brand = None
+        self.type = None
+        self.color = None
+        self.location = None
+        self.style = None
+        self.min_price = None
+        self.max_price = None
+    
+    def set_filters(self, search_text, brand, type_, min_price, max_price, color, location, style):
+        """필터 조건을 설정하고 필터링을 다시 수행합니다. 조건이 그대로이면 아무것도 하지 않습니다."""
+        if (search_text, brand, type_, min_price, max_price, color, location, style) == (
+                self.search_text, self.brand, self.type, self.min_price, self.max_price,
+                self.color, self.location, self.style):
+            return
+        
+        self.search_text = search_text
+        self.brand = brand
+        self.type = type_
+        self.min_price = min_price
+        self.max_price = max_price
+        self.color = color
+        self.location = location
+        self.style = style
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        furniture_items = self.sourceModel().furniture_items
+        if not 0 <= source_row < len(furniture_items):
+            return False
+        return self.matches(furniture_items[source_row])
+    
+    def matches(self, furniture):
+        """가구가 현재 필터 조건을 모두 만족하는지 확인합니다. 조건 하나라도 어긋나면 바로 False를 반환합니다."""
+        # 브랜드/타입/색상처럼 비교가 싼 조건부터 확인
+        if self.brand is not None and furniture.brand != self.brand:
+            return False
+        if self.type is not None and furniture.type != self.type:
+            return False
+        if self.color is not None and furniture.color != self.color:
+            return False
+        
+        # 가격 필터링 (None이면 제한 없음)
+        if self.min_price is not None and furniture.price < self.min_price:
+            return False
+        if self.max_price is not None and furniture.price > self.max_price:
+            return False
+        
+        # 위치/스타일 필터링
+        if self.location is not None and self.location not in furniture.locations:
+            return False
+        if self.style is not None and self.style not in furniture.styles:
+            return False
+        
+        # 검색어 필터링 (미리 계산된 소문자 텍스트 사용)
+        if self.search_text and self.search_text not in furniture.search_text:
+            return False
+        
+        return True
 
 
 class ExplorerPanel(QWidget):
@@ -18,10 +120,14 @@ class ExplorerPanel(QWidget):
     
     furniture_selected = pyqtSignal(Furniture)
     
+    FILTER_DEBOUNCE_MS = 150  # 텍스트 입력이 멈춘 뒤 필터링까지 대기 시간
+    THUMBNAIL_PREFETCH_MARGIN = 2  # 화면 위아래로 미리 썸네일을 로드할 행 수
+    FURNITURE_CACHE_MAX_AGE = 600  # 이 시간(초) 안에 저장된 가구 목록 캐시는 서버 조회 없이 사용
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("explorer_panel")
-        self.supabase = SupabaseClient()
+        self.supabase = SupabaseClient.get_instance()
         
         # 컬럼 너비를 저장하는 딕셔너리 (기본값)
         self.column_widths = {
@@ -31,6 +137,19 @@ class ExplorerPanel(QWidget):
             3: 100,  # 가격
         }
         
+        # 필터 콤보박스에 이미 추가된 옵션 (콤보박스와 함께 초기화하여 동기화 유지)
+        self._brands_seen: set[str] = set()
+        self._types_seen: set[str] = set()
+        self._colors_seen: set[str] = set()
+        self._locations_seen: set[str] = set()
+        self._styles_seen: set[str] = set()
+        
+        # 검색어/가격 입력은 키 입력마다 필터링하지 않고 입력이 멈춘 뒤 한 번만 필터링
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.filter_furniture)
+        
         self.setup_ui()
         self.load_furniture_data()  # 초기 데이터 로드
     
@@ -46,42 +165,19 @@ class ExplorerPanel(QWidget):
         # 검색 입력
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("가구 검색...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-        """)
-        self.search_input.textChanged.connect(self.filter_furniture)
+        self.search_input.setObjectName("furnitureSearch")
+        self.search_input.textChanged.connect(self._filter_timer.start)
         filter_layout.addWidget(self.search_input, 0, 0, 1, 3)
         
-        # 필터 스타일
-        filter_style = """
-            QComboBox {
-                padding: 6px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QLabel {
-                font-size: 14px;
-                color: #666;
-            }
-        """
-        
         # 첫 번째 행: 브랜드, 타입, 가격
         self.brand_filter = QComboBox()
         self.brand_filter.addItem("전체 브랜드")
-        self.brand_filter.setStyleSheet(filter_style)
         self.brand_filter.currentTextChanged.connect(self.filter_furniture)
         filter_layout.addWidget(QLabel("브랜드:"), 1, 0)
         filter_layout.addWidget(self.brand_filter, 1, 1)
         
         self.type_filter = QComboBox()
         self.type_filter.addItem("전체 타입")
-        self.type_filter.setStyleSheet(filter_style)
         self.type_filter.currentTextChanged.connect(self.filter_furniture)
         filter_layout.addWidget(QLabel("타입:"), 1, 2)
         filter_layout.addWidget(self.type_filter, 1, 3)
@@ -92,32 +188,16 @@ class ExplorerPanel(QWidget):
         
         self.min_price_input = QLineEdit()
         self.min_price_input.setPlaceholderText("최소 가격")
-        self.min_price_input.setStyleSheet("""
-            QLineEdit {
-                padding: 6px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 14px;
-                width: 80px;
-            }
-        """)
-        self.min_price_input.textChanged.connect(self.filter_furniture)
+        self.min_price_input.setObjectName("priceInput")
+        self.min_price_input.textChanged.connect(self._filter_timer.start)
         
         price_label = QLabel("~")
-        price_label.setStyleSheet("font-size: 14px; color: #666;")
+        price_label.setObjectName("priceRangeSeparator")
         
         self.max_price_input = QLineEdit()
         self.max_price_input.setPlaceholderText("최대 가격")
-        self.max_price_input.setStyleSheet("""
-            QLineEdit {
-                padding: 6px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 14px;
-                width: 80px;
-            }
-        """)
-        self.max_price_input.textChanged.connect(self.filter_furniture)
+        self.max_price_input.setObjectName("priceInput")
+        self.max_price_input.textChanged.connect(self._filter_timer.start)
         
         price_filter_layout.addWidget(self.min_price_input)
         price_filter_layout.addWidget(price_label)
@@ -132,21 +212,18 @@ class ExplorerPanel(QWidget):
         # 두 번째 행: 색상, 위치, 스타일
         self.color_filter = QComboBox()
         self.color_filter.addItem("전체 색상")
-        self.color_filter.setStyleSheet(filter_style)
         self.color_filter.currentTextChanged.connect(self.filter_furniture)
         filter_layout.addWidget(QLabel("색상:"), 2, 0)
         filter_layout.addWidget(self.color_filter, 2, 1)
         
         self.location_filter = QComboBox()
         self.location_filter.addItem("전체 위치")
-        self.location_filter.setStyleSheet(filter_style)
         self.location_filter.currentTextChanged.connect(self.filter_furniture)
         filter_layout.addWidget(QLabel("위치:"), 2, 2)
         filter_layout.addWidget(self.location_filter, 2, 3)
         
         self.style_filter = QComboBox()
         self.style_filter.addItem("전체 스타일")
-        self.style_filter.setStyleSheet(filter_style)
         self.style_filter.currentTextChanged.connect(self.filter_furniture)
         filter_layout.addWidget(QLabel("스타일:"), 2, 4)
         filter_layout.addWidget(self.style_filter, 2, 5)
@@ -155,20 +232,16 @@ class ExplorerPanel(QWidget):
         
         # 가구 목록 테이블
         self.furniture_model = FurnitureTableModel()
+        self.furniture_proxy = FurnitureFilterProxy(self)
+        self.furniture_proxy.setSourceModel(self.furniture_model)
         self.furniture_table = QTableView()
-        self.furniture_table.setModel(self.furniture_model)
-        self.furniture_table.setStyleSheet("""
-            QTableView {
-                border: none;
-                background-color: white;
-            }
-            QTableView::item {
-                border-bottom: 1px solid #eee;
-                padding: 5px;
-            }
-        """)
+        self.furniture_table.setModel(self.furniture_proxy)
+        self.furniture_table.setObjectName("furnitureTable")
         self.furniture_table.horizontalHeader().setStretchLastSection(True)
         self.furniture_table.verticalHeader().setVisible(False)
+        # 행 높이를 썸네일 크기로 고정하여 행마다 내용 크기를 계산하지 않도록 함
+        self.furniture_table.verticalHeader().setDefaultSectionSize(THUMBNAIL_SIZE[1])
+        self.furniture_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.furniture_table.setShowGrid(False)
         self.furniture_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.furniture_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
@@ -191,65 +264,40 @@ class ExplorerPanel(QWidget):
         # 셀 수정 비활성화
         self.furniture_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         
+        # 스크롤 시 화면에 곧 나타날 행의 썸네일을 미리 로드
+        self.furniture_table.verticalScrollBar().valueChanged.connect(self._schedule_visible_loads)
+        
         layout.addWidget(self.furniture_table)
     
     def load_furniture_data(self):
-        """Supabase에서 가구 데이터를 로드합니다."""
+        """가구 데이터를 로드합니다.
+        
+        디스크에 캐시된 목록이 있으면 바로 표시하고, 서버 조회는 백그라운드에서 진행하여 변경분만 반영합니다.
+        캐시가 FURNITURE_CACHE_MAX_AGE보다 최근에 저장되었으면 서버를 다시 조회하지 않습니다.
+        """
         try:
-            print("가구 데이터 로딩 시작...")
+            logger.debug("가구 데이터 로딩 시작...")
             
-            # Supabase에서 가구 데이터 조회 (모든 필드 선택)
-            response = self.supabase.client.table('furniture').select(
-                'id,name,brand,type,price,image_filename,description,link,color,locations,styles,width,depth,height,seat_height,author,created_at'
-            ).execute()
+            fresh_rows = self.supabase.get_cached_furniture_list(max_age=self.FURNITURE_CACHE_MAX_AGE)
+            if fresh_rows:
+                logger.debug("최근 캐시된 데이터 사용: %d개", len(fresh_rows))
+                self._populate_furniture(fresh_rows)
+                return
             
-            print(f"데이터 개수: {len(response.data) if response.data else 0}")
+            cached_rows = self.supabase.get_cached_furniture_list()
+            if cached_rows:
+                logger.debug("캐시된 데이터 개수: %d", len(cached_rows))
+                self._populate_furniture(cached_rows)
+                self._start_furniture_refresh()
+                return
             
-            if response.data:
-                # 기존 데이터 초기화
-                self.furniture_model.clear_furniture()
-                
-                # 필터 옵션 초기화
-                self.brand_filter.clear()
-                self.brand_filter.addItem("전체 브랜드")
-                self.type_filter.clear()
-                self.type_filter.addItem("전체 타입")
-                self.color_filter.clear()
-                self.color_filter.addItem("전체 색상")
-                self.location_filter.clear()
-                self.location_filter.addItem("전체 위치")
-                self.style_filter.clear()
-                self.style_filter.addItem("전체 스타일")
-                
-                # 데이터 추가
-                for item in response.data:
-                    try:
-                        # Furniture 객체 생성
-                        furniture = Furniture.from_dict(item)
-                        self.furniture_model.add_furniture(furniture)
-                        
-                        # 필터 옵션 업데이트
-                        if furniture.brand and furniture.brand not in [self.brand_filter.itemText(i) for i in range(1, self.brand_filter.count())]:
-                            self.brand_filter.addItem(furniture.brand)
-                        if furniture.type and furniture.type not in [self.type_filter.itemText(i) for i in range(1, self.type_filter.count())]:
-                            self.type_filter.addItem(furniture.type)
-                        if furniture.color and furniture.color not in [self.color_filter.itemText(i) for i in range(1, self.color_filter.count())]:
-                            self.color_filter.addItem(furniture.color)
-                        for location in furniture.locations:
-                            if location not in [self.location_filter.itemText(i) for i in range(1, self.location_filter.count())]:
-                                self.location_filter.addItem(location)
-                        for style in furniture.styles:
-                            if style not in [self.style_filter.itemText(i) for i in range(1, self.style_filter.count())]:
-                                self.style_filter.addItem(style)
-                            
-                    except Exception as e:
-                        print(f"개별 가구 데이터 처리 중 오류 발생: {str(e)}")
-                        print(f"문제가 된 데이터: {item}")
-                        import traceback
-                        print(traceback.format_exc())
-                        continue
-                
-                print(f"총 {self.furniture_model.rowCount()}개의 가구 데이터가 로드되었습니다.")
+            # 캐시가 없으면 Supabase에서 가구 데이터 조회 (모든 필드 선택)
+            rows = self.supabase.fetch_furniture_list()
+            
+            logger.debug("데이터 개수: %d", len(rows) if rows else 0)
+            
+            if rows:
+                self._populate_furniture(rows)
             else:
                 print("가구 데이터가 없습니다.")
             
@@ -258,111 +306,176 @@ class ExplorerPanel(QWidget):
             import traceback
             print(traceback.format_exc())
     
-    def __del__(self):
-        """패널이 삭제될 때 로딩 중인 스레드 정리"""
-        if hasattr(self, 'furniture_model'):
-            self.furniture_model.clear_furniture()
+    def _populate_furniture(self, rows):
+        """가구 목록과 필터 옵션을 처음부터 다시 구성합니다."""
+        # 기존 데이터 초기화
+        self.furniture_model.clear_furniture()
+        
+        # 필터 옵션 초기화
+        self.brand_filter.clear()
+        self.brand_filter.addItem("전체 브랜드")
+        self._brands_seen.clear()
+        self.type_filter.clear()
+        self.type_filter.addItem("전체 타입")
+        self._types_seen.clear()
+        self.color_filter.clear()
+        self.color_filter.addItem("전체 색상")
+        self._colors_seen.clear()
+        self.location_filter.clear()
+        self.location_filter.addItem("전체 위치")
+        self._locations_seen.clear()
+        self.style_filter.clear()
+        self.style_filter.addItem("전체 스타일")
+        self._styles_seen.clear()
+        
+        furniture_list = self._furniture_from_rows(rows)
+        
+        # 모든 행을 한 번에 추가하고 화면에 보이는 행의 썸네일만 로드
+        self.furniture_model.add_furniture_list(furniture_list)
+        self._add_filter_options(furniture_list)
+        self._schedule_visible_loads()
+        
+        logger.debug("총 %d개의 가구 데이터가 로드되었습니다.", self.furniture_model.rowCount())
+    
+    def _furniture_from_rows(self, rows):
+        """조회 결과를 Furniture 객체 목록으로 변환합니다. 변환할 수 없는 항목은 건너뜁니다."""
+        furniture_list = []
+        for item in rows:
+            try:
+                furniture_list.append(Furniture.from_dict(item))
+            except Exception as e:
+                print(f"개별 가구 데이터 처리 중 오류 발생: {str(e)}")
+                print(f"문제가 된 데이터: {item}")
+                import traceback
+                print(traceback.format_exc())
+        return furniture_list
+    
+    def _add_filter_options(self, furniture_list):
+        """아직 없는 필터 옵션만 콤보박스에 추가합니다. (집합으로 중복 확인)"""
+        for furniture in furniture_list:
+            if furniture.brand and furniture.brand not in self._brands_seen:
+                self._brands_seen.add(furniture.brand)
+                self.brand_filter.addItem(furniture.brand)
+            if furniture.type and furniture.type not in self._types_seen:
+                self._types_seen.add(furniture.type)
+                self.type_filter.addItem(furniture.type)
+            if furniture.color and furniture.color not in self._colors_seen:
+                self._colors_seen.add(furniture.color)
+                self.color_filter.addItem(furniture.color)
+            for location in furniture.locations:
+                if location not in self._locations_seen:
+                    self._locations_seen.add(location)
+                    self.location_filter.addItem(location)
+            for style in furniture.styles:
+                if style not in self._styles_seen:
+                    self._styles_seen.add(style)
+                    self.style_filter.addItem(style)
+    
+    def _schedule_visible_loads(self, *args):
+        """화면에 보이는 행과 위아래 여유 행의 썸네일 로드를 요청합니다."""
+        row_count = self.furniture_proxy.rowCount()
+        viewport = self.furniture_table.viewport()
+        if row_count == 0 or not viewport.isVisible():
+            return
+        
+        first = self.furniture_table.rowAt(0)
+        last = self.furniture_table.rowAt(viewport.height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            # 마지막 행 아래에 빈 공간이 있는 경우
+            last = row_count - 1
+        
+        margin = self.THUMBNAIL_PREFETCH_MARGIN
+        source_rows = [
+            self.furniture_proxy.mapToSource(self.furniture_proxy.index(proxy_row, 0)).row()
+            for proxy_row in range(max(first - margin, 0), min(last + margin, row_count - 1) + 1)
+        ]
+        self.furniture_model.load_thumbnails_for_rows(source_rows)
+    
+    def _start_furniture_refresh(self):
+        """서버에서 최신 가구 목록을 백그라운드로 조회합니다."""
+        loader = FurnitureListLoader(self.supabase)
+        loader.signals.furniture_loaded.connect(self.on_furniture_refreshed)
+        loader.signals.load_failed.connect(self.on_furniture_refresh_failed)
+        QThreadPool.globalInstance().start(loader)
+    
+    @pyqtSlot(list)
+    def on_furniture_refreshed(self, rows):
+        """최신 가구 목록을 ID 기준으로 비교하여 변경된 행만 갱신합니다."""
+        furniture_list = self._furniture_from_rows(rows)
+        self.furniture_model.update_furniture_list(furniture_list)
+        self._add_filter_options(furniture_list)
+        logger.debug("가구 데이터 갱신 완료: 총 %d개", self.furniture_model.rowCount())
+    
+    @pyqtSlot(str)
+    def on_furniture_refresh_failed(self, message):
+        """백그라운드 조회 실패 시 캐시된 목록을 그대로 유지합니다."""
+        print(f"가구 데이터 갱신 중 오류 발생: {message}")
+    
+    def showEvent(self, event):
+        """패널이 표시될 때마다 화면에 보이는 행의 썸네일을 한꺼번에 요청합니다.
+        
+        생성 시점(load_furniture_data)에는 뷰가 아직 보이지 않아 로드할 행을 계산할 수 없으므로,
+        레이아웃이 끝난 뒤 화면에 보이는 행을 스레드 풀에 동시에 제출합니다.
+        다시 표시될 때는 이미 로드되었거나 로드 중인 썸네일은 건너뛰고, 숨겨진 동안
+        캐시에서 밀려난 썸네일만 다시 요청합니다.
+        """
+        super().showEvent(event)
+        QTimer.singleShot(0, self._schedule_visible_loads)
     
     def filter_furniture(self):
         """가구 목록을 필터링합니다."""
+        # 콤보박스 변경으로 바로 필터링하는 경우 대기 중인 입력 필터링은 중복이므로 취소
+        self._filter_timer.stop()
         search_text = self.search_input.text().lower()
-        selected_brand = self.brand_filter.currentText()
-        selected_type = self.type_filter.currentText()
-        selected_color = self.color_filter.currentText()
-        selected_location = self.location_filter.currentText()
-        selected_style = self.style_filter.currentText()
-        
-        # 가격 필터 값 가져오기
-        min_price = self.min_price_input.text().strip()
-        max_price = self.max_price_input.text().strip()
-        
-        for row in range(self.furniture_model.rowCount()):
-            furniture = self.furniture_model.furniture_items[row]
-            show_item = True
-            
-            # 검색어 필터링
-            if search_text:
-                if (search_text not in furniture.name.lower() and 
-                    search_text not in furniture.brand.lower() and 
-                    search_text not in furniture.description.lower()):
-                    show_item = False
-            
-            # 브랜드 필터링
-            if selected_brand != "전체 브랜드" and furniture.brand != selected_brand:
-                show_item = False
-            
-            # 타입 필터링
-            if selected_type != "전체 타입" and furniture.type != selected_type:
-                show_item = False
-            
-            # 가격 필터링
-            price = furniture.price
-            if min_price:
-                try:
-                    min_val = int(min_price)
-                    if price < min_val:
-                        show_item = False
-                except ValueError:
-                    pass
-            if max_price:
-                try:
-                    max_val = int(max_price)
-                    if price > max_val:
-                        show_item = False
-                except ValueError:
-                    pass
-            
-            # 색상 필터링
-            if selected_color != "전체 색상" and furniture.color != selected_color:
-                show_item = False
-            
-            # 위치 필터링
-            if selected_location != "전체 위치" and selected_location not in furniture.locations:
-                show_item = False
-            
-            # 스타일 필터링
-            if selected_style != "전체 스타일" and selected_style not in furniture.styles:
-                show_item = False
-            
-            # 아이템 표시/숨김
-            self.furniture_table.setRowHidden(row, not show_item)
+        selected_brand = self._selected_option(self.brand_filter)
+        selected_type = self._selected_option(self.type_filter)
+        selected_color = self._selected_option(self.color_filter)
+        selected_location = self._selected_option(self.location_filter)
+        selected_style = self._selected_option(self.style_filter)
+        
+        # 가격 필터 값은 행마다 파싱하지 않고 한 번만 정수로 변환
+        min_price = self._parse_price_bound(self.min_price_input.text())
+        max_price = self._parse_price_bound(self.max_price_input.text())
+        
+        # 프록시 모델에 조건을 설정하면 한 번의 필터링으로 뷰가 갱신됨
+        self.furniture_proxy.set_filters(
+            search_text, selected_brand, selected_type,
+            min_price, max_price, selected_color, selected_location, selected_style
+        )
+        # 필터링으로 화면에 새로 보이게 된 행의 썸네일 로드
+        self._schedule_visible_loads()
+    
+    @staticmethod
+    def _selected_option(combo):
+        """콤보박스 선택값을 반환합니다. 첫 항목("전체 ...")이 선택되어 있으면 None을 반환합니다."""
+        if combo.currentIndex() <= 0:
+            return None
+        return combo.currentText()
+    
+    @staticmethod
+    def _parse_price_bound(text):
+        """가격 입력값을 정수로 변환합니다. 비어 있거나 숫자가 아니면 None을 반환합니다."""
+        text = text.strip()
+        if not text:
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            return None
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             # 선택된 행의 인덱스 가져오기
             index = self.furniture_table.indexAt(event.pos())
             if index.isValid():
-                # 해당 행의 가구 데이터 가져오기
-                furniture = self.furniture_model.furniture_items[index.row()]
+                # 해당 행의 가구 데이터 가져오기 (필터 프록시 인덱스를 원본 모델 행으로 변환)
+                source_index = self.furniture_proxy.mapToSource(index)
                 
-                # 드래그 시작
+                # 테이블 드래그와 같은 MIME 데이터 사용 (가구 ID만 전달하고 원본 이미지를 미리 로드)
                 drag = QDrag(self)
-                mime_data = QMimeData()
-                
-                # 드래그 데이터 설정
-                furniture_data = {
-                    'id': furniture.id,
-                    'name': furniture.name,
-                    'image_filename': furniture.image_filename,
-                    'price': furniture.price,
-                    'brand': furniture.brand,
-                    'type': furniture.type,
-                    'description': furniture.description,
-                    'link': furniture.link,
-                    'color': furniture.color,
-                    'locations': furniture.locations,
-                    'styles': furniture.styles,
-                    'width': furniture.width,
-                    'depth': furniture.depth,
-                    'height': furniture.height,
-                    'seat_height': furniture.seat_height,
-                    'author': furniture.author,
-                    'created_at': furniture.created_at
-                }
-                
-                # MIME 데이터 설정
-                mime_data.setData("application/x-furniture", str(furniture_data).encode())
-                drag.setMimeData(mime_data)
+                drag.setMimeData(self.furniture_model.mimeData([source_index]))
                 
                 # 드래그 시작
                 drag.exec() 
@@ -0,0 +1,147 @@
+"""앱 전역 스타일시트
+
+패널과 위젯의 고정 스타일을 objectName 선택자로 모아 둔 QSS입니다.
+main()에서 QApplication에 한 번만 적용하므로 위젯을 생성할 때마다 스타일시트를 파싱하지 않습니다.
+"""
+
+APP_STYLESHEET = """
+/* 탐색 패널 - 가구 항목 위젯 */
+QLabel#furnitureThumbnail {
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    background-color: #f8f9fa;
+}
+QLabel#furnitureName {
+    font-weight: bold;
+    font-size: 15px;
+    color: #2C3E50;
+}
+QLabel#furnitureMeta {
+    font-size: 14px;
+    color: #666;
+}
+QLabel#furniturePrice {
+    font-size: 15px;
+    color: #2C3E50;
+    font-weight: bold;
+}
+
+/* 탐색 패널 - 검색 및 필터 */
+QLineEdit#furnitureSearch {
+    padding: 8px;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    font-size: 14px;
+}
+QWidget#explorer_panel QComboBox {
+    padding: 6px;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    font-size: 14px;
+}
+QLineEdit#priceInput {
+    padding: 6px;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    font-size: 14px;
+    width: 80px;
+}
+QLabel#priceRangeSeparator {
+    font-size: 14px;
+    color: #666;
+}
+
+/* 탐색 패널 - 가구 목록 테이블 */
+QTableView#furnitureTable {
+    border: none;
+    background-color: white;
+}
+QTableView#furnitureTable::item {
+    border-bottom: 1px solid #eee;
+    padding: 5px;
+}
+
+/* 하단 패널 - 선택된 가구 테이블 */
+QTableView#selectedFurnitureTable {
+    border: 1px solid #ddd;
+    background-color: white;
+    gridline-color: #eee;
+    selection-background-color: #e3f2fd;
+    selection-color: #333;
+}
+QTableView#selectedFurnitureTable::item {
+    padding: 8px;
+    border: none;
+}
+QTableView#selectedFurnitureTable::item:selected {
+    background-color: #e3f2fd;
+    color: #333;
+}
+QTableView#selectedFurnitureTable QHeaderView::section {
+    background-color: #f5f5f5;
+    padding: 8px;
+    border: 1px solid #ddd;
+    border-left: none;
+    font-weight: bold;
+    color: #333;
+}
+QTableView#selectedFurnitureTable QHeaderView::section:first {
+    border-left: 1px solid #ddd;
+}
+
+/* 하단 패널 - 순서 변경 컨트롤 (하위 위젯에도 같은 배경/테두리가 적용됨) */
+QWidget#orderControl, QWidget#orderControl QWidget {
+    background-color: #f8f9fa;
+    border: 1px solid #dee2e6;
+    border-radius: 4px;
+    margin: 2px 0;
+}
+QWidget#orderControl QLabel#orderLabel {
+    font-weight: bold;
+    color: #495057;
+    border: none;
+    background: none;
+}
+QWidget#orderControl QPushButton {
+    background-color: #007bff;
+    border: 1px solid #007bff;
+    color: white;
+    border-radius: 3px;
+    font-size: 12px;
+    font-weight: bold;
+    padding: 2px 8px;
+}
+QWidget#orderControl QPushButton:hover {
+    background-color: #0056b3;
+    border-color: #0056b3;
+}
+QWidget#orderControl QPushButton:pressed {
+    background-color: #004085;
+    border-color: #004085;
+}
+QWidget#orderControl QPushButton:disabled {
+    background-color: #6c757d;
+    border-color: #6c757d;
+    color: #ffffff;
+}
+
+/* 하단 패널 - 총계 영역 (하위 위젯에도 같은 배경/테두리가 적용됨) */
+QWidget#selectedSummary, QWidget#selectedSummary QWidget {
+    background-color: #f8f9fa;
+    border: 1px solid #dee2e6;
+    border-radius: 4px;
+    margin: 5px 0;
+}
+QWidget#selectedSummary QLabel {
+    font-weight: bold;
+    font-size: 14px;
+    color: #495057;
+    border: none;
+}
+QFrame#selectedSeparator {
+    color: #ddd;
+    background-color: #ddd;
+    height: 1px;
+    margin: 5px 0;
+}
+"""
@@ -53,6 +53,23 @@ class ImageAdjuster:
             
         return ImageAdjuster.calculate_temperature_rgb(temperature) # 그 외 직접 계산
     
+    @staticmethod
+    def qimage_as_ndarray(image):
+        """QImage 내부 버퍼를 복사 없이 (높이, 너비, 4) 형태의 NumPy 배열 뷰로 반환합니다.
+        
+        32비트 포맷(메모리상 BGRA 순서)만 지원하며, 반환된 배열에 쓰면 QImage에 바로 반영됩니다.
+        """
+        import numpy as np
+        
+        if image.depth() != 32:
+            raise ValueError(f"32비트 QImage만 지원합니다: depth={image.depth()}")
+        
+        ptr = image.bits()  # 쓰기 가능한 버퍼 (필요 시 QImage가 detach됨)
+        ptr.setsize(image.sizeInBytes())
+        # 행 패딩(bytesPerLine)을 고려하여 뷰를 만든 뒤 실제 픽셀 영역만 잘라냄
+        rows = np.frombuffer(ptr, dtype=np.uint8).reshape(image.height(), image.bytesPerLine())
+        return rows[:, :image.width() * 4].reshape(image.height(), image.width(), 4)
+    
     @staticmethod
     def apply_effects(pixmap, color_temp, brightness, saturation):
         """이미지에 색온도, 밝기, 채도 효과를 적용합니다. NumPy 사용 가능 시 벡터화 처리합니다."""
@@ -162,15 +179,12 @@ class ImageAdjuster:
             if not ImageAdjuster._use_numpy:
                 raise ImportError("NumPy 사용 불가")
             
-            image = pixmap.toImage()
-            width = image.width()
-            height = image.height()
-            original_format = image.format()
+            image = pixmap.toImage()  # QImage로 변환 (Deep Copy)
+            if image.depth() != 32:
+                image = image.convertToFormat(QImage.Format.Format_ARGB32)
             
-            # 이미지 데이터를 NumPy 배열로 변환
-            ptr = image.constBits()
-            ptr.setsize(image.sizeInBytes())
-            arr = np.array(ptr).reshape(height, width, 4).copy()
+            # 이미지 버퍼를 복사 없이 NumPy 뷰로 접근 (수정 사항이 image에 바로 반영됨)
+            arr = ImageAdjuster.qimage_as_ndarray(image)
             
             # 밝기 조정 계수
             brightness_factor = brightness / 100.0
@@ -182,9 +196,7 @@ class ImageAdjuster:
             arr[:, :, 2] = np.clip(arr[:, :, 2].astype(np.float32) * brightness_factor, 0, 255).astype(np.uint8)  # R
             # 알파 채널(arr[:, :, 3])은 변경하지 않음
             
-            # 결과 이미지 생성
-            result_image = QImage(arr.data, width, height, image.bytesPerLine(), original_format)
-            return QPixmap.fromImage(result_image).copy()
+            return QPixmap.fromImage(image)
             
         except Exception as e:
             print(f"[ImageAdjuster] 밝기 조정 중 오류 (NumPy 방식): {e}")
@@ -232,15 +244,11 @@ class ImageAdjuster:
             import numpy as np
             
             image = pixmap.toImage() # QImage로 변환 (Deep Copy)
-            original_format = image.format() # 원본 포맷 유지
-            width = image.width()
-            height = image.height()
+            if image.depth() != 32:
+                image = image.convertToFormat(QImage.Format.Format_ARGB32)
             
-            # QImage의 constBits()를 사용하여 메모리 직접 접근 후 NumPy 배열로 변환 (읽기 전용)
-            ptr = image.constBits()
-            ptr.setsize(image.sizeInBytes())
-            # 변경 가능한 복사본 생성
-            arr = np.array(ptr).reshape(height, width, 4).copy()
+            # 이미지 버퍼를 복사 없이 NumPy 뷰로 접근 (수정 사항이 image에 바로 반영됨)
+            arr = ImageAdjuster.qimage_as_ndarray(image)
             
             alpha = arr[:, :, 3].copy() # 알파 채널
             transparent_mask = (alpha == 0) # 완전 투명 픽셀 마스크
@@ -295,14 +303,8 @@ class ImageAdjuster:
             arr[:, :, 2] = r
             arr[:, :, 3] = alpha  # 원본 알파 채널 유지
             
-            # QImage 생성 (원본 포맷 유지)
-            result_image = QImage(arr.data, width, height, image.bytesPerLine(), original_format)
-            
-            # 고품질 변환 설정
-            result_pixmap = QPixmap.fromImage(result_image)
-            
-            # 항상 복사본 반환
-            return result_pixmap.copy()
+            # 버퍼를 직접 수정했으므로 image를 그대로 변환 (원본 포맷 유지)
+            return QPixmap.fromImage(image)
             
         except Exception as e:
             import traceback
@@ -3,7 +3,7 @@
 배경 이미지 표시 기능을 제공하는 캔버스 영역입니다.
 """
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QEvent, Qt
 from PyQt6.QtGui import QPainter, QPen, QColor
 from PyQt6.QtWidgets import QWidget
 
@@ -14,6 +14,20 @@ class CanvasArea(QWidget):
     def __init__(self, parent_canvas=None):
         super().__init__()
         self.parent_canvas = parent_canvas
+        self._apply_opaque_paint_attributes()
+    
+    def _apply_opaque_paint_attributes(self):
+        """paintEvent가 배경 이미지 또는 흰색으로 영역 전체를 직접 채우므로
+        Qt가 매 프레임 시스템 배경을 먼저 지우는 작업을 생략하도록 설정합니다."""
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+    
+    def event(self, event):
+        """스타일시트 polish 과정에서 불투명 속성이 해제되므로 polish 이후 다시 설정합니다."""
+        result = super().event(event)
+        if event.type() in (QEvent.Type.Polish, QEvent.Type.StyleChange):
+            self._apply_opaque_paint_attributes()
+        return result
     
     def paintEvent(self, event):
         """배경 이미지와 함께 캔버스 영역을 그립니다."""
@@ -129,8 +129,8 @@ class FurnitureItem(QWidget):
     def __init__(self, furniture: Furniture, parent=None):
         super().__init__(parent)
         self.furniture = furniture
-        self.image_service = ImageService()
-        self.supabase = SupabaseClient()
+        self.image_service = ImageService.get_instance()
+        self.supabase = SupabaseClient.get_instance()
         
         if not ImageAdjuster._initialized:
             ImageAdjuster.initialize()
@@ -170,6 +170,10 @@ class FurnitureItem(QWidget):
         self.update_timer.timeout.connect(self.apply_pending_update)
         
         self.is_selected = False
+        
+        # paintEvent용 스케일 결과 캐시 (get_scaled_pixmap 참고)
+        self._scaled_pixmap: Union[QPixmap, None] = None
+        self._scaled_pixmap_key = None
 
         # 이미지 로드 및 관련 속성 초기화
         loaded_original_candidate = self.load_image()
@@ -264,10 +268,13 @@ class FurnitureItem(QWidget):
            반환된 QPixmap은 __init__에서 self.original_pixmap의 후보가 됩니다.
         """
         try:
-            image_data = self.supabase.get_furniture_image(self.furniture.image_filename)
-            downloaded_pixmap = self.image_service.download_and_cache_image(
-                image_data, self.furniture.image_filename
-            )
+            # 탐색 패널 로딩 시 이미 디코딩된 이미지가 있으면 다운로드/디코딩 없이 재사용
+            downloaded_pixmap = self.image_service.get_cached_pixmap(self.furniture.image_filename)
+            if downloaded_pixmap is None or downloaded_pixmap.isNull():
+                image_data = self.supabase.get_furniture_image(self.furniture.image_filename)
+                downloaded_pixmap = self.image_service.download_and_cache_image(
+                    image_data, self.furniture.image_filename
+                )
 
             if downloaded_pixmap and not downloaded_pixmap.isNull():
                 self.pixmap = downloaded_pixmap.copy()
@@ -334,29 +341,43 @@ class FurnitureItem(QWidget):
         self.update_resize_handles()
         return loaded_pixmap_for_original # 계산된 original_pixmap 후보를 반환
 
+    def get_scaled_pixmap(self) -> QPixmap:
+        """현재 위젯 크기에 맞게 스케일된 pixmap을 반환합니다.
+        
+        선택/이동처럼 크기와 이미지가 그대로인 다시 그리기에서는 SmoothTransformation을
+        반복하지 않도록 (pixmap cacheKey, 크기, 비율 유지 여부) 기준으로 결과를 캐시합니다.
+        """
+        cache_key = (self.pixmap.cacheKey(), self.width(), self.height(), self.maintain_aspect_ratio)
+        if self._scaled_pixmap_key != cache_key:
+            if self.pixmap.size() == self.size():
+                # 크기가 같으면 리샘플링 없이 원본 사용
+                self._scaled_pixmap = self.pixmap
+                self._scaled_pixmap_key = cache_key
+                return self._scaled_pixmap
+            aspect_mode = (Qt.AspectRatioMode.KeepAspectRatio if self.maintain_aspect_ratio
+                           else Qt.AspectRatioMode.IgnoreAspectRatio)
+            self._scaled_pixmap = self.pixmap.scaled(
+                self.size(),
+                aspect_mode,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._scaled_pixmap_key = cache_key
+        return self._scaled_pixmap
+    
     def paintEvent(self, event):
         """위젯을 그릴 때 호출되는 메서드입니다."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 이미지 그리기 (비율 유지 여부에 따라 다르게 처리)
+        scaled_pixmap = self.get_scaled_pixmap()
         if self.maintain_aspect_ratio:
-            # 비율 유지하면서 그리기
-            scaled_pixmap = self.pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+            # 비율 유지하면서 가운데 정렬
             x = (self.width() - scaled_pixmap.width()) // 2
             y = (self.height() - scaled_pixmap.height()) // 2
             painter.drawPixmap(x, y, scaled_pixmap)
         else:
             # 비율 무시하고 꽉 채우기
-            scaled_pixmap = self.pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             painter.drawPixmap(0, 0, scaled_pixmap)
         
         # 선택된 경우에만 테두리와 리사이즈 핸들 그리기
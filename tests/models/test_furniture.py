@@ -1,6 +1,6 @@
 import pytest
 
-from src.models.furniture import Furniture
+from src.models.furniture import DESCRIPTION_SUMMARY_LENGTH, Furniture
 
 
 def test_furniture_from_dict_success():
@@ -88,4 +88,56 @@ def test_furniture_from_dict_default_values():
     assert furniture.height == 0
     assert furniture.seat_height is None
     assert furniture.author == ""
-    assert furniture.created_at == "" 
\ No newline at end of file
+    assert furniture.created_at == "" 
+
+def test_furniture_search_text():
+    """search_text가 이름, 브랜드, 설명을 소문자로 포함하고 한 번만 계산되는지 테스트합니다."""
+    furniture = Furniture(
+        id='1', brand='BrandX', name='Oak Table', image_filename='table.png', price=100,
+        type='Table', description='Solid WOOD'
+    )
+    
+    assert 'oak table' in furniture.search_text
+    assert 'brandx' in furniture.search_text
+    assert 'solid wood' in furniture.search_text
+    assert 'search_text' in furniture.__dict__  # 캐시됨
+
+def test_furniture_mime_payload():
+    """mime_payload가 가구 ID를 인코딩한 값이며 한 번만 생성되는지 테스트합니다."""
+    furniture = Furniture(
+        id='abc-1', brand='BrandX', name='Oak Table', image_filename='table.png', price=100, type='Table'
+    )
+    
+    assert furniture.mime_payload == b'abc-1'
+    assert furniture.mime_payload is furniture.mime_payload
+
+def test_furniture_price_text():
+    """price_text가 천 단위 구분 기호가 있는 원화 문자열이며 한 번만 생성되는지 테스트합니다."""
+    furniture = Furniture(
+        id='abc-1', brand='BrandX', name='Oak Table', image_filename='table.png', price=1234567, type='Table'
+    )
+    
+    assert furniture.price_text == "₩1,234,567"
+    assert furniture.price_text is furniture.price_text
+
+def test_furniture_display_texts():
+    """위치/스타일/크기 표시 문자열이 올바르게 만들어지는지 테스트합니다."""
+    furniture = Furniture(
+        id='abc-1', brand='BrandX', name='Oak Table', image_filename='table.png', price=100, type='Table',
+        locations=['Living Room', 'Kitchen'], styles=[], width=120, depth=80, height=75
+    )
+    
+    assert furniture.locations_text == "Living Room, Kitchen"
+    assert furniture.styles_text == ""
+    assert furniture.size_text == "120×80×75mm"
+    assert furniture.locations_text is furniture.locations_text
+    assert furniture.seat_height_text == ""
+
+def test_furniture_description_summary():
+    """설명 요약이 최대 길이까지만 표시되는지 테스트합니다."""
+    short = Furniture(id='1', brand='B', name='N', image_filename='a.png', price=1, type='T', description='짧은 설명')
+    long = Furniture(id='2', brand='B', name='N', image_filename='a.png', price=1, type='T', description='가' * 60)
+    
+    assert short.description_summary == '짧은 설명'
+    assert long.description_summary == '가' * DESCRIPTION_SUMMARY_LENGTH + '...'
+
@@ -1,7 +1,7 @@
 import os
 
 import pytest
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QBuffer, QIODevice, QSize
 from PyQt6.QtGui import QPixmap, QImage, QColor
 
 from src.services.image_service import ImageService
@@ -15,6 +15,9 @@ def image_service(tmp_path):
     test_cache_dir = tmp_path / ".test_image_cache"
     os.makedirs(test_cache_dir, exist_ok=True)
     service.cache_dir = str(test_cache_dir)  # ImageService의 cache_dir을 임시 경로로 설정
+    # 인스턴스 간 공유되는 디코딩 캐시가 테스트 사이에 남지 않도록 초기화
+    ImageService._decoded_cache.clear()
+    ImageService._decoded_cache_bytes = 0
     yield service
     # tmp_path는 pytest가 자동으로 정리하므로 shutil.rmtree는 필요 없음
 
@@ -27,7 +30,7 @@ def dummy_pixmap(qtbot):
 
 @pytest.fixture
 def large_dummy_pixmap(qtbot):
-    """테스트용 큰 QPixmap 객체를 생성합니다 (optimize_image 테스트용)."""
+    """테스트용 큰 QPixmap 객체를 생성합니다 (decode_image 테스트용)."""
     image = QImage(2000, 2000, QImage.Format.Format_RGB32)
     image.fill(QColor("blue"))
     return QPixmap.fromImage(image)
@@ -75,23 +78,21 @@ def test_is_image_cached_file_exists(image_service):
         f.write("dummy content")
     assert image_service.is_image_cached(filename)
 
-def test_optimize_image_small_image(image_service, dummy_pixmap):
-    """작은 이미지는 원본 크기 그대로 반환하는지 테스트합니다."""
-    optimized = image_service.optimize_image(dummy_pixmap)
-    assert optimized.size() == dummy_pixmap.size()
+def test_decode_image_small_image(image_service, dummy_pixmap):
+    """작은 이미지는 원본 크기 그대로 디코딩하는지 테스트합니다."""
+    decoded = image_service.decode_image(image_service.pixmap_to_bytes(dummy_pixmap))
+    assert decoded.size() == dummy_pixmap.size()
 
-def test_optimize_image_large_image(image_service, large_dummy_pixmap):
-    """큰 이미지는 최대 크기(1920) 이하로 조절되어 반환되는지 테스트합니다."""
-    optimized = image_service.optimize_image(large_dummy_pixmap)
-    assert optimized.width() <= 1920
-    assert optimized.height() <= 1920
-    assert optimized.width() == 1920 or optimized.height() == 1920 # 둘 중 하나는 1920이어야 함 (비율 유지)
+def test_decode_image_large_image(image_service, large_dummy_pixmap):
+    """큰 이미지는 최대 크기(1920) 이하로 조절되어 디코딩되는지 테스트합니다."""
+    decoded = image_service.decode_image(image_service.pixmap_to_bytes(large_dummy_pixmap))
+    assert decoded.width() <= 1920
+    assert decoded.height() <= 1920
+    assert decoded.width() == 1920 or decoded.height() == 1920 # 둘 중 하나는 1920이어야 함 (비율 유지)
 
-def test_optimize_image_null_pixmap(image_service):
-    """입력 QPixmap이 null일 때 null QPixmap을 반환하는지 테스트합니다."""
-    null_pixmap = QPixmap()
-    optimized = image_service.optimize_image(null_pixmap)
-    assert optimized.isNull()
+def test_decode_image_invalid_data(image_service):
+    """이미지가 아닌 데이터는 null QPixmap을 반환하는지 테스트합니다."""
+    assert image_service.decode_image(b"not an image").isNull()
 
 def test_create_thumbnail_valid_pixmap(image_service, dummy_pixmap):
     """정상 QPixmap으로 썸네일이 올바르게 생성되는지 테스트합니다."""
@@ -114,6 +115,14 @@ def test_create_thumbnail_different_aspect_ratio(image_service):
     assert thumbnail.width() == 80 
     assert thumbnail.height() == 40
 
+def test_create_thumbnail_already_fitting_pixmap(image_service):
+    """이미 썸네일 크기에 맞는 이미지는 다시 스케일링하지 않고 그대로 반환하는지 테스트합니다."""
+    pixmap = QPixmap(100, 60)
+    pixmap.fill(QColor("blue"))
+
+    thumbnail = image_service.create_thumbnail(pixmap, (100, 100))
+    assert thumbnail.cacheKey() == pixmap.cacheKey()
+
 def test_create_thumbnail_null_pixmap(image_service):
     """입력 QPixmap이 null일 때 null QPixmap을 반환하는지 테스트합니다."""
     null_pixmap = QPixmap()
@@ -148,6 +157,59 @@ def test_download_and_cache_image_new_image(image_service, dummy_pixmap):
     pixmap_from_cache = image_service.download_and_cache_image(image_data, image_filename)
     assert not pixmap_from_cache.isNull()
 
+def test_download_and_cache_image_max_size(image_service, dummy_pixmap):
+    """max_size를 지정하면 축소된 이미지를 디스크에 저장하고, 이미 저장된 파일은 다시 쓰지 않는지 테스트합니다."""
+    image_filename = "small_thumb.png"
+    image_data = image_service.pixmap_to_bytes(dummy_pixmap)
+    pixmap = image_service.download_and_cache_image(image_data, image_filename, 50)
+    assert pixmap.size() == QSize(50, 50)
+
+    cache_path = image_service.get_cached_image_path(image_filename)
+    assert QPixmap(cache_path).size() == QSize(50, 50)
+    original_mtime = os.path.getmtime(cache_path)
+
+    ImageService._decoded_cache.clear()
+    ImageService._decoded_cache_bytes = 0
+    image_service.download_and_cache_image(image_data, image_filename, 50)
+    assert os.path.getmtime(cache_path) == original_mtime
+
+def test_download_and_cache_image_writes_cache_atomically(image_service, dummy_pixmap):
+    """디스크 캐시 저장 후 임시 파일이 남지 않고, 저장에 실패하면 캐시 파일을 만들지 않는지 테스트합니다."""
+    image_data = image_service.pixmap_to_bytes(dummy_pixmap)
+    image_service.download_and_cache_image(image_data, "atomic.png")
+    assert os.listdir(image_service.cache_dir) == ["atomic.png"]
+
+    assert not image_service._save_to_disk_cache(QPixmap(), image_service.get_cached_image_path("empty.png"))
+    assert not image_service.is_image_cached("empty.png")
+    assert os.listdir(image_service.cache_dir) == ["atomic.png"]
+
+def test_clear_cache_keeps_subdirectories(image_service, dummy_pixmap):
+    """이미지 캐시 삭제 시 하위 폴더(가구 목록 캐시)는 남겨 두는지 테스트합니다."""
+    image_service.download_and_cache_image(image_service.pixmap_to_bytes(dummy_pixmap), "chair.png")
+    list_cache_dir = os.path.join(image_service.cache_dir, "furniture_list")
+    os.makedirs(list_cache_dir)
+    with open(os.path.join(list_cache_dir, "furniture.json"), "w", encoding="utf-8") as f:
+        f.write("[]")
+
+    image_service.clear_cache()
+
+    assert not image_service.is_image_cached("chair.png")
+    assert os.listdir(list_cache_dir) == ["furniture.json"]
+
+def test_decode_image_scales_at_decode_time(image_service):
+    """max_size보다 큰 이미지는 비율을 유지한 채 축소된 크기로 디코딩되는지 테스트합니다."""
+    image = QImage(400, 200, QImage.Format.Format_RGB32)
+    image.fill(QColor("green"))
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "JPEG")
+    jpeg_data = bytes(buffer.data())
+
+    assert image_service.decode_image(jpeg_data, 100).size() == QSize(100, 50)
+    # 작은 이미지는 확대하지 않음
+    assert image_service.decode_image(jpeg_data, 1920).size() == QSize(400, 200)
+    assert image_service.decode_image(b"this is not a valid image", 100).isNull()
+
 def test_download_and_cache_image_cached_image_when_no_input_data(image_service, dummy_pixmap):
     """디스크에 이미지가 캐시되어 있어도, 입력 이미지 데이터가 없으면 빈 QPixmap을 반환하는지 테스트합니다."""
     image_filename = "cached_image_no_input.png"
@@ -160,7 +222,8 @@ def test_download_and_cache_image_cached_image_when_no_input_data(image_service,
     original_mtime = os.path.getmtime(cache_path)
 
     # 메모리 캐시를 비우고
-    image_service.memory_cache.clear()
+    ImageService._decoded_cache.clear()
+    ImageService._decoded_cache_bytes = 0
 
     # image_data를 None으로 전달하여 다시 요청
     pixmap = image_service.download_and_cache_image(None, image_filename) 
@@ -183,6 +246,49 @@ def test_download_and_cache_image_no_data(image_service):
     pixmap = image_service.download_and_cache_image(None, image_filename)
     assert pixmap.isNull() 
 
+def test_get_cached_pixmap_shared_between_instances(image_service, dummy_pixmap):
+    """다운로드된 이미지가 다른 ImageService 인스턴스에서도 다운로드 없이 재사용되는지 테스트합니다."""
+    image_filename = "shared_image.jpg"
+    assert image_service.get_cached_pixmap(image_filename) is None
+
+    image_data = image_service.pixmap_to_bytes(dummy_pixmap)
+    image_service.download_and_cache_image(image_data, image_filename)
+
+    other_service = ImageService()
+    other_service.cache_dir = image_service.cache_dir
+    cached = other_service.get_cached_pixmap(image_filename)
+    assert cached is not None
+    assert cached.size() == dummy_pixmap.size()
+
+def test_get_cached_pixmap_from_disk(image_service, dummy_pixmap):
+    """메모리에 없더라도 디스크 캐시가 있으면 디코딩하여 반환하는지 테스트합니다."""
+    image_filename = "disk_only.png"
+    dummy_pixmap.save(image_service.get_cached_image_path(image_filename), "PNG")
+
+    cached = image_service.get_cached_pixmap(image_filename)
+    assert cached is not None and not cached.isNull()
+    assert "disk_only.png" in ImageService._decoded_cache
+
+def test_decoded_cache_retains_pixmap_without_references(image_service, dummy_pixmap):
+    """반환된 QPixmap 참조가 사라져도 메모리 캐시에 남아 디스크를 다시 읽지 않는지 테스트합니다."""
+    image_filename = "retained.png"
+    image_service.download_and_cache_image(image_service.pixmap_to_bytes(dummy_pixmap), image_filename)
+    os.remove(image_service.get_cached_image_path(image_filename))
+
+    cached = image_service.get_cached_pixmap(image_filename)
+    assert cached is not None and cached.size() == dummy_pixmap.size()
+
+def test_decoded_cache_evicts_oldest_when_over_budget(image_service, dummy_pixmap, monkeypatch):
+    """디코딩 캐시가 용량을 초과하면 가장 오래된 항목부터 제거되는지 테스트합니다."""
+    cost = dummy_pixmap.width() * dummy_pixmap.height() * dummy_pixmap.depth() // 8
+    monkeypatch.setattr(ImageService, "DECODED_CACHE_MAX_BYTES", cost * 2)
+
+    for name in ("a.png", "b.png", "c.png"):
+        ImageService._remember_decoded(name, dummy_pixmap)
+
+    assert list(ImageService._decoded_cache) == ["b.png", "c.png"]
+    assert ImageService._decoded_cache_bytes == cost * 2
+
 def test_clear_cache(image_service, dummy_pixmap):
     """clear_cache 호출 시 디스크 및 메모리 캐시가 삭제되는지 테스트합니다."""
     # 1. 디스크 캐시에 파일 생성
@@ -197,13 +303,9 @@ def test_clear_cache(image_service, dummy_pixmap):
     normalized_filename2 = os.path.basename(image_service.get_cached_image_path(filename2_original))
     image_data = image_service.pixmap_to_bytes(dummy_pixmap)
     
-    # download_and_cache_image의 반환값(QPixmap)에 대한 강한 참조를 유지
-    # 이렇게 하지 않으면 WeakValueDictionary에서 바로 사라질 수 있음
-    pixmap_ref = image_service.download_and_cache_image(image_data, filename2_original)
-    assert not pixmap_ref.isNull() # 반환된 QPixmap이 유효한지 확인
-    
-    with image_service.cache_lock:
-        assert normalized_filename2 in image_service.memory_cache # 정규화된 이름으로 확인
+    pixmap = image_service.download_and_cache_image(image_data, filename2_original)
+    assert not pixmap.isNull() # 반환된 QPixmap이 유효한지 확인
+    assert normalized_filename2 in ImageService._decoded_cache # 정규화된 이름으로 확인
 
     # 3. clear_cache 호출
     image_service.clear_cache()
@@ -214,8 +316,12 @@ def test_clear_cache(image_service, dummy_pixmap):
     assert not os.path.exists(cache_path2) 
 
     # 5. 메모리 캐시 확인
-    with image_service.cache_lock:
-        assert len(image_service.memory_cache) == 0
-    
-    # pixmap_ref 참조 해제 (선택적, 테스트 함수 종료 시 자동으로 해제됨)
-    del pixmap_ref 
\ No newline at end of file
+    assert len(ImageService._decoded_cache) == 0
+    assert ImageService._decoded_cache_bytes == 0
+
+def test_get_instance_returns_shared_service(monkeypatch):
+    """get_instance가 항상 같은 ImageService 인스턴스를 반환하는지 테스트합니다."""
+    monkeypatch.setattr(ImageService, '_instance', None)
+    first = ImageService.get_instance()
+    assert isinstance(first, ImageService)
+    assert ImageService.get_instance() is first
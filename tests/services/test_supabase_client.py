@@ -1,6 +1,8 @@
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
-from src.services.supabase_client import SupabaseClient
+from src.services.supabase_client import FURNITURE_LIST_COLUMNS, SupabaseClient
 
 
 class TestSupabaseClient:
@@ -9,4 +11,116 @@ class TestSupabaseClient:
     def test_supabase_client_placeholder(self):
         """SupabaseClient 테스트를 위한 플레이스홀더 테스트"""
         # TODO: SupabaseClient에 대한 실제 테스트 구현
-        assert True 
\ No newline at end of file
+        assert True 
+
+@pytest.fixture
+def supabase_client():
+    """create_client를 모의 객체로 대체한 SupabaseClient"""
+    with patch.dict('os.environ', {'SUPABASE_URL': 'https://example.supabase.co', 'SUPABASE_KEY': 'test-key'}), \
+         patch('src.services.supabase_client.create_client') as mock_create_client:
+        client = SupabaseClient()
+    client.bucket = mock_create_client.return_value.storage.from_.return_value
+    return client
+
+
+def test_get_furniture_image_requests_transform(supabase_client):
+    """크기를 지정하면 이미지 변환 옵션으로 다운로드하는지 테스트합니다."""
+    supabase_client.bucket.download.return_value = b"thumb"
+
+    assert supabase_client.get_furniture_image('chair.png', 100, 100) == b"thumb"
+
+    supabase_client.bucket.download.assert_called_once_with('chair.png', {
+        "transform": {"width": 100, "height": 100, "resize": "contain", "quality": 80}
+    })
+
+
+def test_get_furniture_image_transform_fallback(supabase_client):
+    """이미지 변환 요청이 실패하면 원본을 다운로드하는지 테스트합니다."""
+    supabase_client.bucket.download.side_effect = [Exception("transform unavailable"), b"original"]
+
+    assert supabase_client.get_furniture_image('chair.png', 100, 100) == b"original"
+    supabase_client.bucket.download.assert_called_with('chair.png')
+
+
+def test_get_furniture_image_caches_by_size(supabase_client):
+    """원본과 축소 이미지가 메모리 캐시에서 구분되는지 테스트합니다."""
+    supabase_client.bucket.download.side_effect = [b"original", b"thumb"]
+
+    assert supabase_client.get_furniture_image('chair.png') == b"original"
+    assert supabase_client.get_furniture_image('chair.png', 100, 100) == b"thumb"
+    assert supabase_client.get_furniture_image('chair.png') == b"original"
+    assert supabase_client.bucket.download.call_count == 2
+
+
+def test_get_furniture_image_concurrent_requests_download_once(supabase_client):
+    """같은 이미지를 여러 스레드가 동시에 요청해도 한 번만 다운로드하는지 테스트합니다."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_download(filename):
+        started.set()
+        release.wait(5)
+        return b"original"
+
+    supabase_client.bucket.download.side_effect = slow_download
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(supabase_client.get_furniture_image('chair.png')))
+               for _ in range(3)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [b"original"] * 3
+    assert supabase_client.bucket.download.call_count == 1
+    # 다운로드가 끝나면 이미지별 잠금도 정리됨
+    assert supabase_client._image_locks == {}
+
+
+def test_furniture_list_disk_cache_roundtrip(supabase_client, tmp_path):
+    """서버에서 조회한 가구 목록이 디스크에 저장되고 다시 읽히는지 테스트합니다."""
+    supabase_client.furniture_cache_path = str(tmp_path / "furniture.json")
+    rows = [{'id': '1', 'name': '의자'}]
+    supabase_client.client.table.return_value.select.return_value.execute.return_value.data = rows
+
+    assert supabase_client.get_cached_furniture_list() is None
+    assert supabase_client.fetch_furniture_list() == rows
+    assert supabase_client.get_cached_furniture_list() == rows
+    assert supabase_client.get_cached_furniture_list(max_age=-1) is None
+
+
+def test_get_furniture_cached_uses_fresh_disk_cache(supabase_client, tmp_path):
+    """캐시가 유효하면 서버를 조회하지 않는지 테스트합니다."""
+    supabase_client.furniture_cache_path = str(tmp_path / "furniture.json")
+    (tmp_path / "furniture.json").write_text('[{"id": "1"}]', encoding="utf-8")
+
+    assert supabase_client.get_furniture_cached() == [{'id': '1'}]
+    supabase_client.client.table.assert_not_called()
+
+
+def test_get_instance_returns_shared_client(monkeypatch):
+    """get_instance가 한 번만 생성한 클라이언트를 계속 반환하는지 테스트합니다."""
+    monkeypatch.setattr(SupabaseClient, '_instance', None)
+    with patch.dict('os.environ', {'SUPABASE_URL': 'https://example.supabase.co', 'SUPABASE_KEY': 'test-key'}), \
+         patch('src.services.supabase_client.create_client') as mock_create_client:
+        first = SupabaseClient.get_instance()
+        second = SupabaseClient.get_instance()
+
+    assert first is second
+    mock_create_client.assert_called_once()
+
+
+def test_fetch_furniture_list_selects_list_columns(supabase_client, tmp_path):
+    """목록 조회는 목록에 필요한 컬럼만 요청하는지 테스트합니다."""
+    supabase_client.furniture_cache_path = str(tmp_path / "furniture.json")
+    table = supabase_client.client.table.return_value
+    table.select.return_value.execute.return_value.data = []
+
+    supabase_client.fetch_furniture_list()
+
+    table.select.assert_called_once_with(FURNITURE_LIST_COLUMNS)
+    # 캔버스 배치/내보내기에 쓰는 필드는 목록 조회에 포함 (드롭 시 추가 조회 없음)
+    assert {'link', 'width', 'depth', 'height', 'seat_height', 'author'} <= set(FURNITURE_LIST_COLUMNS.split(','))
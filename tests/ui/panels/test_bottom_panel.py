@@ -3,13 +3,15 @@
 하단 패널 모듈의 기능을 테스트합니다.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QHeaderView
 
 from src.models.furniture import Furniture
 from src.ui.panels.bottom_panel import BottomPanel, SelectedFurniturePanel
+from src.ui.panels.common import SelectedFurnitureTableModel
 
 
 @pytest.fixture
@@ -35,6 +37,23 @@ def test_bottom_panel_initialization(qtbot):
     panel.show()
     assert panel.isVisible()
 
+def test_bottom_panel_update_panel_coalesces_requests(qtbot, sample_furniture):
+    """연달아 호출된 update_panel이 마지막 목록으로 한 번만 반영되는지 테스트합니다."""
+    panel = BottomPanel()
+    qtbot.addWidget(panel)
+    item = Mock()
+    item.furniture = sample_furniture
+    panel.selected_panel.update_furniture_list = Mock()
+    
+    panel.update_panel([item])
+    panel.update_panel([item, item])
+    panel.update_panel([item, item, item])
+    panel.selected_panel.update_furniture_list.assert_not_called()
+    
+    qtbot.waitUntil(lambda: panel.selected_panel.update_furniture_list.called, timeout=1000)
+    qtbot.wait(BottomPanel.UPDATE_DELAY_MS * 2)
+    panel.selected_panel.update_furniture_list.assert_called_once_with([item, item, item])
+
 def test_selected_furniture_panel_initialization(qtbot):
     """SelectedFurniturePanel이 올바르게 초기화되는지 테스트합니다."""
     panel = SelectedFurniturePanel()
@@ -74,9 +93,7 @@ def test_selected_furniture_panel_column_width_preservation(qtbot, sample_furnit
     panel = SelectedFurniturePanel()
     qtbot.addWidget(panel)
     
-    # 모델에 콜백이 설정되었는지 확인
-    assert panel.selected_model.column_width_callback is not None
-    assert callable(panel.selected_model.column_width_callback)
+    panel.selected_table.setColumnWidth(1, 250)
     
     # 가구 아이템 생성 (모킹)
     mock_furniture_item = Mock()
@@ -88,6 +105,12 @@ def test_selected_furniture_panel_column_width_preservation(qtbot, sample_furnit
     # 모델에 가구가 추가되었는지 확인
     assert panel.selected_model.rowCount() == 1
     
+    # 목록 갱신/모델 리셋 후에도 사용자가 조정한 너비가 유지되는지 확인
+    assert panel.selected_table.columnWidth(1) == 250
+    panel.selected_model.clear_furniture()
+    assert panel.selected_table.columnWidth(1) == 250
+    assert panel.column_widths[1] == 250
+    
     # 컬럼 너비가 설정되어 있는지 확인
     assert panel.column_widths is not None
     assert len(panel.column_widths) == 14  # 14개 컬럼
@@ -96,6 +119,100 @@ def test_selected_furniture_panel_column_width_preservation(qtbot, sample_furnit
     assert hasattr(panel, 'setup_column_widths')
     assert callable(panel.setup_column_widths)
 
+def test_selected_furniture_panel_setup_widths_skips_resize_slot(qtbot):
+    """저장된 너비를 적용할 때는 on_column_resized가 호출되지 않고, 사용자 변경은 저장되는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    panel.column_widths[1] = 200
+    
+    panel.setup_column_widths()
+    assert panel.selected_table.columnWidth(1) == 200
+    
+    panel.selected_table.horizontalHeader().resizeSection(1, 180)
+    assert panel.column_widths[1] == 180
+
+def test_selected_furniture_panel_update_keeps_column_widths(qtbot, sample_furniture):
+    """목록 갱신 시 컬럼 너비를 다시 적용하지 않아도 사용자가 조정한 너비가 유지되는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    panel.selected_table.setColumnWidth(1, 321)
+    
+    item = Mock()
+    item.furniture = sample_furniture
+    panel.setup_column_widths = Mock()
+    panel.update_furniture_list([item, item])
+    
+    panel.setup_column_widths.assert_not_called()
+    assert panel.selected_table.columnWidth(1) == 321
+    assert panel.selected_model.rowCount() == 1
+    assert panel.total_count_label.text() == "총 가구: 2개"
+
+def test_selected_furniture_panel_update_suspends_painting(qtbot, sample_furniture):
+    """목록 갱신 중에는 테이블을 다시 그리지 않고, 갱신이 끝나면 다시 그리기를 켜는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    item = Mock()
+    item.furniture = sample_furniture
+    
+    updates_enabled_during_sync = []
+    original_sync = panel.selected_model.sync
+    def sync(furnitures):
+        updates_enabled_during_sync.append(panel.selected_table.updatesEnabled())
+        original_sync(furnitures)
+    panel.selected_model.sync = sync
+    
+    panel.update_furniture_list([item])
+    
+    assert updates_enabled_during_sync == [False]
+    assert panel.selected_table.updatesEnabled()
+    assert panel.selected_model.rowCount() == 1
+
+def test_selected_furniture_panel_skips_unchanged_update(qtbot, sample_furniture):
+    """같은 가구 목록으로 다시 갱신하면 모델을 건드리지 않는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    item = Mock()
+    item.furniture = sample_furniture
+    panel.update_furniture_list([item, item])
+    
+    panel.selected_model.sync = Mock()
+    panel.update_furniture_list([item, item])
+    panel.selected_model.sync.assert_not_called()
+    
+    panel.update_furniture_list([item])
+    panel.selected_model.sync.assert_called_once_with([sample_furniture])
+
+def test_selected_furniture_panel_double_click_opens_link(qtbot, sample_furniture):
+    """링크 컬럼을 더블클릭했을 때만 가구 링크를 브라우저로 여는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    item = Mock()
+    item.furniture = sample_furniture
+    panel.update_furniture_list([item])
+    model = panel.selected_model
+    
+    with patch('webbrowser.open') as mock_open:
+        panel.on_double_click(model.index(0, 1))
+        mock_open.assert_not_called()
+        
+        panel.on_double_click(model.index(0, SelectedFurnitureTableModel.LINK_COLUMN))
+        mock_open.assert_called_once_with(sample_furniture.link)
+
+def test_selected_furniture_panel_sizes_are_not_content_measured(qtbot):
+    """행 높이와 컬럼 너비가 셀 내용 측정 없이 고정/사용자 조정 방식인지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    
+    header = panel.selected_table.horizontalHeader()
+    assert all(header.sectionResizeMode(column) == QHeaderView.ResizeMode.Interactive
+               for column in range(header.count()) if column not in panel.FIXED_WIDTH_COLUMNS)
+    assert all(header.sectionResizeMode(column) == QHeaderView.ResizeMode.Fixed
+               for column in panel.FIXED_WIDTH_COLUMNS)
+    assert header.sectionSize(13) == panel.column_widths[13]
+    assert not header.stretchLastSection()
+    assert panel.selected_table.verticalHeader().sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+    assert not panel.selected_table.wordWrap()
+
 def test_selected_furniture_panel_order_control_buttons(qtbot):
     """SelectedFurniturePanel의 순서 변경 버튼들이 올바르게 설정되는지 테스트합니다."""
     panel = SelectedFurniturePanel()
@@ -145,6 +262,81 @@ def test_selected_furniture_panel_order_methods(qtbot, sample_furniture):
         selected_name = panel.get_selected_furniture_name()
         assert selected_name == sample_furniture.name
 
+def test_selected_furniture_panel_move_selects_row_immediately(qtbot):
+    """순서 변경 직후(이벤트 루프를 거치지 않고) 이동한 행이 선택되는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    items = []
+    for name in ("Chair", "Table", "Sofa"):
+        item = Mock()
+        item.furniture = Furniture(id=name, brand='B', name=name, image_filename='x.png', price=100, type='T')
+        items.append(item)
+    panel.update_furniture_list(items)
+    
+    panel.select_row(2)
+    panel.move_selected_to_top()
+    assert panel.get_selected_row() == 0
+    assert panel.get_selected_furniture_name() == "Sofa"
+    
+    panel.move_selected_down()
+    assert panel.get_selected_row() == 1
+    assert panel.get_selected_furniture_name() == "Sofa"
+
+def test_selected_furniture_panel_buttons_follow_moved_row(qtbot):
+    """선택된 행이 순서 변경이나 행 추가로 위치가 바뀌면 버튼 상태도 갱신되는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    furnitures = [Furniture(id=name, brand='B', name=name, image_filename='x.png', price=100, type='T')
+                  for name in ("Chair", "Table", "Sofa")]
+    items = []
+    for furniture in furnitures[:2]:
+        item = Mock()
+        item.furniture = furniture
+        items.append(item)
+    panel.update_furniture_list(items)
+    
+    panel.select_row(1)
+    assert panel.move_up_btn.isEnabled()
+    assert not panel.move_down_btn.isEnabled()
+    
+    # 행 추가로 선택된 행이 더 이상 마지막이 아님
+    item = Mock()
+    item.furniture = furnitures[2]
+    panel.update_furniture_list(items + [item])
+    assert panel.move_down_btn.isEnabled()
+    assert panel.move_bottom_btn.isEnabled()
+    
+    # 맨 위로 이동하면 위로 이동 버튼 비활성화
+    panel.move_selected_to_top()
+    assert panel.get_selected_row() == 0
+    assert not panel.move_up_btn.isEnabled()
+    assert not panel.move_top_btn.isEnabled()
+    assert panel.move_down_btn.isEnabled()
+
+def test_selected_furniture_panel_sort_menu_built_once(qtbot):
+    """정렬 메뉴가 한 번만 생성되고, 메뉴 항목이 해당 정렬을 실행하는지 테스트합니다."""
+    panel = SelectedFurniturePanel()
+    qtbot.addWidget(panel)
+    items = []
+    for name, price in (("Chair", 300), ("Table", 100)):
+        item = Mock()
+        item.furniture = Furniture(id=name, brand='B', name=name, image_filename='x.png', price=price, type='T')
+        items.append(item)
+    panel.update_furniture_list(items)
+    
+    sort_menu = panel.sort_menu
+    actions = sort_menu.actions()
+    assert len(actions) == 8
+    
+    with patch.object(sort_menu, 'exec') as mock_exec:
+        panel.show_sort_menu()
+        mock_exec.assert_called_once()
+    assert panel.sort_menu is sort_menu
+    
+    # "가격 (낮은순)"
+    actions[4].trigger()
+    assert panel.selected_model.furniture_order == ["Table", "Chair"]
+
 def test_selected_furniture_panel_integration_with_model(qtbot):
     """SelectedFurniturePanel과 SelectedFurnitureTableModel의 통합을 테스트합니다."""
     panel = SelectedFurniturePanel()
@@ -154,9 +346,6 @@ def test_selected_furniture_panel_integration_with_model(qtbot):
     assert panel.selected_model is not None
     assert panel.selected_table.model() == panel.selected_model
     
-    # 모델의 콜백이 패널의 메서드로 설정되어 있는지 확인
-    assert panel.selected_model.column_width_callback == panel.setup_column_widths
-    
     # 드래그 앤 드롭 설정 확인
     from PyQt6.QtWidgets import QTableView
     assert panel.selected_table.dragDropMode() == QTableView.DragDropMode.InternalMove
@@ -3,18 +3,28 @@
 패널 공통 모듈의 기능을 테스트합니다.
 """
 
-import unittest.mock
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
 import pytest
-from PyQt6.QtCore import QObject, QEvent, QPointF, pyqtSignal, QSize, Qt
-from PyQt6.QtGui import QMouseEvent, QPixmap
-from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import QAbstractItemModel, QEvent, QPointF, QSize, Qt
+from PyQt6.QtGui import QMouseEvent, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import QLabel, QTableView
 
 from src.models.furniture import Furniture
-from src.ui.panels.common import ImageLoaderThread, FurnitureItem, FurnitureTableModel, SelectedFurnitureTableModel
+from src.ui.panels.common import (FURNITURE_ID_MIME_TYPE, FurnitureItem,
+                                  FurnitureTableModel, SelectedFurnitureTableModel, thumbnail_cache_key,
+                                  prefetch_full_images, thumbnail_source_filename)
 
 
+@pytest.fixture(autouse=True)
+def clear_pixmap_cache():
+    """테스트 간에 공유 썸네일 캐시(QPixmapCache)가 남지 않도록 초기화합니다."""
+    QPixmapCache.clear()
+    yield
+    QPixmapCache.clear()
+
 @pytest.fixture
 def mock_image_service():
     """Mock ImageService"""
@@ -22,6 +32,7 @@ def mock_image_service():
     mock.get_furniture_image.return_value = b"image_data"
     mock.download_and_cache_image.return_value = QPixmap(100, 100)
     mock.create_thumbnail.return_value = QPixmap(50, 50)
+    mock.get_cached_pixmap.return_value = None
     return mock
 
 @pytest.fixture  
@@ -41,113 +52,19 @@ def sample_furniture():
         width=50, depth=50, height=100, seat_height=45, author='test_author', created_at=''
     )
 
-@pytest.fixture
-def image_loader_thread(mock_image_service, mock_supabase_client, sample_furniture):
-    """테스트용 ImageLoaderThread"""
-    return ImageLoaderThread(mock_image_service, mock_supabase_client, sample_furniture)
-
-class SignalListener(QObject):
-    signal_received = pyqtSignal(str, QPixmap)
-    
-    def __init__(self):
-        super().__init__()
-        self.received_filename = None
-        self.received_pixmap = None
-    
-    def on_signal_received(self, filename, pixmap):
-        self.received_filename = filename
-        self.received_pixmap = pixmap
-
-# ImageLoaderThread 테스트들
-def test_image_loader_thread_run_success(qtbot, image_loader_thread, mock_image_service, mock_supabase_client, sample_furniture):
-    """ImageLoaderThread.run()이 성공적으로 실행되는지 테스트합니다."""
-    listener = SignalListener()
-    image_loader_thread.image_loaded.connect(listener.on_signal_received)
-    
-    # 스레드 실행
-    image_loader_thread.start()
-    image_loader_thread.wait()
-    
-    # 처리 완료까지 잠시 대기 (Qt 이벤트 처리)
-    qtbot.wait(100)
-    
-    # Supabase 클라이언트 호출 검증
-    mock_supabase_client.get_furniture_image.assert_called_once_with(sample_furniture.image_filename)
-    
-    # ImageService 호출 검증
-    mock_image_service.download_and_cache_image.assert_called_once_with(b"image_data", sample_furniture.image_filename)
-    
-    # 시그널 발생 검증
-    assert listener.received_filename == sample_furniture.image_filename
-    assert listener.received_pixmap is not None
-
-def test_image_loader_thread_run_supabase_error(qtbot, image_loader_thread, mock_image_service, mock_supabase_client, sample_furniture):
-    """ImageLoaderThread.run() 중 Supabase 오류 발생 시를 테스트합니다."""
-    mock_supabase_client.get_furniture_image.side_effect = Exception("DB Error")
-    
-    listener = SignalListener()
-    image_loader_thread.image_loaded.connect(listener.on_signal_received)
-    
-    with patch('src.ui.panels.common.print') as mock_print:
-        image_loader_thread.start()
-        image_loader_thread.wait()
-        qtbot.wait(100)
-    
-    # 에러 로그 출력 검증 (새로운 로그 형식)
-    expected_calls = [
-        '[ImageLoaderThread] 시작: chair.png',
-        '[ImageLoaderThread] 오류 발생: chair.png - DB Error',
-        '[ImageLoaderThread] 종료: chair.png',
-        '[ImageLoaderThread] 완료됨: chair.png'
-    ]
-    mock_print.assert_has_calls([unittest.mock.call(msg) for msg in expected_calls])
-    
-    # ImageService는 호출되지 않아야 함
-    mock_image_service.download_and_cache_image.assert_not_called()
-    
-    # 시그널도 발생하지 않아야 함
-    assert listener.received_filename is None
-    assert listener.received_pixmap is None
-
-def test_image_loader_thread_run_image_service_error(qtbot, image_loader_thread, mock_image_service, mock_supabase_client, sample_furniture):
-    """ImageLoaderThread.run() 중 ImageService 오류 발생 시를 테스트합니다."""
-    mock_image_service.download_and_cache_image.side_effect = Exception("Service Error")
-    
-    listener = SignalListener()
-    image_loader_thread.image_loaded.connect(listener.on_signal_received)
-    
-    with patch('src.ui.panels.common.print') as mock_print:
-        image_loader_thread.start()
-        image_loader_thread.wait()
-        qtbot.wait(100)
-    
-    # 에러 로그 출력 검증 (새로운 로그 형식)
-    expected_calls = [
-        '[ImageLoaderThread] 시작: chair.png',
-        '[ImageLoaderThread] 오류 발생: chair.png - Service Error', 
-        '[ImageLoaderThread] 종료: chair.png',
-        '[ImageLoaderThread] 완료됨: chair.png'
-    ]
-    mock_print.assert_has_calls([unittest.mock.call(msg) for msg in expected_calls])
-    
-    # Supabase는 호출되어야 함
-    mock_supabase_client.get_furniture_image.assert_called_once()
-    
-    # 시그널은 발생하지 않아야 함
-    assert listener.received_filename is None
-    assert listener.received_pixmap is None
-
 # FurnitureItem 테스트들
 @pytest.fixture
 def furniture_item_widget(qtbot, sample_furniture, mock_image_service, mock_supabase_client):
     """테스트용 FurnitureItem 위젯을 생성하고 qtbot에 등록합니다."""
     mock_image_service.create_thumbnail.return_value = QPixmap(100,100)
 
-    # FurnitureItem 내부에서 ImageService()와 SupabaseClient()를 직접 생성하므로, patch 필요
-    with patch('src.ui.panels.common.ImageService', return_value=mock_image_service), \
-         patch('src.ui.panels.common.SupabaseClient', return_value=mock_supabase_client):
+    # FurnitureItem 내부에서 공유 ImageService/SupabaseClient 인스턴스를 가져오므로, patch 필요
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
         widget = FurnitureItem(sample_furniture)
         qtbot.addWidget(widget)
+    # 이미지는 스레드 풀에서 비동기로 로드되므로 썸네일 생성까지 대기
+    qtbot.waitUntil(lambda: mock_image_service.create_thumbnail.called, timeout=3000)
     return widget
 
 def test_furniture_item_init_ui(furniture_item_widget, sample_furniture):
@@ -166,6 +83,12 @@ def test_furniture_item_init_ui(furniture_item_widget, sample_furniture):
     assert furniture_item_widget.image_label.pixmap() is not None 
     assert furniture_item_widget.image_label.pixmap().size() == QSize(100, 100)
 
+def test_furniture_item_uses_app_stylesheet_selectors(furniture_item_widget):
+    """FurnitureItem이 위젯별 스타일시트 대신 앱 스타일시트의 objectName 선택자를 사용하는지 테스트합니다."""
+    object_names = {label.objectName() for label in furniture_item_widget.findChildren(QLabel)}
+    assert {"furnitureThumbnail", "furnitureName", "furnitureMeta", "furniturePrice"} <= object_names
+    assert all(label.styleSheet() == "" for label in furniture_item_widget.findChildren(QLabel))
+
 def test_furniture_item_load_image_success(qtbot, mock_image_service, mock_supabase_client, sample_furniture):
     """load_image 성공 시 서비스 호출 및 UI 업데이트를 테스트합니다."""
     mock_image_service.reset_mock()
@@ -179,28 +102,67 @@ def test_furniture_item_load_image_success(qtbot, mock_image_service, mock_supab
     thumbnail_pixmap_mock = QPixmap(50,50) 
     mock_image_service.create_thumbnail.return_value = thumbnail_pixmap_mock
 
-    with patch('src.ui.panels.common.ImageService', return_value=mock_image_service), \
-         patch('src.ui.panels.common.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
         # FurnitureItem을 생성하면 __init__ 내부에서 self.load_image()가 호출됨
         widget = FurnitureItem(sample_furniture)
         qtbot.addWidget(widget)
 
+    # 다운로드는 스레드 풀에서 진행되고, 완료 후 썸네일이 표시될 때까지 대기
+    qtbot.waitUntil(lambda: widget.image_label.pixmap().size() == thumbnail_pixmap_mock.size(), timeout=3000)
+
     # SupabaseClient 호출 검증
-    mock_supabase_client.get_furniture_image.assert_called_once_with(sample_furniture.image_filename)
+    # 썸네일 크기로 변환된 이미지를 요청해야 함
+    mock_supabase_client.get_furniture_image.assert_called_once_with(sample_furniture.image_filename, 100, 100)
     
-    # ImageService 호출 검증
+    # ImageService 호출 검증 (원본과 구분되는 썸네일 전용 캐시 파일명 사용)
     mock_image_service.download_and_cache_image.assert_called_once_with(
-        b"image_data", sample_furniture.image_filename # mock_supabase_client가 반환하는 데이터
+        b"image_data", thumbnail_source_filename(sample_furniture.image_filename), 100
     )
-    # load_image 내부의 create_thumbnail 호출 시 인자 검증
+    # 워커에서 호출되는 create_thumbnail 인자 검증
     # 첫 번째 인자는 download_and_cache_image의 반환값, 두 번째 인자는 (100,100)
-    mock_image_service.create_thumbnail.assert_called_once_with(downloaded_pixmap_mock, (100, 100))
+    # (시그널로 스레드를 넘어오면 래퍼 객체는 달라지지만 같은 이미지 데이터를 공유함)
+    mock_image_service.create_thumbnail.assert_called_once()
+    thumbnail_args = mock_image_service.create_thumbnail.call_args.args
+    assert thumbnail_args[0].cacheKey() == downloaded_pixmap_mock.cacheKey()
+    assert thumbnail_args[1] == (100, 100)
     
     # UI 검증: image_label에 create_thumbnail의 결과(thumbnail_pixmap_mock)가 설정되어야 함
     assert widget.image_label.pixmap() is not None
     assert widget.image_label.pixmap().size() == thumbnail_pixmap_mock.size() # (50,50)
     assert widget.image_label.text() == "" # 성공 시 텍스트는 비어있어야 함
 
+def test_thumbnail_source_filename():
+    """썸네일 원본 캐시 파일명이 원본 이미지와 겹치지 않는지 테스트합니다."""
+    assert thumbnail_source_filename('chair.png') == 'chair_thumb_100x100.png'
+    assert thumbnail_source_filename('chair.png') != 'chair.png'
+
+def test_furniture_item_load_image_uses_cached_thumbnail_source(qtbot, mock_image_service, mock_supabase_client, sample_furniture):
+    """썸네일 크기 이미지가 로컬 캐시에 있으면 Supabase 요청 없이 사용하는지 테스트합니다."""
+    mock_image_service.get_cached_pixmap.return_value = QPixmap(100, 100)
+
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        widget = FurnitureItem(sample_furniture)
+        qtbot.addWidget(widget)
+
+    qtbot.waitUntil(lambda: mock_image_service.create_thumbnail.called, timeout=3000)
+    mock_image_service.get_cached_pixmap.assert_called_with(thumbnail_source_filename(sample_furniture.image_filename))
+    mock_supabase_client.get_furniture_image.assert_not_called()
+
+def test_furniture_item_load_image_uses_thumbnail_cache(qtbot, mock_image_service, mock_supabase_client, sample_furniture):
+    """QPixmapCache에 썸네일이 있으면 다운로드 없이 바로 표시하는지 테스트합니다."""
+    QPixmapCache.insert(thumbnail_cache_key(sample_furniture.image_filename), QPixmap(60, 60))
+
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        widget = FurnitureItem(sample_furniture)
+        qtbot.addWidget(widget)
+
+    assert widget.image_label.pixmap().size() == QSize(60, 60)
+    mock_supabase_client.get_furniture_image.assert_not_called()
+    mock_image_service.create_thumbnail.assert_not_called()
+
 @patch('src.ui.panels.common.print')
 def test_furniture_item_load_image_supabase_error(mock_print, qtbot, mock_image_service, mock_supabase_client, sample_furniture):
     """load_image 중 Supabase 오류 발생 시 UI 업데이트를 테스트합니다."""
@@ -208,11 +170,13 @@ def test_furniture_item_load_image_supabase_error(mock_print, qtbot, mock_image_
     # create_thumbnail은 호출되지 않으므로, 반환값 설정은 필수는 아님
     mock_image_service.create_thumbnail.return_value = QPixmap()
 
-    with patch('src.ui.panels.common.ImageService', return_value=mock_image_service), \
-         patch('src.ui.panels.common.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
         widget = FurnitureItem(sample_furniture)
         qtbot.addWidget(widget)
 
+    qtbot.waitUntil(lambda: widget.image_label.text() == "이미지 로드 실패", timeout=3000)
+
     mock_image_service.download_and_cache_image.assert_not_called()
     mock_image_service.create_thumbnail.assert_not_called()
     assert widget.image_label.text() == "이미지 로드 실패"
@@ -225,11 +189,13 @@ def test_furniture_item_load_image_service_error(mock_print, qtbot, mock_image_s
     # create_thumbnail은 호출되지 않으므로, 반환값 설정은 필수는 아님
     mock_image_service.create_thumbnail.return_value = QPixmap()
 
-    with patch('src.ui.panels.common.ImageService', return_value=mock_image_service), \
-         patch('src.ui.panels.common.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
         widget = FurnitureItem(sample_furniture)
         qtbot.addWidget(widget)
 
+    qtbot.waitUntil(lambda: widget.image_label.text() == "이미지 로드 실패", timeout=3000)
+
     mock_supabase_client.get_furniture_image.assert_called_once()
     mock_image_service.download_and_cache_image.assert_called_once() # 호출은 됨
     mock_image_service.create_thumbnail.assert_not_called() # 여기서 오류나면 create_thumbnail 미호출
@@ -243,11 +209,13 @@ def test_furniture_item_load_image_thumbnail_error(mock_print, qtbot, mock_image
     mock_image_service.download_and_cache_image.return_value = QPixmap(200,200)
     mock_image_service.create_thumbnail.side_effect = Exception("Thumbnail Creation Error")
 
-    with patch('src.ui.panels.common.ImageService', return_value=mock_image_service), \
-         patch('src.ui.panels.common.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
         widget = FurnitureItem(sample_furniture)
         qtbot.addWidget(widget)
 
+    qtbot.waitUntil(lambda: widget.image_label.text() == "이미지 로드 실패", timeout=3000)
+
     mock_supabase_client.get_furniture_image.assert_called_once()
     mock_image_service.download_and_cache_image.assert_called_once()
     mock_image_service.create_thumbnail.assert_called_once() # 호출은 됨
@@ -280,39 +248,18 @@ def test_furniture_item_mouse_press_event_drag(qtbot, furniture_item_widget, sam
         assert len(captured_mime_data) == 1, "setMimeData가 호출되지 않았거나 여러 번 호출되었습니다."
         mime_data = captured_mime_data[0]
         
-        assert mime_data.hasFormat("application/x-furniture")
+        assert mime_data.hasFormat(FURNITURE_ID_MIME_TYPE)
         
-        # FurnitureItem의 mousePressEvent에서 mime_data에 설정하는 데이터 생성 방식 확인 필요
-        # 현재 코드는 Furniture 객체의 모든 속성을 포함하는 dict를 str로 변환하여 저장
-        expected_data_dict = {
-            'id': sample_furniture.id,
-            'name': sample_furniture.name,
-            'image_filename': sample_furniture.image_filename,
-            'price': sample_furniture.price,
-            'brand': sample_furniture.brand,
-            'type': sample_furniture.type,
-            'description': sample_furniture.description,
-            'link': sample_furniture.link,
-            'color': sample_furniture.color,
-            'locations': sample_furniture.locations,
-            'styles': sample_furniture.styles,
-            'width': sample_furniture.width,
-            'depth': sample_furniture.depth,
-            'height': sample_furniture.height,
-            'seat_height': sample_furniture.seat_height,
-            'author': sample_furniture.author,
-            'created_at': sample_furniture.created_at 
-        }
-        # 실제 MIME 데이터는 bytearray이므로 .data()를 한 번 더 호출하거나 bytes()로 변환 후 decode
-        actual_data_str = bytes(mime_data.data("application/x-furniture")).decode()
-        assert actual_data_str == str(expected_data_dict)
+        # 전체 가구 데이터 대신 가구 ID만 전달되어야 함
+        actual_data_str = bytes(mime_data.data(FURNITURE_ID_MIME_TYPE)).decode()
+        assert actual_data_str == str(sample_furniture.id)
         mock_drag_instance.exec.assert_called_once()
 
 # FurnitureTableModel 테스트들
 @pytest.fixture
 def furniture_table_model(qtbot, mock_image_service, mock_supabase_client):
-    with patch('src.ui.panels.common.ImageService', return_value=mock_image_service), \
-         patch('src.ui.panels.common.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.common.ImageService.get_instance', return_value=mock_image_service), \
+         patch('src.ui.panels.common.SupabaseClient.get_instance', return_value=mock_supabase_client):
         model = FurnitureTableModel()
     return model
 
@@ -323,24 +270,25 @@ def test_furniture_table_model_init(furniture_table_model):
         assert furniture_table_model.headerData(i, Qt.Orientation.Horizontal) == header
 
 def test_furniture_table_model_add_furniture_single(furniture_table_model, sample_furniture, mock_image_service):
-    with patch.object(furniture_table_model, 'load_thumbnail_async') as mock_load_thumbnail:
+    with patch.object(furniture_table_model, 'prefetch_thumbnails') as mock_prefetch:
         furniture_table_model.add_furniture(sample_furniture)
         
         assert furniture_table_model.rowCount() == 1
         assert len(furniture_table_model.furniture_items) == 1
         assert furniture_table_model.furniture_items[0] == sample_furniture
+        assert furniture_table_model.furniture_by_id[str(sample_furniture.id)] is sample_furniture
         
         # 각 컬럼의 데이터가 올바르게 설정되었는지 확인
-        assert furniture_table_model.item(0, 1).text() == sample_furniture.brand  # 브랜드
-        assert furniture_table_model.item(0, 2).text() == sample_furniture.name   # 이름
-        assert furniture_table_model.item(0, 3).text() == f"₩{sample_furniture.price:,}"  # 가격
-        assert furniture_table_model.item(0, 4).text() == sample_furniture.type  # 타입
-        assert furniture_table_model.item(0, 5).text() == ", ".join(sample_furniture.locations)  # 위치
-        assert furniture_table_model.item(0, 6).text() == sample_furniture.color  # 색상
-        assert furniture_table_model.item(0, 7).text() == ", ".join(sample_furniture.styles)  # 스타일
+        assert furniture_table_model.index(0, 1).data() == sample_furniture.brand  # 브랜드
+        assert furniture_table_model.index(0, 2).data() == sample_furniture.name   # 이름
+        assert furniture_table_model.index(0, 3).data() == f"₩{sample_furniture.price:,}"  # 가격
+        assert furniture_table_model.index(0, 4).data() == sample_furniture.type  # 타입
+        assert furniture_table_model.index(0, 5).data() == ", ".join(sample_furniture.locations)  # 위치
+        assert furniture_table_model.index(0, 6).data() == sample_furniture.color  # 색상
+        assert furniture_table_model.index(0, 7).data() == ", ".join(sample_furniture.styles)  # 스타일
         
-        # 썸네일 로딩 메서드가 호출되었는지 확인
-        mock_load_thumbnail.assert_called_once_with(sample_furniture, furniture_table_model.item(0, 0))
+        # 썸네일은 행 추가 시점이 아니라 화면에 표시될 때 로드
+        mock_prefetch.assert_not_called()
 
 def test_furniture_table_model_add_multiple_furniture(furniture_table_model, sample_furniture):
     # 가구 2개 추가
@@ -351,7 +299,7 @@ def test_furniture_table_model_add_multiple_furniture(furniture_table_model, sam
         width=60, depth=60, height=110, seat_height=50, author='test_author2', created_at=''
     )
     
-    with patch.object(furniture_table_model, 'load_thumbnail_async'):
+    with patch.object(furniture_table_model, 'prefetch_thumbnails'):
         furniture_table_model.add_furniture(sample_furniture)
         furniture_table_model.add_furniture(furniture2)
         
@@ -361,42 +309,244 @@ def test_furniture_table_model_add_multiple_furniture(furniture_table_model, sam
         assert furniture_table_model.furniture_items[1] == furniture2
         
         # 첫 번째 가구 검증
-        assert furniture_table_model.item(0, 1).text() == sample_furniture.brand
+        assert furniture_table_model.index(0, 1).data() == sample_furniture.brand
         # 두 번째 가구 검증
-        assert furniture_table_model.item(1, 1).text() == furniture2.brand
+        assert furniture_table_model.index(1, 1).data() == furniture2.brand
+
+def test_furniture_table_model_add_furniture_list(qtbot, furniture_table_model, sample_furniture):
+    """add_furniture_list가 한 번의 rowsInserted 시그널로 모든 행을 추가하는지 테스트합니다."""
+    furniture2 = Furniture(
+        id='2', brand='SecondBrand', name='Same Image Chair', image_filename='chair.png', price=200,
+        type='Chair', description='', link='', color='Blue', locations=[], styles=[],
+    )
+    inserted = []
+    furniture_table_model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    
+    with patch.object(furniture_table_model, 'prefetch_thumbnails') as mock_prefetch:
+        furniture_table_model.add_furniture_list([sample_furniture, furniture2])
+        
+        assert inserted == [(0, 1)]
+        assert furniture_table_model.rowCount() == 2
+        assert furniture_table_model.thumbnail_rows['chair.png'] == [0, 1]
+        mock_prefetch.assert_not_called()
+        
+        # 지정한 행의 썸네일만 요청 (범위를 벗어난 행은 무시)
+        furniture_table_model.load_thumbnails_for_rows([1, 5])
+        mock_prefetch.assert_called_once_with(['chair.png'])
+
+def test_furniture_table_model_update_furniture_list(qtbot, furniture_table_model, sample_furniture):
+    """update_furniture_list가 변경된 행은 dataChanged로, 새 가구는 행 삽입으로 반영하는지 테스트합니다."""
+    changed = Furniture(
+        id='1', brand='TestBrand', name='Renamed Chair', image_filename='chair.png', price=150, type='Chair',
+    )
+    added = Furniture(id='2', brand='NewBrand', name='Sofa', image_filename='sofa.png', price=300, type='Sofa')
+    
+    with patch.object(furniture_table_model, 'prefetch_thumbnails'):
+        furniture_table_model.add_furniture(sample_furniture)
+        
+        changed_rows, resets = [], []
+        furniture_table_model.dataChanged.connect(lambda top_left, bottom_right, roles: changed_rows.append(top_left.row()))
+        furniture_table_model.modelReset.connect(lambda: resets.append(True))
+        furniture_table_model.update_furniture_list([changed, added])
+    
+    assert changed_rows == [0]
+    assert not resets
+    assert furniture_table_model.index(0, 2).data() == 'Renamed Chair'
+    assert furniture_table_model.index(1, 2).data() == 'Sofa'
+    assert furniture_table_model.furniture_by_id['1'] is changed
+
+def test_furniture_table_model_update_furniture_list_removed(furniture_table_model, sample_furniture):
+    """삭제된 가구가 있으면 모델을 다시 구성하는지 테스트합니다."""
+    other = Furniture(id='2', brand='NewBrand', name='Sofa', image_filename='sofa.png', price=300, type='Sofa')
+    
+    with patch.object(furniture_table_model, 'prefetch_thumbnails'):
+        furniture_table_model.add_furniture_list([sample_furniture, other])
+        furniture_table_model.pending_thumbnails.add('sofa.png')
+        generation = furniture_table_model.thumbnail_generation
+        furniture_table_model.update_furniture_list([other])
+    
+    assert furniture_table_model.rowCount() == 1
+    assert furniture_table_model.index(0, 2).data() == 'Sofa'
+    assert '1' not in furniture_table_model.furniture_by_id
+    assert furniture_table_model.thumbnail_rows == {'sofa.png': [0]}
+    
+    # 진행 중인 썸네일 요청은 취소하지 않음
+    assert furniture_table_model.thumbnail_generation == generation
+    assert 'sofa.png' in furniture_table_model.pending_thumbnails
 
 def test_furniture_table_model_clear_furniture(furniture_table_model, sample_furniture):
     """clear_furniture 메서드가 올바르게 동작하는지 테스트합니다."""
     # 가구 추가
-    with patch.object(furniture_table_model, 'load_thumbnail_async'):
+    with patch.object(furniture_table_model, 'prefetch_thumbnails'):
         furniture_table_model.add_furniture(sample_furniture)
         assert furniture_table_model.rowCount() == 1
         assert len(furniture_table_model.furniture_items) == 1
     
-    # 스레드가 실행 중인 것처럼 모킹
-    mock_thread = MagicMock()
-    mock_thread.isRunning.return_value = True
-    furniture_table_model.loading_threads['chair.png'] = mock_thread
+    # 썸네일 요청이 진행 중인 것처럼 모킹
+    furniture_table_model.pending_thumbnails.add('chair.png')
+    furniture_table_model.thumbnail_rows['chair.png'] = [0]
     
     # clear 실행
-    furniture_table_model.clear_furniture()
+    with patch.object(furniture_table_model.thumbnail_pool, 'clear') as mock_pool_clear:
+        furniture_table_model.clear_furniture()
     
-    # 스레드 정리 확인 (수정된 대기 시간: 3000ms)
-    mock_thread.stop.assert_called_once()
-    mock_thread.quit.assert_called_once()
-    mock_thread.wait.assert_called_once_with(3000)
-    assert len(furniture_table_model.loading_threads) == 0
+    # 대기 중인 요청 취소 확인
+    mock_pool_clear.assert_called_once()
+    assert len(furniture_table_model.pending_thumbnails) == 0
+    assert len(furniture_table_model.thumbnail_rows) == 0
     
     # 모델 데이터 초기화 확인
     assert furniture_table_model.rowCount() == 0
     assert len(furniture_table_model.furniture_items) == 0
-    assert len(furniture_table_model.thumbnail_cache) == 0
+    assert furniture_table_model.furniture_by_id == {}
     
     # 헤더는 다시 설정되어야 함
     expected_headers = ["썸네일", "브랜드", "이름", "가격", "타입", "위치", "색상", "스타일"]
     for i, header in enumerate(expected_headers):
         assert furniture_table_model.headerData(i, Qt.Orientation.Horizontal) == header
 
+def test_furniture_table_model_shutdown_waits_for_running_loads(furniture_table_model):
+    """shutdown은 대기 중인 요청을 취소하고 실행 중인 작업을 제한된 시간만 기다리는지 테스트합니다."""
+    old_generation = furniture_table_model.thumbnail_generation
+    with patch.object(furniture_table_model.thumbnail_pool, 'clear') as mock_pool_clear, \
+         patch.object(furniture_table_model.thumbnail_pool, 'waitForDone') as mock_wait:
+        furniture_table_model.shutdown()
+    
+    mock_pool_clear.assert_called_once()
+    mock_wait.assert_called_once_with(FurnitureTableModel.SHUTDOWN_WAIT_MS)
+    assert furniture_table_model.thumbnail_generation == old_generation + 1
+
+def test_furniture_table_model_ignores_stale_thumbnail_results(furniture_table_model):
+    """clear_furniture 이전에 시작된 요청의 결과가 새 요청 상태를 바꾸지 않는지 테스트합니다."""
+    old_generation = furniture_table_model.thumbnail_generation
+    with patch.object(furniture_table_model.thumbnail_pool, 'start'):
+        furniture_table_model.prefetch_thumbnails(['chair.png'])
+        furniture_table_model.clear_furniture()
+        assert furniture_table_model.thumbnail_generation == old_generation + 1
+        furniture_table_model.prefetch_thumbnails(['chair.png'])
+    
+    # 이전 세대의 실패/완료 결과는 현재 로딩 중인 요청을 제거하지 않음
+    furniture_table_model.on_image_load_failed('chair.png', 'error', old_generation)
+    furniture_table_model.on_image_loaded('chair.png', QPixmap(), old_generation)
+    assert 'chair.png' in furniture_table_model.pending_thumbnails
+    assert 'chair.png' not in furniture_table_model.failed_thumbnails
+    
+    furniture_table_model.on_image_load_failed('chair.png', 'error', furniture_table_model.thumbnail_generation)
+    assert not furniture_table_model.pending_thumbnails
+    assert 'chair.png' in furniture_table_model.failed_thumbnails
+
+def test_furniture_table_model_prefetch_thumbnails(qtbot, furniture_table_model, sample_furniture, mock_image_service, mock_supabase_client):
+    """prefetch_thumbnails로 제출한 요청이 완료되면 같은 이미지를 쓰는 모든 행에 썸네일이 설정되는지 테스트합니다."""
+    furniture2 = Furniture(
+        id='2', brand='SecondBrand', name='Same Image Chair', image_filename='chair.png', price=200,
+        type='Chair', description='', link='', color='Blue', locations=[], styles=[],
+    )
+    
+    # 썸네일 크기 조정은 GUI 스레드가 아닌 워커 스레드에서 수행되어야 함
+    thumbnail_threads = []
+    def create_thumbnail(pixmap, size):
+        thumbnail_threads.append(threading.get_ident())
+        return QPixmap(50, 50)
+    mock_image_service.create_thumbnail.side_effect = create_thumbnail
+    
+    furniture_table_model.prefetch_thumbnails(['chair.png', 'chair.png'])
+    furniture_table_model.add_furniture(sample_furniture)
+    furniture_table_model.add_furniture(furniture2)
+    
+    # 같은 파일은 한 번만 요청되어야 함
+    qtbot.waitUntil(lambda: not furniture_table_model.pending_thumbnails, timeout=3000)
+    mock_supabase_client.get_furniture_image.assert_called_once_with('chair.png', 100, 100)
+    mock_image_service.create_thumbnail.assert_called_once()
+    assert thumbnail_threads[0] != threading.get_ident()
+    
+    for row in range(2):
+        decoration = furniture_table_model.index(row, 0).data(Qt.ItemDataRole.DecorationRole)
+        assert isinstance(decoration, QPixmap) and not decoration.isNull()
+    
+    furniture_table_model.shutdown()
+
+def test_furniture_table_model_batches_thumbnail_updates(qtbot, furniture_table_model):
+    """한 프레임 안에 완료된 썸네일들이 dataChanged 한 번으로 뷰에 알려지는지 테스트합니다."""
+    with patch.object(furniture_table_model, 'prefetch_thumbnails'):
+        furniture_table_model.add_furniture_list([
+            Furniture(id=str(i), brand='B', name=f'Item {i}', image_filename=f'{i}.png', price=100, type='T')
+            for i in range(3)
+        ])
+    changes = []
+    furniture_table_model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: changes.append((top_left.row(), bottom_right.row(), roles))
+    )
+    
+    generation = furniture_table_model.thumbnail_generation
+    furniture_table_model.on_image_loaded('0.png', QPixmap(10, 10), generation)
+    furniture_table_model.on_image_loaded('2.png', QPixmap(10, 10), generation)
+    assert changes == []
+    
+    qtbot.waitUntil(lambda: len(changes) > 0, timeout=1000)
+    assert changes == [(0, 2, [Qt.ItemDataRole.DecorationRole])]
+
+def test_furniture_table_model_thumbnail_load_failure(qtbot, furniture_table_model, mock_supabase_client):
+    """썸네일 작업은 제한된 스레드 풀에서 실행되고, 실패한 이미지는 다시 요청하지 않는지 테스트합니다."""
+    assert furniture_table_model.thumbnail_pool.maxThreadCount() == FurnitureTableModel.THUMBNAIL_LOAD_WORKERS
+    mock_supabase_client.get_furniture_image.side_effect = Exception("network error")
+    
+    furniture_table_model.prefetch_thumbnails(['broken.png'])
+    qtbot.waitUntil(lambda: not furniture_table_model.pending_thumbnails, timeout=3000)
+    
+    assert 'broken.png' in furniture_table_model.failed_thumbnails
+    
+    # 같은 이미지를 쓰는 행이 다시 추가되어도 실패한 요청은 반복하지 않음
+    furniture_table_model.prefetch_thumbnails(['broken.png'])
+    assert not furniture_table_model.pending_thumbnails
+    mock_supabase_client.get_furniture_image.assert_called_once()
+    furniture_table_model.shutdown()
+
+def test_furniture_table_model_mime_data_prefetches_full_image(qtbot, furniture_table_model, sample_furniture, mock_image_service, mock_supabase_client):
+    """드래그를 시작하면 원본 이미지를 백그라운드에서 한 번만 미리 로드하는지 테스트합니다."""
+    with patch.object(furniture_table_model, 'prefetch_thumbnails'):
+        furniture_table_model.add_furniture(sample_furniture)
+    
+    index = furniture_table_model.index(0, 1)
+    mime_data = furniture_table_model.mimeData([index])
+    furniture_table_model.mimeData([index])
+    assert mime_data.hasFormat(FURNITURE_ID_MIME_TYPE)
+    
+    qtbot.waitUntil(lambda: mock_image_service.download_and_cache_image.called, timeout=3000)
+    furniture_table_model.thumbnail_pool.waitForDone(3000)
+    mock_supabase_client.get_furniture_image.assert_called_once_with(sample_furniture.image_filename)
+    mock_image_service.download_and_cache_image.assert_called_once_with(b"image_data", sample_furniture.image_filename)
+
+def test_furniture_table_model_uses_shared_thumbnail_cache(furniture_table_model, sample_furniture, mock_supabase_client):
+    """QPixmapCache에 썸네일이 있으면 다운로드 요청 없이 바로 설정되는지 테스트합니다."""
+    cached_thumbnail = QPixmap(50, 50)
+    QPixmapCache.insert(thumbnail_cache_key(sample_furniture.image_filename), cached_thumbnail)
+    
+    furniture_table_model.add_furniture(sample_furniture)
+    
+    decoration = furniture_table_model.index(0, 0).data(Qt.ItemDataRole.DecorationRole)
+    assert isinstance(decoration, QPixmap) and decoration.size() == cached_thumbnail.size()
+    assert not furniture_table_model.pending_thumbnails
+    mock_supabase_client.get_furniture_image.assert_not_called()
+
+def test_furniture_table_model_reloads_evicted_thumbnail(furniture_table_model, sample_furniture):
+    """썸네일이 QPixmapCache에서 밀려난 뒤 셀이 다시 그려지면 로드를 다시 요청하는지 테스트합니다."""
+    QPixmapCache.insert(thumbnail_cache_key(sample_furniture.image_filename), QPixmap(50, 50))
+    furniture_table_model.add_furniture(sample_furniture)
+    assert not furniture_table_model.pending_thumbnails
+    
+    QPixmapCache.clear()
+    with patch.object(furniture_table_model, 'prefetch_thumbnails') as mock_prefetch:
+        decoration = furniture_table_model.index(0, 0).data(Qt.ItemDataRole.DecorationRole)
+    
+    assert decoration is None
+    mock_prefetch.assert_called_once_with([sample_furniture.image_filename])
+    
+    # 로드에 실패한 이미지는 다시 요청하지 않음
+    furniture_table_model.failed_thumbnails.add(sample_furniture.image_filename)
+    with patch.object(furniture_table_model, 'prefetch_thumbnails') as mock_prefetch:
+        furniture_table_model.index(0, 0).data(Qt.ItemDataRole.DecorationRole)
+    mock_prefetch.assert_not_called()
+
 # SelectedFurnitureTableModel 테스트들
 def test_selected_furniture_table_model():
     """SelectedFurnitureTableModel의 기본 동작을 테스트합니다."""
@@ -425,25 +575,25 @@ def test_selected_furniture_table_model():
     assert model.rowCount() == 1
     
     # 각 컬럼의 데이터 확인 (14개 컬럼)
-    assert model.item(0, 0).text() == "1"  # 번호
-    assert model.item(0, 1).text() == "Test Chair"  # 이름
-    assert model.item(0, 2).text() == "TestBrand"   # 브랜드
-    assert model.item(0, 3).text() == "Chair"       # 타입
-    assert model.item(0, 4).text() == "₩100"        # 가격
-    assert model.item(0, 5).text() == "Brown"       # 색상
-    assert model.item(0, 6).text() == "Living Room" # 위치
-    assert model.item(0, 7).text() == "Modern"      # 스타일
-    assert model.item(0, 8).text() == "60×50×80mm"  # 크기
-    assert model.item(0, 9).text() == "45mm"        # 좌석높이
-    assert model.item(0, 10).text() == "Test Description"  # 설명
-    assert model.item(0, 11).text() == "http://example.com"  # 링크
-    assert model.item(0, 12).text() == "TestAuthor"
-    assert model.item(0, 13).text() == "1"          # 개수
+    assert model.index(0, 0).data() == "1"  # 번호
+    assert model.index(0, 1).data() == "Test Chair"  # 이름
+    assert model.index(0, 2).data() == "TestBrand"   # 브랜드
+    assert model.index(0, 3).data() == "Chair"       # 타입
+    assert model.index(0, 4).data() == "₩100"        # 가격
+    assert model.index(0, 5).data() == "Brown"       # 색상
+    assert model.index(0, 6).data() == "Living Room" # 위치
+    assert model.index(0, 7).data() == "Modern"      # 스타일
+    assert model.index(0, 8).data() == "60×50×80mm"  # 크기
+    assert model.index(0, 9).data() == "45mm"        # 좌석높이
+    assert model.index(0, 10).data() == "Test Description"  # 설명
+    assert model.index(0, 11).data() == "http://example.com"  # 링크
+    assert model.index(0, 12).data() == "TestAuthor"
+    assert model.index(0, 13).data() == "1"          # 개수
     
     # 같은 가구 다시 추가 (개수 증가 확인)
     model.add_furniture(sample_furniture)
     assert model.rowCount() == 1  # 여전히 1행 (같은 가구)
-    assert model.item(0, 13).text() == "2"  # 개수가 2로 증가
+    assert model.index(0, 13).data() == "2"  # 개수가 2로 증가
     
     # 총계 계산 테스트
     assert model.get_total_count() == 2
@@ -471,6 +621,50 @@ def test_selected_furniture_table_model():
     assert model.get_total_price() == 0
 
 
+def test_selected_furniture_add_many():
+    """add_many가 가구를 집계하고 모델을 한 번만 새로고침하는지 테스트합니다."""
+    model = SelectedFurnitureTableModel()
+    chair = Furniture(id='1', brand='A', name='Chair', image_filename='chair.png', price=100, type='Chair')
+    table = Furniture(id='2', brand='B', name='Table', image_filename='table.png', price=250, type='Table')
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+    
+    model.add_many([chair, table, chair])
+    
+    assert len(resets) == 1
+    assert model.furniture_order == ['Chair', 'Table']
+    assert model.furniture_count['Chair']['count'] == 2
+    assert model.get_total_price() == 450
+    assert model.get_total_count() == 3
+
+def test_selected_furniture_sync():
+    """sync가 달라진 가구 행만 삽입/삭제/갱신하고 기존 순서를 유지하는지 테스트합니다."""
+    model = SelectedFurnitureTableModel()
+    chair = Furniture(id='1', brand='A', name='Chair', image_filename='chair.png', price=100, type='Chair')
+    table = Furniture(id='2', brand='B', name='Table', image_filename='table.png', price=250, type='Table')
+    sofa = Furniture(id='3', brand='C', name='Sofa', image_filename='sofa.png', price=500, type='Sofa')
+    model.sync([chair, table])
+    model.move_furniture_to_top('Table')
+    
+    events = []
+    model.modelReset.connect(lambda: events.append('reset'))
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(('removed', first, last)))
+    model.rowsInserted.connect(lambda parent, first, last: events.append(('inserted', first, last)))
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: events.append(('changed', top_left.row())))
+    
+    # 의자 개수 증가, 소파 추가
+    model.sync([chair, table, chair, sofa])
+    assert events == [('changed', 1), ('inserted', 2, 2)]
+    assert model.furniture_order == ['Table', 'Chair', 'Sofa']
+    assert model.furniture_count['Chair']['count'] == 2
+    
+    # 테이블 삭제
+    events.clear()
+    model.sync([chair, chair, sofa])
+    assert events == [('removed', 0, 0)]
+    assert model.furniture_order == ['Chair', 'Sofa']
+    assert model.get_total_price() == 700
+
 def test_selected_furniture_order_management():
     """가구 순서 변경 기능을 테스트합니다."""
     model = SelectedFurnitureTableModel()
@@ -621,53 +815,78 @@ def test_selected_furniture_drag_drop():
     furniture_name = mime_data.data("application/x-furniture-order").data().decode('utf-8')
     assert furniture_name == "Chair" 
 
-def test_selected_furniture_column_width_preservation():
-    """가구 순서 변경 시 컬럼 너비 복원 기능을 테스트합니다."""
+def test_selected_furniture_column_width_preservation(qtbot):
+    """가구 추가/순서 변경/정렬 후에도 뷰의 컬럼 너비가 유지되는지 테스트합니다."""
     model = SelectedFurnitureTableModel()
+    view = QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    view.setColumnWidth(1, 300)
     
-    # 콜백 호출 횟수를 추적하는 모킹 함수
-    callback_call_count = [0]  # 리스트를 사용해서 내부 함수에서 수정 가능하게 함
-    
-    def mock_column_width_callback():
-        callback_call_count[0] += 1
-    
-    # 콜백 설정
-    model.set_column_width_callback(mock_column_width_callback)
-    
-    # 가구 추가 (refresh_model이 호출됨)
     chair = Furniture(
         id='1', brand='TestBrand', name='Chair', image_filename='chair.png', price=100,
         type='Chair', description='Test Chair', link='', color='Brown', 
         locations=['Living Room'], styles=['Modern'], width=60, depth=50, height=80
     )
-    
-    model.add_furniture(chair)
-    assert callback_call_count[0] == 1  # add_furniture -> refresh_model -> 콜백 호출
-    
-    # 순서 변경 (refresh_model이 다시 호출됨)
-    model.move_furniture_up("Chair")  # 이미 맨 위이므로 실제로는 변경 안됨
-    
-    # 다른 가구 추가 후 순서 변경
     table = Furniture(
         id='2', brand='TestBrand', name='Table', image_filename='table.png', price=200,
         type='Table', description='Test Table', link='', color='White', 
         locations=['Dining Room'], styles=['Modern'], width=120, depth=80, height=75
     )
     
+    # 가구 추가 (refresh_model로 모델 리셋)
+    model.add_furniture(chair)
     model.add_furniture(table)
-    assert callback_call_count[0] == 2  # 두 번째 add_furniture -> refresh_model -> 콜백 호출
+    assert view.columnWidth(1) == 300
     
-    # 실제로 순서 변경이 일어나는 경우
+    # 실제로 순서 변경이 일어나는 경우 (리셋 없이 layoutChanged만 발생)
+    resets = []
+    layout_changes = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.layoutChanged.connect(lambda: layout_changes.append(True))
     model.move_furniture_up("Table")  # Table을 위로 이동
-    assert callback_call_count[0] == 3  # move_furniture_up -> refresh_model -> 콜백 호출
+    assert model.furniture_order == ["Table", "Chair"]
     
     # 정렬 기능 테스트
     model.sort_furniture("name", True)
-    assert callback_call_count[0] == 4  # sort_furniture -> refresh_model -> 콜백 호출
+    assert model.furniture_order == ["Chair", "Table"]
+    assert resets == [] and len(layout_changes) == 2
+    assert view.columnWidth(1) == 300
+
+def test_selected_furniture_sort_uses_vertical_sort_hint():
+    """정렬 시 VerticalSortHint로 layoutChanged를 알리는지 테스트합니다."""
+    model = SelectedFurnitureTableModel()
+    model.add_many([
+        Furniture(id='1', brand='A', name='Table', image_filename='table.png', price=200, type='Table'),
+        Furniture(id='2', brand='B', name='Chair', image_filename='chair.png', price=100, type='Chair'),
+    ])
+    hints = []
+    model.layoutChanged.connect(lambda parents, hint: hints.append(hint))
+    
+    model.sort_furniture("name", True)
+    model.move_furniture_to_bottom("Chair")
     
-    # 콜백이 제대로 설정되고 호출되는지 확인
-    assert model.column_width_callback is not None
-    assert callable(model.column_width_callback) 
+    assert hints == [QAbstractItemModel.LayoutChangeHint.VerticalSortHint,
+                     QAbstractItemModel.LayoutChangeHint.NoLayoutChangeHint]
+
+def test_selected_furniture_reorder_keeps_selection(qtbot):
+    """순서 변경 후에도 선택이 이동한 가구 행을 따라가는지 테스트합니다."""
+    model = SelectedFurnitureTableModel()
+    model.add_many([
+        Furniture(id=str(i), brand='TestBrand', name=name, image_filename=f'{i}.png', price=100, type='Chair')
+        for i, name in enumerate(["A", "B", "C"])
+    ])
+    view = QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+    view.selectRow(2)
+    
+    model.move_furniture_to_top("C")
+    
+    selected = view.selectionModel().selectedRows()
+    assert [index.row() for index in selected] == [0]
+    assert model.get_furniture_name_at_row(0) == "C"
+    assert model.data(model.index(2, 0)) == "3"
 
 def test_selected_furniture_row_numbers():
     """번호 컬럼이 순서에 따라 올바르게 업데이트되는지 테스트합니다."""
@@ -698,49 +917,99 @@ def test_selected_furniture_row_numbers():
     model.add_furniture(sofa)
     
     # 초기 번호 확인 (Chair=1, Table=2, Sofa=3)
-    assert model.item(0, 0).text() == "1"  # Chair 번호
-    assert model.item(1, 0).text() == "2"  # Table 번호
-    assert model.item(2, 0).text() == "3"  # Sofa 번호
+    assert model.index(0, 0).data() == "1"  # Chair 번호
+    assert model.index(1, 0).data() == "2"  # Table 번호
+    assert model.index(2, 0).data() == "3"  # Sofa 번호
     
     # 가구 이름 확인
-    assert model.item(0, 1).text() == "Chair"
-    assert model.item(1, 1).text() == "Table"
-    assert model.item(2, 1).text() == "Sofa"
+    assert model.index(0, 1).data() == "Chair"
+    assert model.index(1, 1).data() == "Table"
+    assert model.index(2, 1).data() == "Sofa"
     
     # Table을 맨 위로 이동 (Table=1, Chair=2, Sofa=3)
     model.move_furniture_to_top("Table")
     
     # 번호가 다시 매겨졌는지 확인
-    assert model.item(0, 0).text() == "1"  # Table 번호
-    assert model.item(1, 0).text() == "2"  # Chair 번호
-    assert model.item(2, 0).text() == "3"  # Sofa 번호
+    assert model.index(0, 0).data() == "1"  # Table 번호
+    assert model.index(1, 0).data() == "2"  # Chair 번호
+    assert model.index(2, 0).data() == "3"  # Sofa 번호
     
     # 가구 이름 확인
-    assert model.item(0, 1).text() == "Table"
-    assert model.item(1, 1).text() == "Chair"
-    assert model.item(2, 1).text() == "Sofa"
+    assert model.index(0, 1).data() == "Table"
+    assert model.index(1, 1).data() == "Chair"
+    assert model.index(2, 1).data() == "Sofa"
     
     # Sofa를 위로 이동 (Table=1, Sofa=2, Chair=3)
     model.move_furniture_up("Sofa")
     
     # 번호가 다시 매겨졌는지 확인
-    assert model.item(0, 0).text() == "1"  # Table 번호
-    assert model.item(1, 0).text() == "2"  # Sofa 번호
-    assert model.item(2, 0).text() == "3"  # Chair 번호
+    assert model.index(0, 0).data() == "1"  # Table 번호
+    assert model.index(1, 0).data() == "2"  # Sofa 번호
+    assert model.index(2, 0).data() == "3"  # Chair 번호
     
     # 가구 이름 확인
-    assert model.item(0, 1).text() == "Table"
-    assert model.item(1, 1).text() == "Sofa"
-    assert model.item(2, 1).text() == "Chair"
+    assert model.index(0, 1).data() == "Table"
+    assert model.index(1, 1).data() == "Sofa"
+    assert model.index(2, 1).data() == "Chair"
     
     # 정렬 후에도 번호가 올바른지 확인 (이름순 정렬: Chair=1, Sofa=2, Table=3)
     model.sort_furniture("name", True)
     
-    assert model.item(0, 0).text() == "1"  # Chair 번호
-    assert model.item(1, 0).text() == "2"  # Sofa 번호
-    assert model.item(2, 0).text() == "3"  # Table 번호
+    assert model.index(0, 0).data() == "1"  # Chair 번호
+    assert model.index(1, 0).data() == "2"  # Sofa 번호
+    assert model.index(2, 0).data() == "3"  # Table 번호
     
     # 가구 이름 확인
-    assert model.item(0, 1).text() == "Chair"
-    assert model.item(1, 1).text() == "Sofa"
-    assert model.item(2, 1).text() == "Table" 
\ No newline at end of file
+    assert model.index(0, 1).data() == "Chair"
+    assert model.index(1, 1).data() == "Sofa"
+    assert model.index(2, 1).data() == "Table" 
+def test_prefetch_full_images_downloads_each_file_once_in_parallel(qtbot, mock_image_service, mock_supabase_client):
+    """원본 이미지를 파일별로 한 번씩 병렬로 받아 공유 캐시에 올린 뒤 GUI 스레드에서 완료를 알리는지 테스트합니다."""
+    mock_image_service.executor = ThreadPoolExecutor(max_workers=2)
+    mock_image_service.get_cached_pixmap.return_value = None
+    mock_supabase_client.get_furniture_image.return_value = b"image"
+    finished_threads = []
+    
+    prefetch_full_images(mock_image_service, mock_supabase_client, ['a.png', 'b.png', 'a.png'],
+                         lambda: finished_threads.append(threading.get_ident()))
+    qtbot.waitUntil(lambda: len(finished_threads) > 0)
+    mock_image_service.executor.shutdown()
+    
+    assert finished_threads == [threading.get_ident()]
+    assert sorted(call.args[0] for call in mock_supabase_client.get_furniture_image.call_args_list) == ['a.png', 'b.png']
+    assert mock_image_service.download_and_cache_image.call_count == 2
+
+def test_prefetch_full_images_finishes_when_downloads_fail(qtbot, mock_image_service, mock_supabase_client):
+    """다운로드가 실패해도 완료 콜백이 호출되는지 테스트합니다."""
+    mock_image_service.executor = ThreadPoolExecutor(max_workers=2)
+    mock_image_service.get_cached_pixmap.return_value = None
+    mock_supabase_client.get_furniture_image.side_effect = Exception("Network Error")
+    on_finished = MagicMock()
+    
+    prefetch_full_images(mock_image_service, mock_supabase_client, ['a.png'], on_finished)
+    qtbot.waitUntil(lambda: on_finished.called)
+    mock_image_service.executor.shutdown()
+    
+    on_finished.assert_called_once()
+
+def test_prefetch_full_images_without_files_finishes_immediately(mock_image_service, mock_supabase_client):
+    """받을 이미지가 없으면 즉시 완료 콜백을 호출하는지 테스트합니다."""
+    on_finished = MagicMock()
+    
+    prefetch_full_images(mock_image_service, mock_supabase_client, [], on_finished)
+    
+    on_finished.assert_called_once()
+    mock_image_service.executor.submit.assert_not_called()
+
+def test_selected_furniture_data_roles():
+    """컬럼별 표시 텍스트와 번호 컬럼의 정렬/폰트 역할 값을 테스트합니다."""
+    model = SelectedFurnitureTableModel()
+    chair = Furniture(id='1', brand='A', name='Chair', image_filename='chair.png', price=100, type='Chair')
+    model.add_many([chair, chair])
+    
+    assert model.data(model.index(0, 0)) == "1"
+    assert model.data(model.index(0, 1)) == "Chair"
+    assert model.data(model.index(0, 13)) == "2"
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.TextAlignmentRole) == Qt.AlignmentFlag.AlignCenter
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.FontRole).bold()
+    assert model.data(model.index(0, 1), Qt.ItemDataRole.FontRole) is None
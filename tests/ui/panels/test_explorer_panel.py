@@ -5,7 +5,7 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtWidgets import QApplication, QHeaderView
 from PyQt6.QtCore import Qt
 
 from src.ui.panels.explorer_panel import ExplorerPanel
@@ -27,11 +27,13 @@ def mock_supabase_client():
     """Mock SupabaseClient"""
     mock = MagicMock()
     mock.get_all_furniture.return_value = []
+    mock.get_cached_furniture_list.return_value = None
+    mock.fetch_furniture_list.return_value = []
     return mock
 
 def test_explorer_panel_initialization(qtbot, mock_supabase_client):
     """ExplorerPanel이 올바르게 초기화되는지 테스트합니다."""
-    with patch('src.ui.panels.explorer_panel.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
         panel = ExplorerPanel()
         qtbot.addWidget(panel)
         
@@ -42,11 +44,21 @@ def test_explorer_panel_initialization(qtbot, mock_supabase_client):
         panel.show()
         assert panel.isVisible()
 
+def test_explorer_panel_fixed_row_height(qtbot, mock_supabase_client):
+    """가구 목록 행 높이가 썸네일 크기로 고정되는지 테스트합니다."""
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    
+    vertical_header = panel.furniture_table.verticalHeader()
+    assert vertical_header.sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+    assert vertical_header.defaultSectionSize() == 100
+
 def test_explorer_panel_load_furniture(qtbot, mock_supabase_client, sample_furniture):
     """ExplorerPanel이 가구 데이터를 올바르게 로드하는지 테스트합니다."""
     mock_supabase_client.get_all_furniture.return_value = [sample_furniture]
     
-    with patch('src.ui.panels.explorer_panel.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
         panel = ExplorerPanel()
         qtbot.addWidget(panel)
         
@@ -59,7 +71,7 @@ def test_explorer_panel_load_furniture(qtbot, mock_supabase_client, sample_furni
 
 def test_explorer_panel_search_functionality(qtbot, mock_supabase_client):
     """ExplorerPanel의 검색 기능을 테스트합니다."""
-    with patch('src.ui.panels.explorer_panel.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
         panel = ExplorerPanel()
         qtbot.addWidget(panel)
         
@@ -72,7 +84,7 @@ def test_explorer_panel_search_functionality(qtbot, mock_supabase_client):
 
 def test_explorer_panel_filter_functionality(qtbot, mock_supabase_client):
     """ExplorerPanel의 필터 기능을 테스트합니다."""
-    with patch('src.ui.panels.explorer_panel.SupabaseClient', return_value=mock_supabase_client):
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
         panel = ExplorerPanel()
         qtbot.addWidget(panel)
         
@@ -83,6 +95,244 @@ def test_explorer_panel_filter_functionality(qtbot, mock_supabase_client):
         # TODO: 실제 구현에 따라 추가 검증 로직 구현
         assert True
 
+def visible_names(panel):
+    """필터 프록시를 통과한 가구 이름 목록을 반환합니다."""
+    proxy = panel.furniture_proxy
+    return [proxy.index(row, 2).data() for row in range(proxy.rowCount())]
+
+def test_explorer_panel_filter_furniture_search_and_brand(qtbot, mock_supabase_client, sample_furniture):
+    """검색어와 브랜드 필터에 따라 행이 표시/숨김되는지 테스트합니다."""
+    other = Furniture(
+        id='2', brand='OtherBrand', name='Oak Table', image_filename='table.png', price=300,
+        type='Table', description='Solid wood'
+    )
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    
+    with patch.object(panel.furniture_model, 'prefetch_thumbnails'):
+        panel.furniture_model.add_furniture(sample_furniture)
+        panel.furniture_model.add_furniture(other)
+    panel.brand_filter.addItems(['TestBrand', 'OtherBrand'])
+    
+    panel.search_input.setText("WOOD")
+    panel.filter_furniture()
+    assert visible_names(panel) == ['Oak Table']
+    
+    panel.search_input.setText("")
+    panel.brand_filter.setCurrentText('TestBrand')
+    panel.filter_furniture()
+    assert visible_names(panel) == ['Test Chair']
+    assert panel.furniture_proxy.brand == 'TestBrand'
+    
+    # "전체 브랜드"를 선택하면 제한 없음(None)으로 설정
+    panel.brand_filter.setCurrentIndex(0)
+    panel.filter_furniture()
+    assert panel.furniture_proxy.brand is None
+    assert visible_names(panel) == ['Test Chair', 'Oak Table']
+
+def test_explorer_panel_filter_furniture_price_range(qtbot, mock_supabase_client, sample_furniture):
+    """가격 범위 입력에 따라 행이 필터링되고, 숫자가 아닌 입력은 무시되는지 테스트합니다."""
+    expensive = Furniture(
+        id='2', brand='TestBrand', name='Sofa', image_filename='sofa.png', price=500000, type='Sofa'
+    )
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    
+    with patch.object(panel.furniture_model, 'prefetch_thumbnails'):
+        panel.furniture_model.add_furniture(sample_furniture)
+        panel.furniture_model.add_furniture(expensive)
+    
+    panel.min_price_input.setText("1000")
+    panel.max_price_input.setText("abc")
+    panel.filter_furniture()
+    assert visible_names(panel) == ['Sofa']
+    
+    assert ExplorerPanel._parse_price_bound(" 300 ") == 300
+    assert ExplorerPanel._parse_price_bound("") is None
+
+def test_explorer_panel_search_is_debounced(qtbot, mock_supabase_client):
+    """연속 입력 시 마지막 입력 후 한 번만 필터링하는지 테스트합니다."""
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    
+    with patch.object(panel.furniture_proxy, 'set_filters') as mock_set_filters:
+        for text in ("c", "ch", "cha", "chair"):
+            panel.search_input.setText(text)
+        mock_set_filters.assert_not_called()
+        
+        qtbot.waitUntil(lambda: mock_set_filters.called, timeout=1000)
+        assert mock_set_filters.call_count == 1
+        assert mock_set_filters.call_args.args[0] == "chair"
+
+def test_explorer_panel_combo_change_consumes_pending_search(qtbot, mock_supabase_client):
+    """입력 대기 중에 콤보박스로 필터링하면 대기 중인 필터링이 한 번 더 실행되지 않는지 테스트합니다."""
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    panel.brand_filter.addItem("TestBrand")
+    
+    with patch.object(panel.furniture_proxy, 'set_filters') as mock_set_filters:
+        panel.search_input.setText("chair")
+        panel.brand_filter.setCurrentIndex(1)
+        assert not panel._filter_timer.isActive()
+        
+        qtbot.wait(ExplorerPanel.FILTER_DEBOUNCE_MS * 2)
+        assert mock_set_filters.call_count == 1
+        assert mock_set_filters.call_args.args[:2] == ("chair", "TestBrand")
+
+def test_explorer_panel_load_furniture_data_dedupes_filter_options(qtbot, mock_supabase_client, sample_furniture):
+    """다시 로드해도 필터 옵션이 중복 없이 한 번씩만 추가되는지 테스트합니다."""
+    rows = [
+        {'id': '1', 'name': 'Chair A', 'brand': 'TestBrand', 'type': 'Chair', 'price': 100,
+         'image_filename': 'a.png', 'color': 'Brown', 'locations': ['Living Room'], 'styles': ['Modern']},
+        {'id': '2', 'name': 'Chair B', 'brand': 'TestBrand', 'type': 'Chair', 'price': 200,
+         'image_filename': 'b.png', 'color': 'Brown', 'locations': ['Living Room'], 'styles': ['Modern']},
+    ]
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    mock_supabase_client.fetch_furniture_list.return_value = rows
+    
+    with patch.object(panel.furniture_model, 'prefetch_thumbnails'):
+        panel.load_furniture_data()
+        panel.load_furniture_data()
+    
+    assert [panel.brand_filter.itemText(i) for i in range(panel.brand_filter.count())] == ['전체 브랜드', 'TestBrand']
+    assert [panel.type_filter.itemText(i) for i in range(panel.type_filter.count())] == ['전체 타입', 'Chair']
+    assert panel._brands_seen == {'TestBrand'}
+    assert panel.furniture_model.rowCount() == 2
+
+def test_explorer_panel_load_furniture_data_uses_disk_cache(qtbot, mock_supabase_client):
+    """캐시된 목록을 먼저 표시하고, 백그라운드 조회 결과로 변경분을 갱신하는지 테스트합니다."""
+    cached_row = {'id': '1', 'name': 'Old Chair', 'brand': 'TestBrand', 'type': 'Chair', 'price': 100,
+                  'image_filename': 'a.png'}
+    fresh_rows = [dict(cached_row, name='New Chair'),
+                  {'id': '2', 'name': 'Sofa', 'brand': 'NewBrand', 'type': 'Sofa', 'price': 300,
+                   'image_filename': 'b.png'}]
+    # 캐시가 오래되어 max_age 조건으로는 읽히지 않는 경우
+    mock_supabase_client.get_cached_furniture_list.side_effect = (
+        lambda max_age=None: None if max_age is not None else [cached_row]
+    )
+    mock_supabase_client.fetch_furniture_list.return_value = fresh_rows
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client), \
+         patch('src.ui.panels.common.FurnitureTableModel.prefetch_thumbnails'):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+        
+        qtbot.waitUntil(lambda: panel.furniture_model.rowCount() == 2, timeout=3000)
+    
+    assert visible_names(panel) == ['New Chair', 'Sofa']
+    assert 'NewBrand' in panel._brands_seen
+    mock_supabase_client.fetch_furniture_list.assert_called_once()
+
+def test_explorer_panel_load_furniture_data_skips_refresh_for_fresh_cache(qtbot, mock_supabase_client):
+    """최근에 저장된 캐시가 있으면 서버를 다시 조회하지 않는지 테스트합니다."""
+    cached_row = {'id': '1', 'name': 'Chair', 'brand': 'TestBrand', 'type': 'Chair', 'price': 100,
+                  'image_filename': 'a.png'}
+    mock_supabase_client.get_cached_furniture_list.return_value = [cached_row]
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client), \
+         patch('src.ui.panels.explorer_panel.QThreadPool.globalInstance') as mock_global_pool:
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    
+    assert visible_names(panel) == ['Chair']
+    mock_supabase_client.get_cached_furniture_list.assert_called_once_with(max_age=ExplorerPanel.FURNITURE_CACHE_MAX_AGE)
+    mock_supabase_client.fetch_furniture_list.assert_not_called()
+    mock_global_pool.return_value.start.assert_not_called()
+
+def test_explorer_panel_loads_only_visible_thumbnails(qtbot, mock_supabase_client):
+    """화면에 보이는 행과 여유 행의 썸네일만 로드를 요청하는지 테스트합니다."""
+    rows = [{'id': str(i), 'name': f'Chair {i}', 'brand': 'TestBrand', 'type': 'Chair', 'price': 100,
+             'image_filename': f'{i}.png'} for i in range(100)]
+    mock_supabase_client.fetch_furniture_list.return_value = rows
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    panel.resize(600, 500)
+    panel.show()
+    qtbot.waitExposed(panel)
+    
+    with patch.object(panel.furniture_model, 'load_thumbnails_for_rows') as mock_load:
+        panel._schedule_visible_loads()
+        requested = mock_load.call_args.args[0]
+        assert requested[0] == 0
+        assert len(requested) < 20
+        
+        panel.furniture_table.verticalScrollBar().setValue(50)
+        requested = mock_load.call_args.args[0]
+        assert requested[0] == panel.furniture_table.rowAt(0) - ExplorerPanel.THUMBNAIL_PREFETCH_MARGIN
+
+def test_explorer_panel_loads_first_page_on_show(qtbot, mock_supabase_client):
+    """생성 시점이 아니라 패널이 표시된 뒤 첫 화면의 썸네일을 한 번에 요청하는지 테스트합니다."""
+    rows = [{'id': str(i), 'name': f'Chair {i}', 'brand': 'TestBrand', 'type': 'Chair', 'price': 100,
+             'image_filename': f'{i}.png'} for i in range(100)]
+    mock_supabase_client.fetch_furniture_list.return_value = rows
+    
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    panel.resize(600, 500)
+    
+    with patch.object(panel.furniture_model, 'load_thumbnails_for_rows') as mock_load:
+        panel.show()
+        qtbot.waitUntil(lambda: mock_load.called)
+        requested = mock_load.call_args.args[0]
+        assert requested[0] == 0 and 0 < len(requested) < 20
+        
+        # 필터링 후에도 새로 보이는 행을 요청
+        mock_load.reset_mock()
+        panel.search_input.setText("Chair 5")
+        panel.filter_furniture()
+        requested = mock_load.call_args.args[0]
+        assert all(rows[row]['name'].startswith('Chair 5') for row in requested)
+
+def test_explorer_panel_mouse_press_uses_model_mime_data(qtbot, mock_supabase_client, sample_furniture):
+    """패널에서 시작한 드래그도 테이블 모델의 mimeData(가구 ID)를 사용하는지 테스트합니다."""
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    with patch.object(panel.furniture_model, 'prefetch_thumbnails'):
+        panel.furniture_model.add_furniture(sample_furniture)
+    
+    event = MagicMock()
+    event.button.return_value = Qt.MouseButton.LeftButton
+    with patch.object(panel.furniture_table, 'indexAt', return_value=panel.furniture_proxy.index(0, 1)), \
+         patch.object(panel.furniture_model, 'mimeData', wraps=panel.furniture_model.mimeData) as mock_mime_data, \
+         patch('src.ui.panels.explorer_panel.QDrag') as MockDrag:
+        panel.mousePressEvent(event)
+    
+    source_index = mock_mime_data.call_args.args[0][0]
+    assert source_index.model() is panel.furniture_model and source_index.row() == 0
+    mime_data = MockDrag.return_value.setMimeData.call_args.args[0]
+    assert bytes(mime_data.data("application/x-furniture-id")).decode() == str(sample_furniture.id)
+    MockDrag.return_value.exec.assert_called_once()
+
+def test_furniture_filter_proxy_skips_unchanged_filters(qtbot, mock_supabase_client):
+    """필터 조건이 바뀌지 않았으면 전체 행을 다시 필터링하지 않는지 테스트합니다."""
+    with patch('src.ui.panels.explorer_panel.SupabaseClient.get_instance', return_value=mock_supabase_client):
+        panel = ExplorerPanel()
+        qtbot.addWidget(panel)
+    proxy = panel.furniture_proxy
+    
+    with patch.object(proxy, 'invalidateFilter') as mock_invalidate:
+        panel.filter_furniture()
+        mock_invalidate.assert_not_called()
+        
+        panel.search_input.setText("Chair")
+        panel.filter_furniture()
+        panel.filter_furniture()
+        mock_invalidate.assert_called_once()
+    assert proxy.search_text == "chair"
+
 def test_explorer_panel_placeholder():
     """ExplorerPanel 테스트를 위한 플레이스홀더 테스트"""
     # TODO: ExplorerPanel에 대한 실제 테스트 구현
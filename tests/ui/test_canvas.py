@@ -8,6 +8,7 @@ from PyQt6.QtGui import QDropEvent, QDragEnterEvent, QDragMoveEvent, QPixmap, QM
 from src.models.furniture import Furniture
 from src.ui.canvas import Canvas, FurnitureItem
 from src.ui.panels.bottom_panel import BottomPanel
+from src.ui.panels.common import FURNITURE_ID_MIME_TYPE
 
 
 @pytest.fixture
@@ -55,7 +56,7 @@ def mock_furniture_data_for_canvas():
 def test_canvas_drop_furniture_item(MockImageService, MockSupabaseClient, canvas_widget, mock_furniture_data_for_canvas, qtbot, mocker):
     """Canvas에 FurnitureItem을 드롭했을 때의 동작을 테스트합니다."""
     # Mock ImageService의 get_cached_image_path
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     mock_image_service_instance.get_cached_image_path.return_value = "/fake/path/to/image.png"
     
     # canvas_area 크기를 명시적으로 설정
@@ -69,7 +70,7 @@ def test_canvas_drop_furniture_item(MockImageService, MockSupabaseClient, canvas
     furniture_data_dict = mock_furniture_data_for_canvas
     
     mime_data = QMimeData()
-    mime_data.setData("application/x-furniture", str(furniture_data_dict).encode())
+    mime_data.setData(FURNITURE_ID_MIME_TYPE, furniture_data_dict["id"].encode())
 
     # 드롭 위치를 아이템이 캔버스 내부에 완전히 들어오도록 수정 (예: 200,200)
     # FurnitureItem의 기본 크기는 200x200
@@ -80,6 +81,9 @@ def test_canvas_drop_furniture_item(MockImageService, MockSupabaseClient, canvas
     mock_main_window = MagicMock()
     mock_bottom_panel_instance = MagicMock(spec=BottomPanel)
     mock_main_window.bottom_panel = mock_bottom_panel_instance  # bottom_panel 속성으로 설정
+    # 드롭 시 ID로 조회할 로드된 가구 데이터
+    loaded_furniture = Furniture(**furniture_data_dict)
+    mock_main_window.furniture_by_id = {loaded_furniture.id: loaded_furniture}
     mocker.patch.object(canvas_widget, 'window', return_value=mock_main_window)
     
     mock_map_from = mocker.patch.object(canvas_widget.canvas_area, 'mapFrom')
@@ -126,7 +130,7 @@ def test_canvas_drop_furniture_item(MockImageService, MockSupabaseClient, canvas
     assert len(canvas_widget.furniture_items) == 1
     added_item = canvas_widget.furniture_items[0]
     assert isinstance(added_item, FurnitureItem)
-    assert added_item.furniture.id == furniture_data_dict["id"]
+    assert added_item.furniture is loaded_furniture
     
     assert canvas_widget.selected_item is added_item
     assert added_item.is_selected is True
@@ -149,6 +153,27 @@ def test_canvas_drop_furniture_item(MockImageService, MockSupabaseClient, canvas
     mock_bottom_panel_instance.update_panel.assert_called_once_with(canvas_widget.furniture_items)
     mock_load_image.assert_called_once()
 
+def test_canvas_drop_unknown_furniture_id_is_ignored(canvas_widget, mocker):
+    """로드되지 않은 가구 ID가 드롭되면 아이템을 추가하지 않고 무시하는지 테스트합니다."""
+    mock_main_window = MagicMock()
+    mock_main_window.furniture_by_id = {}
+    mocker.patch.object(canvas_widget, 'window', return_value=mock_main_window)
+
+    mime_data = QMimeData()
+    mime_data.setData(FURNITURE_ID_MIME_TYPE, b"unknown-id")
+    drop_event = QDropEvent(
+        QPointF(10.0, 10.0),
+        Qt.DropAction.CopyAction,
+        mime_data,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+
+    canvas_widget.dropEvent(drop_event)
+
+    assert not drop_event.isAccepted()
+    assert canvas_widget.furniture_items == []
+
 @patch('src.ui.canvas.CanvasSizeDialog')
 def test_canvas_create_new_collage(MockCanvasSizeDialog, canvas_widget, qtbot, mocker):
     """'새 콜라주 만들기' 기능을 테스트합니다."""
@@ -412,7 +437,7 @@ def test_canvas_load_collage_successful(
     mock_builtin_open.return_value = mock_open(read_data=json.dumps(mock_collage_data)).return_value
 
 
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     # load_collage는 get_furniture_list를 사용하고, 반환값은 dict의 list여야 함
     # db_item_furniture_obj = Furniture(**loaded_furniture_data_dict) # 객체가 아닌 dict 유지
     mock_supabase_instance.get_furniture_list.return_value = [loaded_furniture_data_dict]
@@ -433,6 +458,9 @@ def test_canvas_load_collage_successful(
     mock_main_window.bottom_panel = mock_bottom_panel_instance  # bottom_panel 속성으로 설정
     mocker.patch.object(canvas_widget, 'window', return_value=mock_main_window)
 
+    # 원본 이미지 미리 받기는 즉시 완료된 것으로 처리 (비동기 동작은 panels/test_common.py에서 테스트)
+    mocker.patch('src.ui.canvas.prefetch_full_images',
+                 side_effect=lambda image_service, supabase, image_filenames, on_finished, parent=None: on_finished())
     canvas_widget.load_collage()
 
     mock_get_open_file_name.assert_called_once()
@@ -451,6 +479,34 @@ def test_canvas_load_collage_successful(
     mock_update_bottom_panel.assert_called_once()
     MockQMessageBoxInfo.assert_called_once_with(canvas_widget, "성공", "콜라주가 성공적으로 불러와졌습니다.")
 
+@patch('src.ui.canvas.QFileDialog.getOpenFileName')
+def test_canvas_load_collage_ignored_while_loading_items(mock_get_open_file_name, canvas_widget):
+    """이전 콜라주의 이미지를 받는 중에는 다시 불러오기를 시작하지 않는지 테스트합니다."""
+    canvas_widget.is_loading_items = True
+
+    canvas_widget.load_collage()
+
+    mock_get_open_file_name.assert_not_called()
+
+def test_canvas_load_items_after_prefetch_blocks_input_until_finished(canvas_widget, mocker):
+    """원본 이미지를 받는 동안 캔버스 입력을 막고, 완료되면 아이템을 만든 뒤 다시 허용하는지 테스트합니다."""
+    mock_prefetch = mocker.patch('src.ui.canvas.prefetch_full_images')
+    mocker.patch('src.ui.canvas.SupabaseClient')
+    build_items = MagicMock()
+
+    canvas_widget.load_items_after_prefetch(['chair.png'], build_items)
+
+    assert canvas_widget.is_loading_items
+    assert not canvas_widget.canvas_area.isEnabled()
+    build_items.assert_not_called()
+
+    on_finished = mock_prefetch.call_args.args[3]
+    on_finished()
+
+    build_items.assert_called_once()
+    assert not canvas_widget.is_loading_items
+    assert canvas_widget.canvas_area.isEnabled()
+
 @patch('src.ui.canvas.QFileDialog.getOpenFileName')
 @patch('builtins.open', new_callable=mock_open)
 @patch('json.load')
@@ -509,7 +565,7 @@ def test_canvas_load_collage_furniture_not_found_in_db(
     mock_json_load.return_value = collage_data_from_file
     mock_builtin_open.return_value = mock_open(read_data=json.dumps(collage_data_from_file)).return_value
 
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     # db_furniture_data_valid는 DB에 있는 Furniture 데이터의 dict 형태
     # get_furniture_list는 이러한 dict의 list를 반환해야 함
     db_furniture_data_valid = { # Supabase에서 반환될 Furniture 객체의 속성
@@ -521,7 +577,7 @@ def test_canvas_load_collage_furniture_not_found_in_db(
 
     mock_supabase_instance.get_furniture_list.return_value = [db_furniture_data_valid]
 
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     mock_image_service_instance.get_cached_image_path.return_value = "/fake/path/image.png"
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image', return_value=QPixmap(100, 100))
 
@@ -534,6 +590,9 @@ def test_canvas_load_collage_furniture_not_found_in_db(
     mock_main_window.bottom_panel = mock_bottom_panel_instance  # bottom_panel 속성으로 설정
     mocker.patch.object(canvas_widget, 'window', return_value=mock_main_window)
 
+    # 원본 이미지 미리 받기는 즉시 완료된 것으로 처리 (비동기 동작은 panels/test_common.py에서 테스트)
+    mocker.patch('src.ui.canvas.prefetch_full_images',
+                 side_effect=lambda image_service, supabase, image_filenames, on_finished, parent=None: on_finished())
     canvas_widget.load_collage()
 
     mock_get_open_file_name.assert_called_once()
@@ -632,6 +691,37 @@ def test_canvas_export_collage_successful(mock_pixmap_save, mock_get_save_file_n
     mock_pixmap_save.assert_called_once_with(test_export_path)
     mock_show_info.assert_called_once()
 
+def test_canvas_generate_collage_image_reuses_export_buffer(canvas_widget):
+    """연속 내보내기 시 같은 크기의 이미지 버퍼를 재사용하고, 크기가 바뀌면 새로 할당하는지 테스트합니다."""
+    canvas_widget.canvas_area.setFixedSize(300, 200)
+    first = canvas_widget._generate_collage_image()
+    buffer = canvas_widget._export_buffer
+    assert buffer is not None and buffer.size() == QSize(300, 200)
+
+    second = canvas_widget._generate_collage_image()
+    assert canvas_widget._export_buffer is buffer
+    assert second.toImage().pixelColor(10, 10) == QColor("white")
+    assert first.size() == second.size()
+
+    canvas_widget.canvas_area.setFixedSize(400, 250)
+    canvas_widget._generate_collage_image()
+    assert canvas_widget._export_buffer is not buffer
+    assert canvas_widget._export_buffer.size() == QSize(400, 250)
+
+def test_canvas_generate_collage_image_skips_scaling_same_size(canvas_widget, mock_furniture_data_for_canvas, mocker):
+    """아이템 크기와 pixmap 크기가 같으면 내보내기 시 리샘플링(scaled)을 하지 않는지 테스트합니다."""
+    mocker.patch.object(FurnitureItem, 'load_image', return_value=QPixmap(100, 100))
+    item = FurnitureItem(Furniture(**mock_furniture_data_for_canvas), parent=canvas_widget.canvas_area)
+    item.setFixedSize(QSize(120, 80))
+    item.pixmap = QPixmap(120, 80)
+    item.pixmap.fill(Qt.GlobalColor.red)
+    canvas_widget.furniture_items.append(item)
+
+    mock_scaled = mocker.patch('PyQt6.QtGui.QPixmap.scaled')
+    canvas_widget._generate_collage_image()
+
+    mock_scaled.assert_not_called()
+
 @patch('src.ui.canvas.QFileDialog.getSaveFileName')
 def test_canvas_export_collage_no_items(mock_get_save_file_name, canvas_widget, mocker):
     """내보낼 아이템이 없을 때 경고 메시지 테스트"""
@@ -781,6 +871,31 @@ def test_canvas_adjust_furniture_positions(MockImageService, MockSupabaseClient,
     assert item.pos().x() == expected_new_x, f"아이템의 X 위치. 예상: {expected_new_x}, 실제: {item.pos().x()}"
     assert item.pos().y() == expected_new_y, f"아이템의 Y 위치. 예상: {expected_new_y}, 실제: {item.pos().y()}"
 
+@patch('src.services.supabase_client.SupabaseClient')
+@patch('src.services.image_service.ImageService')
+def test_canvas_adjust_furniture_positions_updates_dirty_rect(MockImageService, MockSupabaseClient, canvas_widget, mock_furniture_data_for_canvas, mocker):
+    """adjust_furniture_positions가 이동 전/후 영역을 합친 사각형만 다시 그리도록 요청하는지 테스트합니다."""
+    mocker.patch.object(FurnitureItem, 'load_image', return_value=QPixmap(10, 10))
+    canvas_widget.canvas_area.setFixedSize(800, 600)
+
+    item = FurnitureItem(Furniture(**mock_furniture_data_for_canvas), parent=canvas_widget.canvas_area)
+    item.move(100, 100)
+    canvas_widget.furniture_items.append(item)
+    old_geometry = item.geometry()
+
+    spy_update = mocker.spy(canvas_widget.canvas_area, 'update')
+    canvas_widget.adjust_furniture_positions(30, 40)
+
+    spy_update.assert_called_once()
+    dirty_rect = spy_update.call_args[0][0]
+    assert dirty_rect.contains(old_geometry)
+    assert dirty_rect.contains(item.geometry())
+
+def test_canvas_area_is_opaque(canvas_widget):
+    """canvas_area가 스스로 전체 배경을 그리므로 불투명 페인트 속성이 설정되는지 테스트합니다."""
+    assert canvas_widget.canvas_area.testAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+    assert canvas_widget.canvas_area.testAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
 def test_canvas_area_background_color(canvas_widget):
     """Canvas의 canvas_area 배경색이 올바르게 설정되는지 테스트합니다."""
     # Canvas 생성 시 canvas_area의 스타일시트가 설정됨.
@@ -1453,10 +1568,10 @@ def test_canvas_z_order_send_to_back(qtbot, canvas_widget, mock_furniture_data_f
 def test_canvas_z_order_with_undo_redo(MockImageService, MockSupabaseClient, qtbot, canvas_widget, mock_furniture_data_for_canvas, mocker):
     """Z-order 변경과 Undo/Redo 기능 통합 테스트"""
     # Mock 설정
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
     
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     dummy_pixmap = QPixmap(100, 100)
     dummy_pixmap.fill(QColor("blue"))
     mock_image_service_instance.download_and_cache_image.return_value = dummy_pixmap
@@ -1501,10 +1616,10 @@ def test_canvas_z_order_with_undo_redo(MockImageService, MockSupabaseClient, qtb
 def test_canvas_arrow_key_movement_single_item(MockImageService, MockSupabaseClient, qtbot, canvas_widget, mock_furniture_data_for_canvas, mocker):
     """방향키로 단일 가구 아이템 이동 테스트"""
     # Mock 설정
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
     
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     dummy_pixmap = QPixmap(100, 100)
     dummy_pixmap.fill(QColor("blue"))
     mock_image_service_instance.download_and_cache_image.return_value = dummy_pixmap
@@ -1552,10 +1667,10 @@ def test_canvas_arrow_key_movement_single_item(MockImageService, MockSupabaseCli
 def test_canvas_arrow_key_movement_with_ctrl(MockImageService, MockSupabaseClient, qtbot, canvas_widget, mock_furniture_data_for_canvas, mocker):
     """Ctrl + 방향키로 가구 아이템 정밀 이동 테스트"""
     # Mock 설정
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
     
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     dummy_pixmap = QPixmap(100, 100)
     dummy_pixmap.fill(QColor("blue"))
     mock_image_service_instance.download_and_cache_image.return_value = dummy_pixmap
@@ -1593,10 +1708,10 @@ def test_canvas_arrow_key_movement_with_ctrl(MockImageService, MockSupabaseClien
 def test_canvas_arrow_key_movement_multiple_items(MockImageService, MockSupabaseClient, qtbot, canvas_widget, mock_furniture_data_for_canvas, mocker):
     """방향키로 다중 선택된 가구 아이템들 동시 이동 테스트"""
     # Mock 설정
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
     
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     dummy_pixmap = QPixmap(100, 100)
     dummy_pixmap.fill(QColor("blue"))
     mock_image_service_instance.download_and_cache_image.return_value = dummy_pixmap
@@ -1636,10 +1751,10 @@ def test_canvas_arrow_key_movement_multiple_items(MockImageService, MockSupabase
 def test_canvas_arrow_key_movement_boundary_check(MockImageService, MockSupabaseClient, qtbot, canvas_widget, mock_furniture_data_for_canvas, mocker):
     """방향키 이동 시 캔버스 경계 체크 테스트"""
     # Mock 설정
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
     
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     dummy_pixmap = QPixmap(100, 100)
     dummy_pixmap.fill(QColor("blue"))
     mock_image_service_instance.download_and_cache_image.return_value = dummy_pixmap
@@ -1705,10 +1820,10 @@ def test_canvas_arrow_key_movement_no_selection(qtbot, canvas_widget, mock_furni
 def test_canvas_arrow_key_movement_with_cmd(MockImageService, MockSupabaseClient, qtbot, canvas_widget, mock_furniture_data_for_canvas, mocker):
     """Cmd + 방향키로 가구 아이템 정밀 이동 테스트 (macOS)"""
     # Mock 설정
-    mock_supabase_instance = MockSupabaseClient.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
     
-    mock_image_service_instance = MockImageService.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     dummy_pixmap = QPixmap(100, 100)
     dummy_pixmap.fill(QColor("blue"))
     mock_image_service_instance.download_and_cache_image.return_value = dummy_pixmap
@@ -250,4 +250,21 @@ def test_apply_effects_basic_changes_numpy(initialize_image_adjuster, monkeypatc
 
 # 더 많은 테스트 케이스를 ImageAdjuster에 추가할 수 있습니다.
 # 예를 들어, apply_effects_numpy를 직접 더 상세히 테스트하거나,
-# 다양한 크기의 이미지, 다양한 효과 조합 등을 테스트할 수 있습니다. 
\ No newline at end of file
+# 다양한 크기의 이미지, 다양한 효과 조합 등을 테스트할 수 있습니다. 
+def test_qimage_as_ndarray_is_writable_view(initialize_image_adjuster):
+    """qimage_as_ndarray가 QImage 버퍼의 쓰기 가능한 뷰를 (높이, 너비, 4) 형태로 반환하는지 테스트합니다."""
+    image = QImage(7, 3, QImage.Format.Format_ARGB32_Premultiplied)  # 행 패딩이 없는 홀수 너비
+    image.fill(QColor("black"))
+
+    arr = ImageAdjuster.qimage_as_ndarray(image)
+    assert arr.shape == (3, 7, 4)
+
+    arr[1, 2] = (0, 0, 255, 255)  # BGRA 순서로 빨간색
+    assert image.pixelColor(2, 1) == QColor("red")
+    assert image.pixelColor(0, 0) == QColor("black")
+
+def test_qimage_as_ndarray_rejects_non_32bit(initialize_image_adjuster):
+    """32비트가 아닌 QImage는 ValueError를 발생시키는지 테스트합니다."""
+    image = QImage(4, 4, QImage.Format.Format_Grayscale8)
+    with pytest.raises(ValueError):
+        ImageAdjuster.qimage_as_ndarray(image)
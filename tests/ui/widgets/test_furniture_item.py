@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch, ANY
 
 import pytest
 from PyQt6.QtCore import QBuffer, QIODevice, QPoint, Qt, QPointF, QEvent
-from PyQt6.QtGui import QPixmap, QColor, QContextMenuEvent, QMouseEvent, QAction
+from PyQt6.QtGui import QPixmap, QColor, QContextMenuEvent, QMouseEvent, QAction, QTransform
 from PyQt6.QtWidgets import QMenu, QWidget
 
 from src.models.furniture import Furniture  # Furniture 모델 임포트
@@ -64,8 +64,8 @@ def test_furniture_item_creation(initialize_image_adjuster, furniture_obj, mocke
 @patch('src.ui.widgets.furniture_item.ImageService')
 def test_furniture_item_load_image_success(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, mocker, qtbot):
     """load_image 성공 시 pixmap 및 original_pixmap이 올바르게 설정되는지 테스트합니다."""
-    mock_supabase_instance = MockSupabaseClient.return_value
-    mock_image_service_instance = MockImageService.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
@@ -119,8 +119,8 @@ def test_furniture_item_load_image_success(MockImageService, MockSupabaseClient,
 @patch('src.ui.widgets.furniture_item.ImageService')
 def test_furniture_item_load_image_failure(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, mocker, qtbot):
     """load_image 실패 시 (null pixmap 반환) 기본 에러 이미지가 설정되는지 테스트합니다."""
-    mock_supabase_instance = MockSupabaseClient.return_value
-    mock_image_service_instance = MockImageService.return_value
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
+    mock_image_service_instance = MockImageService.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     mock_supabase_instance.get_furniture_image.return_value = b"fake_image_data"
@@ -143,8 +143,8 @@ def test_furniture_item_load_image_failure(MockImageService, MockSupabaseClient,
 @patch('src.ui.widgets.furniture_item.ImageService')
 def test_furniture_item_apply_image_effects(MockImageService, MockSupabaseClient, mock_apply_effects, initialize_image_adjuster, furniture_obj, dummy_qpixmap, dummy_pixmap_red_small, qtbot, mocker):
     """apply_image_effects 호출 시 ImageAdjuster.apply_effects가 호출되고 pixmap이 업데이트되는지 테스트합니다."""
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    mock_supabase_instance = MockSupabaseClient.return_value # 이 라인 추가
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value # 이 라인 추가
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
     
     item = FurnitureItem(furniture_obj)
@@ -189,8 +189,8 @@ def test_furniture_item_apply_image_effects(MockImageService, MockSupabaseClient
 @patch('src.ui.widgets.furniture_item.ImageService')
 def test_furniture_item_reset_image_adjustments(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """reset_image_adjustments 호출 시 pixmap이 original_pixmap으로 복원되고 조정값이 초기화되는지 테스트합니다."""
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    mock_supabase_instance = MockSupabaseClient.return_value # 이 라인 추가
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value # 이 라인 추가
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     item = FurnitureItem(furniture_obj)
@@ -241,9 +241,9 @@ def test_furniture_item_reset_image_adjustments(MockImageService, MockSupabaseCl
 def test_furniture_item_selection_via_canvas(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """Canvas를 통해 FurnitureItem 클릭 시 선택 상태가 올바르게 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value # 이 라인 추가
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value # 이 라인 추가
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     canvas_widget = Canvas()
@@ -292,9 +292,9 @@ def test_furniture_item_selection_via_canvas(MockImageService, MockSupabaseClien
 def test_furniture_item_drag_move(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """FurnitureItem을 마우스로 드래그하여 이동시키는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value # 이 라인 추가
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value # 이 라인 추가
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     canvas_widget = Canvas()
@@ -329,9 +329,9 @@ def test_furniture_item_drag_move(MockImageService, MockSupabaseClient, initiali
 def test_furniture_item_resize_drag_handle(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """리사이즈 핸들 드래그 시 FurnitureItem의 크기가 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value # 이 라인 추가
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value # 이 라인 추가
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     canvas_widget = Canvas()
@@ -381,9 +381,9 @@ def test_furniture_item_resize_drag_handle(MockImageService, MockSupabaseClient,
 def test_furniture_item_resize_aspect_ratio_locked(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """Shift 누르고 리사이즈 핸들 드래그 시 종횡비가 유지되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap # 100x100, 비율 1.0
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value # 이 라인 추가
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap # 100x100, 비율 1.0
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value # 이 라인 추가
     mock_supabase_instance._image_cache = mocker.MagicMock() # 경고 해결
 
     canvas_widget = Canvas()
@@ -443,9 +443,9 @@ def test_furniture_item_resize_aspect_ratio_locked(MockImageService, MockSupabas
 def test_furniture_item_resize_top_left_handle(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """좌상단 리사이즈 핸들 드래그 시 크기와 위치가 모두 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -500,9 +500,9 @@ def test_furniture_item_resize_top_left_handle(MockImageService, MockSupabaseCli
 def test_furniture_item_context_menu_actions(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """FurnitureItem 컨텍스트 메뉴 액션 (삭제) 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -562,9 +562,9 @@ def test_furniture_item_context_menu_actions(MockImageService, MockSupabaseClien
 def test_furniture_item_context_menu_flip_action(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """FurnitureItem 컨텍스트 메뉴 '좌우 반전' 액션 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -644,9 +644,9 @@ def test_furniture_item_context_menu_flip_action(MockImageService, MockSupabaseC
 def test_furniture_item_context_menu_adjust_action(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """FurnitureItem 컨텍스트 메뉴 '이미지 조정' 액션 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -1108,9 +1108,9 @@ def test_furniture_item_no_movement_with_ctrl_key(qtbot, mocker):
 def test_furniture_item_resize_top_handle(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """상단 리사이즈 핸들 드래그 시 높이와 Y 위치가 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -1155,9 +1155,9 @@ def test_furniture_item_resize_top_handle(MockImageService, MockSupabaseClient,
 def test_furniture_item_resize_bottom_handle(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """하단 리사이즈 핸들 드래그 시 높이만 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -1200,9 +1200,9 @@ def test_furniture_item_resize_bottom_handle(MockImageService, MockSupabaseClien
 def test_furniture_item_resize_left_handle(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """좌측 리사이즈 핸들 드래그 시 너비와 X 위치가 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -1247,9 +1247,9 @@ def test_furniture_item_resize_left_handle(MockImageService, MockSupabaseClient,
 def test_furniture_item_resize_right_handle(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """우측 리사이즈 핸들 드래그 시 너비만 변경되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -1292,9 +1292,9 @@ def test_furniture_item_resize_right_handle(MockImageService, MockSupabaseClient
 def test_furniture_item_resize_minimum_size_enforcement(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, qtbot, mocker):
     """리사이즈 시 최소 크기(100x100) 제한이 적용되는지 테스트합니다."""
     mock_load_image = mocker.patch.object(FurnitureItem, 'load_image')
-    MockImageService.return_value.download_and_cache_image.return_value = dummy_qpixmap
-    MockSupabaseClient.return_value.get_furniture_image.return_value = b"fake_image_data"
-    mock_supabase_instance = MockSupabaseClient.return_value
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    MockSupabaseClient.get_instance.return_value.get_furniture_image.return_value = b"fake_image_data"
+    mock_supabase_instance = MockSupabaseClient.get_instance.return_value
     mock_supabase_instance._image_cache = mocker.MagicMock()
 
     canvas_widget = Canvas()
@@ -1592,3 +1592,23 @@ def test_furniture_item_number_label_widget_drag_functionality(furniture_item, q
     except RuntimeError:
         # Qt 위젯이 이미 삭제된 경우 테스트 통과로 처리
         pytest.skip("Qt widget already deleted - test environment issue")
+
+@patch('src.ui.widgets.furniture_item.SupabaseClient')
+@patch('src.ui.widgets.furniture_item.ImageService')
+def test_get_scaled_pixmap_reuses_cache_until_size_changes(MockImageService, MockSupabaseClient, initialize_image_adjuster, furniture_obj, dummy_qpixmap, mocker, qtbot):
+    """get_scaled_pixmap이 크기/이미지가 같으면 캐시를 재사용하고, 바뀌면 다시 스케일하는지 테스트합니다."""
+    MockImageService.get_instance.return_value.download_and_cache_image.return_value = dummy_qpixmap
+    item = FurnitureItem(furniture_obj)
+    qtbot.addWidget(item)
+
+    first = item.get_scaled_pixmap()
+    assert first.size() == item.size()
+    assert item.get_scaled_pixmap().cacheKey() == first.cacheKey()
+
+    item.setFixedSize(150, 120)
+    resized = item.get_scaled_pixmap()
+    assert resized.size() == item.size()
+    assert resized.cacheKey() != first.cacheKey()
+
+    item.pixmap = item.pixmap.transformed(QTransform().scale(-1, 1))  # 이미지가 바뀌면 캐시 무효화
+    assert item.get_scaled_pixmap().cacheKey() != resized.cacheKey()